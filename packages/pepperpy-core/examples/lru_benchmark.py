@@ -0,0 +1,95 @@
+"""LRU cache benchmark example."""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Protocol
+
+from pepperpy_core.cache.lru import ConcurrentLRUCache, LRUCache
+
+CAPACITY = 10_000
+KEYS = 20_000
+OPERATIONS = 200_000
+THREADS = 8
+
+
+class CacheProtocol(Protocol):
+    """Protocol shared by the benchmarked caches."""
+
+    def get(self, key: int) -> Any:
+        """Get value."""
+        ...
+
+    def put(self, key: int, value: Any) -> None:
+        """Put value."""
+        ...
+
+
+class LockedLRUCache:
+    """Current LRU cache guarded by a single global lock."""
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize locked cache."""
+        self._cache: LRUCache[int, int] = LRUCache(capacity)
+        self._lock = threading.Lock()
+
+    def get(self, key: int) -> int | None:
+        """Get value."""
+        with self._lock:
+            return self._cache.get(key)
+
+    def put(self, key: int, value: int) -> None:
+        """Put value."""
+        with self._lock:
+            self._cache.put(key, value)
+
+
+def _keys(operations: int, seed: int) -> list[int]:
+    """Draw the keys one worker operates on."""
+    rng = random.Random(seed)
+    return [rng.randrange(KEYS) for _ in range(operations)]
+
+
+def _worker(cache: CacheProtocol, keys: list[int]) -> None:
+    """Run a read-heavy mix of cache operations."""
+    for index, key in enumerate(keys):
+        if index % 10 == 0:
+            cache.put(key, key)
+        else:
+            cache.get(key)
+
+
+def run(name: str, cache: CacheProtocol, threads: int) -> None:
+    """Benchmark a cache with the given number of threads."""
+    per_thread = OPERATIONS // threads
+    # Keys are drawn up front so only cache operations are timed
+    keys = [_keys(per_thread, seed) for seed in range(threads)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [executor.submit(_worker, cache, part) for part in keys]
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<32} {threads} thread(s): {OPERATIONS / elapsed:>12,.0f} ops/s")
+
+
+def main() -> None:
+    """Run example."""
+    run("LRUCache (unsynchronized)", LRUCache(CAPACITY), 1)
+    run("LRUCache + global lock", LockedLRUCache(CAPACITY), 1)
+    run("LRUCache + global lock", LockedLRUCache(CAPACITY), THREADS)
+    run("ConcurrentLRUCache", ConcurrentLRUCache(CAPACITY), 1)
+    run("ConcurrentLRUCache", ConcurrentLRUCache(CAPACITY), THREADS)
+
+    cache: ConcurrentLRUCache[int, int] = ConcurrentLRUCache(CAPACITY)
+    start = time.perf_counter()
+    for offset in range(0, KEYS, 100):
+        cache.put_many((key, key) for key in range(offset, offset + 100))
+        cache.get_many(range(offset, offset + 100))
+    elapsed = time.perf_counter() - start
+    print(f"{'ConcurrentLRUCache bulk':<32} 1 thread(s): {2 * KEYS / elapsed:>12,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
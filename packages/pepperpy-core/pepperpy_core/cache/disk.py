@@ -0,0 +1,468 @@
+"""Disk cache implementation."""
+
+import hashlib
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from .base import BaseCache
+from .config import CacheConfig
+from .exceptions import CacheError
+from .serializers import Serializer, get_serializer
+
+# Index header: magic, generation, slots, filled, live, data_end, garbage, head
+_HEADER = struct.Struct("<8sQQQQQQQ")
+_MAGIC = b"PPYIDX01"
+# Index slot: key hash, record offset + 1 (0 marks an empty slot)
+_SLOT = struct.Struct("<QQ")
+_EMPTY = 0
+_TOMBSTONE = 0xFFFF_FFFF_FFFF_FFFF
+# Segment record header: key length, value length, expiry (0 never expires)
+_RECORD = struct.Struct("<IId")
+
+_MIN_SLOTS = 1024
+_MAX_LOAD = 0.7
+_MIN_DATA_BYTES = 1 << 20
+
+
+def _hash(key: bytes) -> int:
+    """Stable 64-bit key hash, identical across processes."""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+@dataclass
+class DiskCacheConfig(CacheConfig):
+    """Disk cache configuration."""
+
+    # Required fields (herdado de CacheConfig)
+    name: str = "disk-cache"
+
+    # Optional fields
+    path: str = ".cache/pepperpy"
+    ttl: int = 0  # Time to live in seconds, 0 disables expiry
+    max_size: int = 1_000_000  # Maximum number of entries
+    serializer: str = "pickle"  # One of json, pickle or msgpack
+    compact_ratio: float = 0.5  # Compact once this share of the segment is garbage
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def validate(self) -> None:
+        """Validate configuration."""
+        if self.max_size < 1:
+            raise ValueError("max_size must be greater than 0")
+        if not 0 < self.compact_ratio < 1:
+            raise ValueError("compact_ratio must be between 0 and 1")
+
+
+class DiskCache(BaseCache[DiskCacheConfig]):
+    """Persistent cache backed by memory-mapped files.
+
+    Values are appended to a memory-mapped segment file and located through
+    an open-addressing hash index that is itself a memory-mapped file, so a
+    restarted process reopens the cache without scanning or loading it.
+    Overwritten, deleted and expired records become garbage that is
+    reclaimed by compaction, which rewrites live records into a new segment
+    generation and atomically swaps the index. When ``max_size`` is reached
+    the oldest written entries are evicted first.
+    """
+
+    def __init__(self, config: DiskCacheConfig | None = None) -> None:
+        """Initialize disk cache.
+
+        Args:
+            config: Disk cache configuration
+        """
+        super().__init__(config or DiskCacheConfig())
+        self._serializer: Serializer = get_serializer(self.config.serializer)
+        self._path = Path(self.config.path)
+        self._data_file: IO[bytes] | None = None
+        self._index_file: IO[bytes] | None = None
+        self._data: mmap.mmap | None = None
+        self._index: mmap.mmap | None = None
+        self._generation = 0
+        self._slots = 0
+        self._filled = 0
+        self._live = 0
+        self._data_end = 0
+        self._garbage = 0
+        self._head = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._compactions = 0
+
+    @property
+    def _index_path(self) -> Path:
+        return self._path / "index.idx"
+
+    def _data_path(self, generation: int) -> Path:
+        return self._path / f"data.{generation}.seg"
+
+    async def _setup(self) -> None:
+        """Open or create the cache files."""
+        self.config.validate()
+        self._path.mkdir(parents=True, exist_ok=True)
+        if self._index_path.exists():
+            self._load()
+        else:
+            self._create()
+        for stale in self._path.glob("data.*.seg"):
+            if stale != self._data_path(self._generation):
+                stale.unlink()
+
+    async def _teardown(self) -> None:
+        """Flush and close the cache files."""
+        self._close()
+
+    def _create(self) -> None:
+        """Create an empty cache generation."""
+        self._generation = 0
+        self._filled = self._live = self._data_end = self._garbage = self._head = 0
+        with open(self._data_path(0), "wb") as file:
+            file.truncate(_MIN_DATA_BYTES)
+        self._write_index(self._index_path, [], _MIN_SLOTS)
+        self._open()
+
+    def _load(self) -> None:
+        """Load header fields from an existing index."""
+        with open(self._index_path, "rb") as file:
+            header = file.read(_HEADER.size)
+        if len(header) != _HEADER.size or header[:8] != _MAGIC:
+            raise CacheError(f"Invalid cache index: {self._index_path}")
+        (
+            _,
+            self._generation,
+            self._slots,
+            self._filled,
+            self._live,
+            self._data_end,
+            self._garbage,
+            self._head,
+        ) = _HEADER.unpack(header)
+        if not self._data_path(self._generation).exists():
+            raise CacheError(f"Missing cache segment for index: {self._index_path}")
+        self._open()
+
+    def _open(self) -> None:
+        """Memory-map the current data segment and index."""
+        self._data_file = open(self._data_path(self._generation), "r+b")
+        self._index_file = open(self._index_path, "r+b")
+        self._data = mmap.mmap(self._data_file.fileno(), 0)
+        self._index = mmap.mmap(self._index_file.fileno(), 0)
+        self._slots = (len(self._index) - _HEADER.size) // _SLOT.size
+
+    def _close(self) -> None:
+        """Flush and unmap the files."""
+        for mapped in (self._data, self._index):
+            if mapped is not None:
+                mapped.flush()
+                mapped.close()
+        for file in (self._data_file, self._index_file):
+            if file is not None:
+                file.close()
+        self._data = self._index = None
+        self._data_file = self._index_file = None
+
+    def _write_header(self) -> None:
+        assert self._index is not None
+        _HEADER.pack_into(
+            self._index,
+            0,
+            _MAGIC,
+            self._generation,
+            self._slots,
+            self._filled,
+            self._live,
+            self._data_end,
+            self._garbage,
+            self._head,
+        )
+
+    def _write_index(self, path: Path, entries: list[tuple[int, int]], slots: int) -> None:
+        """Write a fresh index holding ``entries`` of (hash, offset)."""
+        table = bytearray(_HEADER.size + slots * _SLOT.size)
+        mask = slots - 1
+        for key_hash, offset in entries:
+            slot = key_hash & mask
+            while _SLOT.unpack_from(table, _HEADER.size + slot * _SLOT.size)[1]:
+                slot = (slot + 1) & mask
+            _SLOT.pack_into(table, _HEADER.size + slot * _SLOT.size, key_hash, offset + 1)
+        self._slots = slots
+        self._filled = len(entries)
+        _HEADER.pack_into(
+            table,
+            0,
+            _MAGIC,
+            self._generation,
+            slots,
+            len(entries),
+            self._live,
+            self._data_end,
+            self._garbage,
+            self._head,
+        )
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as file:
+            file.write(table)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, path)
+
+    def _record(self, offset: int) -> tuple[bytes, int, int, float]:
+        """Read key, value start, value length and expiry of a record."""
+        assert self._data is not None
+        key_len, value_len, expires_at = _RECORD.unpack_from(self._data, offset)
+        start = offset + _RECORD.size
+        return self._data[start : start + key_len], start + key_len, value_len, expires_at
+
+    def _record_size(self, offset: int) -> int:
+        assert self._data is not None
+        key_len, value_len, _ = _RECORD.unpack_from(self._data, offset)
+        return _RECORD.size + key_len + value_len
+
+    def _probe(self, key: bytes, key_hash: int) -> tuple[int, int | None]:
+        """Find the slot of key, or the slot where it should be inserted.
+
+        Returns:
+            Slot position and record offset, offset is None if key is absent
+        """
+        assert self._index is not None
+        mask = self._slots - 1
+        slot = key_hash & mask
+        free = -1
+        while True:
+            stored_hash, stored = _SLOT.unpack_from(self._index, _HEADER.size + slot * _SLOT.size)
+            if stored == _EMPTY:
+                return (slot if free < 0 else free), None
+            if stored == _TOMBSTONE:
+                if free < 0:
+                    free = slot
+            elif stored_hash == key_hash and self._record(stored - 1)[0] == key:
+                return slot, stored - 1
+            slot = (slot + 1) & mask
+
+    def _set_slot(self, slot: int, key_hash: int, stored: int) -> None:
+        assert self._index is not None
+        _SLOT.pack_into(self._index, _HEADER.size + slot * _SLOT.size, key_hash, stored)
+
+    def _remove(self, slot: int, offset: int) -> None:
+        """Drop an indexed record, leaving its bytes as garbage."""
+        self._set_slot(slot, 0, _TOMBSTONE)
+        self._live -= 1
+        self._garbage += self._record_size(offset)
+
+    def _append(self, key: bytes, value: bytes, expires_at: float) -> int:
+        """Append a record to the segment and return its offset."""
+        assert self._data is not None and self._data_file is not None
+        offset = self._data_end
+        end = offset + _RECORD.size + len(key) + len(value)
+        capacity = len(self._data)
+        if end > capacity:
+            self._data.close()
+            self._data_file.truncate(max(end, 2 * capacity))
+            self._data = mmap.mmap(self._data_file.fileno(), 0)
+        _RECORD.pack_into(self._data, offset, len(key), len(value), expires_at)
+        start = offset + _RECORD.size
+        self._data[start : start + len(key)] = key
+        self._data[start + len(key) : end] = value
+        self._data_end = end
+        return offset
+
+    def _evict_oldest(self) -> None:
+        """Evict the oldest live record by walking the segment from its head."""
+        while self._head < self._data_end:
+            offset = self._head
+            key = self._record(offset)[0]
+            self._head += self._record_size(offset)
+            slot, found = self._probe(key, _hash(key))
+            if found == offset:
+                self._remove(slot, offset)
+                self._evictions += 1
+                return
+
+    def _live_entries(self) -> list[tuple[int, int]]:
+        """List (offset, hash) of indexed records in segment order."""
+        assert self._index is not None
+        entries = []
+        for slot in range(self._slots):
+            key_hash, stored = _SLOT.unpack_from(self._index, _HEADER.size + slot * _SLOT.size)
+            if stored not in (_EMPTY, _TOMBSTONE):
+                entries.append((stored - 1, key_hash))
+        entries.sort()
+        return entries
+
+    def _grow_index(self) -> None:
+        """Rehash the index into twice as many slots."""
+        entries = [(key_hash, offset) for offset, key_hash in self._live_entries()]
+        self._close()
+        self._write_index(self._index_path, entries, self._slots * 2)
+        self._open()
+
+    def _compact(self) -> None:
+        """Rewrite live, unexpired records into a new segment generation."""
+        assert self._data is not None
+        now = time.time()
+        generation = self._generation + 1
+        entries: list[tuple[int, int]] = []
+        end = 0
+        with open(self._data_path(generation), "wb") as file:
+            for offset, key_hash in self._live_entries():
+                size = self._record_size(offset)
+                expires_at = _RECORD.unpack_from(self._data, offset)[2]
+                if expires_at and expires_at <= now:
+                    continue
+                file.write(self._data[offset : offset + size])
+                entries.append((key_hash, end))
+                end += size
+            file.truncate(max(_MIN_DATA_BYTES, end))
+            file.flush()
+            os.fsync(file.fileno())
+
+        old_path = self._data_path(self._generation)
+        self._close()
+        self._generation = generation
+        self._live = len(entries)
+        self._data_end = end
+        self._garbage = 0
+        self._head = 0
+        slots = _MIN_SLOTS
+        while len(entries) > slots * _MAX_LOAD / 2:
+            slots *= 2
+        # Replacing the index commits the new generation
+        self._write_index(self._index_path, entries, slots)
+        old_path.unlink()
+        self._open()
+        self._compactions += 1
+
+    def _ensure_open(self) -> None:
+        if not self.is_initialized:
+            raise RuntimeError("Cache not initialized")
+
+    async def get(self, key: str) -> Any:
+        """Get value from cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        self._ensure_open()
+        encoded = key.encode()
+        slot, offset = self._probe(encoded, _hash(encoded))
+        if offset is None:
+            self._misses += 1
+            return None
+        _, start, length, expires_at = self._record(offset)
+        if expires_at and expires_at <= time.time():
+            self._remove(slot, offset)
+            self._write_header()
+            self._misses += 1
+            return None
+        self._hits += 1
+        assert self._data is not None
+        return self._serializer.loads(self._data[start : start + length])
+
+    async def set(self, key: str, value: Any, ttl: int | float | None = None) -> None:
+        """Set value in cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Optional time to live in seconds, defaults to the configured TTL
+        """
+        self._ensure_open()
+        encoded = key.encode()
+        key_hash = _hash(encoded)
+        ttl = self.config.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl and ttl > 0 else 0.0
+        offset = self._append(encoded, self._serializer.dumps(value), expires_at)
+
+        slot, previous = self._probe(encoded, key_hash)
+        if previous is not None:
+            self._garbage += self._record_size(previous)
+        else:
+            assert self._index is not None
+            stored = _SLOT.unpack_from(self._index, _HEADER.size + slot * _SLOT.size)[1]
+            if stored == _EMPTY:
+                self._filled += 1
+            self._live += 1
+        self._set_slot(slot, key_hash, offset + 1)
+
+        if self._live > self.config.max_size:
+            self._evict_oldest()
+        self._write_header()
+        if self._filled > self._slots * _MAX_LOAD:
+            self._grow_index()
+        if (
+            self._data_end > _MIN_DATA_BYTES
+            and self._garbage > self._data_end * self.config.compact_ratio
+        ):
+            self._compact()
+
+    async def delete(self, key: str) -> None:
+        """Delete value from cache.
+
+        Args:
+            key: Cache key
+        """
+        self._ensure_open()
+        encoded = key.encode()
+        slot, offset = self._probe(encoded, _hash(encoded))
+        if offset is not None:
+            self._remove(slot, offset)
+            self._write_header()
+
+    async def clear(self) -> None:
+        """Clear all values from cache."""
+        self._ensure_open()
+        old_path = self._data_path(self._generation)
+        self._close()
+        generation = self._generation + 1
+        with open(self._data_path(generation), "wb") as file:
+            file.truncate(_MIN_DATA_BYTES)
+        self._generation = generation
+        self._live = self._data_end = self._garbage = self._head = 0
+        self._write_index(self._index_path, [], _MIN_SLOTS)
+        old_path.unlink()
+        self._open()
+
+    async def compact(self) -> None:
+        """Reclaim space used by overwritten, deleted and expired records."""
+        self._ensure_open()
+        self._compact()
+
+    async def flush(self) -> None:
+        """Flush memory-mapped changes to disk."""
+        self._ensure_open()
+        assert self._data is not None and self._index is not None
+        self._data.flush()
+        self._index.flush()
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Cache statistics
+        """
+        lookups = self._hits + self._misses
+        return {
+            "name": self.config.name,
+            "path": str(self._path),
+            "size": self._live,
+            "max_size": self.config.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "compactions": self._compactions,
+            "data_bytes": self._data_end,
+            "garbage_bytes": self._garbage,
+            "index_slots": self._slots,
+        }
+
+
+__all__ = ["DiskCache", "DiskCacheConfig"]
@@ -1,55 +1,517 @@
 """Distributed cache implementation."""
 
+import asyncio
+import contextlib
 import importlib.util
+import json
+import math
+import uuid
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
+from .base import BaseCache
+from .config import CacheConfig
+from .exceptions import CacheConnectionError
+from .serializers import Serializer, get_serializer
+from .strategies import LRUStrategy
+
 # Verificar disponibilidade do Redis
 _redis_spec = importlib.util.find_spec("redis")
 has_redis = bool(_redis_spec)
 
+_fakeredis_spec = importlib.util.find_spec("fakeredis")
+has_fakeredis = bool(_fakeredis_spec)
+
 
 @runtime_checkable
 class CacheBackend(Protocol):
-    """Cache backend protocol."""
+    """Cache backend protocol.
+
+    Subset of the ``redis.asyncio.Redis`` client used by the cache.
+    """
+
+    async def ping(self) -> Any:
+        ...
+
+    async def aclose(self) -> None:
+        ...
+
+    async def get(self, name: str) -> Any:
+        ...
+
+    async def set(self, name: str, value: Any, ex: int | None = None) -> Any:
+        ...
+
+    async def mget(self, keys: list[str]) -> list[Any]:
+        ...
+
+    async def delete(self, *names: str) -> Any:
+        ...
+
+    async def publish(self, channel: str, message: Any) -> Any:
+        ...
+
+    def pipeline(self, transaction: bool = True) -> Any:
+        ...
 
-    def get(self, key: str) -> Any:
+    def pubsub(self, **kwargs: Any) -> Any:
         ...
 
-    def set(self, key: str, value: Any) -> None:
+    def scan_iter(self, match: str | None = None, count: int | None = None) -> Any:
         ...
 
 
-class DistributedCache:
-    """Distributed cache implementation."""
+@dataclass
+class DistributedCacheConfig(CacheConfig):
+    """Distributed cache configuration."""
+
+    # Required fields (herdado de CacheConfig)
+    name: str = "distributed-cache"
+
+    # Optional fields
+    url: str = "redis://localhost:6379/0"
+    max_connections: int = 50
+    namespace: str = "pepperpy"
+    serializer: str = "pickle"  # One of json, pickle or msgpack
+    batch_size: int = 500  # Keys per MGET/pipeline round trip
+    near_cache_size: int = 0  # In-process near-cache entries, 0 disables it
+    near_cache_ttl: float | None = 60.0
+    invalidation_channel: str = "pepperpy:cache:invalidate"
+    resubscribe_delay: float = 1.0  # Seconds between attempts after losing pub/sub
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def validate(self) -> None:
+        """Validate configuration."""
+        if self.max_connections < 1:
+            raise ValueError("max_connections must be greater than 0")
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+        if self.near_cache_size < 0:
+            raise ValueError("near_cache_size must be non-negative")
+        if self.resubscribe_delay <= 0:
+            raise ValueError("resubscribe_delay must be greater than 0")
+
+
+def create_local_client(server: Any | None = None) -> CacheBackend:
+    """Create an in-process Redis stand-in backed by fakeredis.
 
-    def __init__(self) -> None:
-        """Initialize distributed cache."""
-        if not has_redis:
+    Clients created with the same ``server`` share data and pub/sub
+    channels, which makes them suitable to emulate several workers.
+
+    Args:
+        server: Optional ``fakeredis.FakeServer`` to share between clients
+
+    Returns:
+        Async fakeredis client
+
+    Raises:
+        ImportError: If fakeredis is not installed
+    """
+    if not has_fakeredis:
+        raise ImportError(
+            "fakeredis is not installed. Please install it with `pip install fakeredis`"
+        )
+    import fakeredis  # type: ignore
+
+    return fakeredis.FakeAsyncRedis(server=server or fakeredis.FakeServer())
+
+
+class DistributedCache(BaseCache[DistributedCacheConfig]):
+    """Distributed cache implementation.
+
+    Values are serialized and stored in a Redis-compatible server through a
+    pooled async client. Bulk operations are batched into MGET and
+    pipelined SET round trips. An optional in-process near-cache serves hot
+    keys locally and is invalidated on every writer through pub/sub. Its
+    entries expire no later than the keys do on the server.
+    """
+
+    def __init__(
+        self,
+        config: DistributedCacheConfig | None = None,
+        client: CacheBackend | None = None,
+    ) -> None:
+        """Initialize distributed cache.
+
+        Args:
+            config: Distributed cache configuration
+            client: Optional pre-built async client, e.g. from
+                :func:`create_local_client`. When omitted a pooled
+                ``redis.asyncio`` client is created from ``config.url``.
+
+        Raises:
+            ImportError: If no client is given and redis is not installed
+        """
+        if client is None and not has_redis:
             raise ImportError(
                 "Redis is not installed. Please install it with `pip install redis`"
             )
-        self._client: CacheBackend | None = None
+        super().__init__(config or DistributedCacheConfig())
+        self._client: CacheBackend | None = client
+        self._owns_client = client is None
+        self._serializer: Serializer = get_serializer(self.config.serializer)
+        self._near: LRUStrategy | None = None
+        self._pubsub: Any = None
+        self._listener: asyncio.Task[None] | None = None
+        self._origin = uuid.uuid4().hex
+        self._invalidations = 0
+        self._malformed = 0
+        self._resubscriptions = 0
+        # [reads in flight, generation] of keys being read from the server
+        self._fetching: dict[str, list[int]] = {}
 
-    def get(self, key: str) -> Any:
+    async def _setup(self) -> None:
+        """Setup distributed cache."""
+        self.config.validate()
+        if self._client is None:
+            import redis.asyncio as aioredis  # type: ignore
+
+            pool = aioredis.ConnectionPool.from_url(
+                self.config.url, max_connections=self.config.max_connections
+            )
+            self._client = aioredis.Redis(connection_pool=pool)
+        try:
+            await self._client.ping()
+        except Exception as e:
+            raise CacheConnectionError(
+                f"Failed to connect to cache server: {e}", cause=e
+            )
+
+        if self.config.near_cache_size > 0:
+            self._near = LRUStrategy(
+                max_size=self.config.near_cache_size, ttl=self.config.near_cache_ttl
+            )
+            await self._subscribe()
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _teardown(self) -> None:
+        """Teardown distributed cache."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._pubsub is not None:
+            with contextlib.suppress(Exception):
+                await self._pubsub.unsubscribe(self.config.invalidation_channel)
+            await self._pubsub.aclose()
+            self._pubsub = None
+        self._near = None
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> CacheBackend:
+        """Get the underlying client.
+
+        Raises:
+            RuntimeError: If cache is not initialized
+        """
+        if not self.is_initialized or self._client is None:
+            raise RuntimeError("Cache not initialized")
+        return self._client
+
+    def _key(self, key: str) -> str:
+        return f"{self.config.namespace}:{key}"
+
+    def _ttl(self, ttl: int | float | None) -> int | None:
+        ttl = self.config.ttl if ttl is None else ttl
+        return max(1, math.ceil(ttl)) if ttl else None
+
+    def _expiry(self, ttl: int | float | None) -> float | None:
+        """Get the seconds a value set with ``ttl`` lives on the server."""
+        ttl = self.config.ttl if ttl is None else ttl
+        return ttl or None
+
+    async def _subscribe(self) -> None:
+        """Open a pub/sub connection on the invalidation channel."""
+        assert self._client is not None
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self.config.invalidation_channel)
+        except BaseException:
+            await pubsub.aclose()
+            raise
+        self._pubsub = pubsub
+
+    async def _listen(self) -> None:
+        """Drop near-cache entries written by other instances.
+
+        Invalidations published while the pub/sub connection is down are
+        lost, so when it drops the near-cache is cleared and the channel is
+        subscribed again until that succeeds.
+        """
+        while True:
+            with contextlib.suppress(Exception):
+                async for message in self._pubsub.listen():
+                    await self._handle(message)
+            if self._near is not None:
+                await self._near.clear()
+            with contextlib.suppress(Exception):
+                await self._pubsub.aclose()
+            while True:
+                await asyncio.sleep(self.config.resubscribe_delay)
+                try:
+                    await self._subscribe()
+                except Exception:
+                    continue
+                break
+            self._resubscriptions += 1
+            # Entries cached while disconnected may have missed invalidations
+            if self._near is not None:
+                await self._near.clear()
+
+    async def _handle(self, message: dict[str, Any]) -> None:
+        """Apply one invalidation message, skipping malformed ones."""
+        if message.get("type") != "message" or self._near is None:
+            return
+        try:
+            payload = json.loads(message["data"])
+            if payload.get("origin") == self._origin:
+                return
+            keys = payload.get("keys")
+            if keys is not None:
+                keys = [str(key) for key in keys]
+        except (ValueError, TypeError, AttributeError):
+            self._malformed += 1
+            return
+        self._invalidations += 1
+        self._bump(keys)
+        if keys is None:
+            await self._near.clear()
+            return
+        for key in keys:
+            await self._near.delete(key)
+
+    async def _invalidate(self, keys: list[str] | None) -> None:
+        """Notify other instances that keys changed, ``None`` means all."""
+        if self._near is None:
+            return
+        self._bump(keys)
+        if keys is None:
+            await self._near.clear()
+        else:
+            for key in keys:
+                await self._near.delete(key)
+        message = json.dumps({"origin": self._origin, "keys": keys})
+        await self.client.publish(self.config.invalidation_channel, message)
+
+    def _batches(self, keys: list[str]) -> Iterable[list[str]]:
+        size = self.config.batch_size
+        for start in range(0, len(keys), size):
+            yield keys[start : start + size]
+
+    def _near_ttl(self, ttl: float | None) -> float | None:
+        """Get the near-cache TTL of a key expiring after ``ttl`` seconds."""
+        limit = self.config.near_cache_ttl
+        if ttl is None:
+            return limit
+        return ttl if limit is None else min(ttl, limit)
+
+    def _begin(self, key: str) -> tuple[list[int], int]:
+        """Start a server read of a key, returning its slot and generation."""
+        slot = self._fetching.get(key)
+        if slot is None:
+            slot = self._fetching[key] = [0, 0]
+        slot[0] += 1
+        return slot, slot[1]
+
+    def _end(self, key: str, slot: list[int]) -> None:
+        """Finish a server read of a key."""
+        slot[0] -= 1
+        if not slot[0]:
+            del self._fetching[key]
+
+    def _bump(self, keys: list[str] | None) -> None:
+        """Mark reads in flight of invalidated keys as outdated."""
+        if keys is None:
+            slots: Iterable[list[int]] = self._fetching.values()
+        else:
+            slots = [self._fetching[key] for key in keys if key in self._fetching]
+        for slot in slots:
+            slot[1] += 1
+
+    async def _remember(
+        self, key: str, value: Any, pttl: int, slot: list[int], generation: int
+    ) -> None:
+        """Keep a value read from the server in the near-cache.
+
+        The value is dropped when the key was invalidated while it was
+        read, and expires no later than the key does on the server.
+        """
+        if self._near is None or slot[1] != generation:
+            return
+        await self._near.set(key, value, ttl=self._near_ttl(pttl / 1000 if pttl > 0 else None))
+
+    async def get(self, key: str) -> Any:
         """Get value from cache.
 
         Args:
             key: Cache key
 
         Returns:
-            Cached value
+            Cached value if found, None otherwise
         """
-        if self._client is None:
-            raise RuntimeError("Cache not initialized")
-        return self._client.get(key)
+        if self._near is None:
+            raw = await self.client.get(self._key(key))
+            return None if raw is None else self._serializer.loads(raw)
+
+        value = await self._near.get(key)
+        if value is not None:
+            return value
+        slot, generation = self._begin(key)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.get(self._key(key))
+            pipe.pttl(self._key(key))
+            raw, pttl = await pipe.execute()
+            if raw is None:
+                return None
+            value = self._serializer.loads(raw)
+            await self._remember(key, value, pttl, slot, generation)
+            return value
+        finally:
+            self._end(key, slot)
 
-    def set(self, key: str, value: Any) -> None:
+    async def set(self, key: str, value: Any, ttl: int | float | None = None) -> None:
         """Set value in cache.
 
         Args:
             key: Cache key
             value: Value to cache
+            ttl: Optional time to live in seconds, defaults to the configured TTL
         """
-        if self._client is None:
-            raise RuntimeError("Cache not initialized")
-        self._client.set(key, value)
+        await self.client.set(
+            self._key(key), self._serializer.dumps(value), ex=self._ttl(ttl)
+        )
+        await self._invalidate([key])
+        if self._near is not None:
+            await self._near.set(key, value, ttl=self._near_ttl(self._expiry(ttl)))
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get several values using batched MGET round trips.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values for the keys that exist
+        """
+        found: dict[str, Any] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            value = await self._near.get(key) if self._near is not None else None
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+
+        for batch in self._batches(missing):
+            names = [self._key(key) for key in batch]
+            if self._near is None:
+                raws = await self.client.mget(names)
+                for key, raw in zip(batch, raws, strict=True):
+                    if raw is not None:
+                        found[key] = self._serializer.loads(raw)
+                continue
+            reads = [self._begin(key) for key in batch]
+            try:
+                pipe = self.client.pipeline(transaction=False)
+                pipe.mget(names)
+                for name in names:
+                    pipe.pttl(name)
+                raws, *pttls = await pipe.execute()
+                for key, raw, pttl, (slot, generation) in zip(
+                    batch, raws, pttls, reads, strict=True
+                ):
+                    if raw is None:
+                        continue
+                    found[key] = self._serializer.loads(raw)
+                    await self._remember(key, found[key], pttl, slot, generation)
+            finally:
+                for key, (slot, _) in zip(batch, reads, strict=True):
+                    self._end(key, slot)
+        return found
+
+    async def set_many(
+        self, items: Mapping[str, Any], ttl: int | float | None = None
+    ) -> None:
+        """Set several values using batched MSET or pipelined SET round trips.
+
+        Args:
+            items: Values to cache by key
+            ttl: Optional time to live in seconds, defaults to the configured TTL
+        """
+        expires = self._ttl(ttl)
+        keys = list(items)
+        for batch in self._batches(keys):
+            pipe = self.client.pipeline(transaction=False)
+            if expires is None:
+                pipe.mset(
+                    {self._key(key): self._serializer.dumps(items[key]) for key in batch}
+                )
+            else:
+                for key in batch:
+                    pipe.set(
+                        self._key(key), self._serializer.dumps(items[key]), ex=expires
+                    )
+            await pipe.execute()
+        await self._invalidate(keys)
+        if self._near is not None:
+            near_ttl = self._near_ttl(self._expiry(ttl))
+            for key in keys:
+                await self._near.set(key, items[key], ttl=near_ttl)
+
+    async def delete(self, key: str) -> None:
+        """Delete value from cache.
+
+        Args:
+            key: Cache key
+        """
+        await self.client.delete(self._key(key))
+        await self._invalidate([key])
+
+    async def clear(self) -> None:
+        """Clear all values in the cache namespace."""
+        batch: list[str] = []
+        async for name in self.client.scan_iter(
+            match=f"{self.config.namespace}:*", count=self.config.batch_size
+        ):
+            batch.append(name)
+            if len(batch) >= self.config.batch_size:
+                await self.client.delete(*batch)
+                batch.clear()
+        if batch:
+            await self.client.delete(*batch)
+        await self._invalidate(None)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Cache statistics
+        """
+        stats: dict[str, Any] = {
+            "name": self.config.name,
+            "namespace": self.config.namespace,
+            "serializer": self.config.serializer,
+            "near_cache": self._near is not None,
+            "invalidations": self._invalidations,
+            "malformed_invalidations": self._malformed,
+            "resubscriptions": self._resubscriptions,
+        }
+        if self._near is not None:
+            stats["near_cache_stats"] = await self._near.get_stats()
+        return stats
+
+
+__all__ = [
+    "CacheBackend",
+    "DistributedCache",
+    "DistributedCacheConfig",
+    "create_local_client",
+    "has_fakeredis",
+    "has_redis",
+]
@@ -1,27 +1,86 @@
 """LRU cache implementation"""
 
+import sys
+import threading
+import time
 from collections import OrderedDict
-from typing import Generic, TypeVar
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from functools import partial
+from typing import Any, Generic, TypeVar
 
 from .exceptions import CacheError
+from .singleflight import SingleFlight
+from .sizers import Sizer, auto_sizeof
 
 KT = TypeVar("KT")
 VT = TypeVar("VT")
 
+_MISSING = object()
+
+# Unlocked reads rely on single OrderedDict operations being atomic, which
+# only holds while the GIL is enabled (free-threaded builds lock every read).
+_LOCK_FREE_READS: bool = getattr(sys, "_is_gil_enabled", lambda: True)()
+
 
 class LRUCache(Generic[KT, VT]):
     """LRU (Least Recently Used) cache implementation"""
 
-    def __init__(self, capacity: int):
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        max_bytes: int | None = None,
+        sizer: Sizer = auto_sizeof,
+    ):
         """
         Initialize LRU cache
 
         Args:
             capacity: Maximum number of items to store
+            max_bytes: Optional budget for the total size of stored values,
+                least recently used items are evicted until it fits
+            sizer: Callable measuring a value in bytes when ``max_bytes`` is set
 
         """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
         self.capacity = capacity
+        self.max_bytes = max_bytes
+        self._sizer = sizer
         self._cache: OrderedDict[KT, VT] = OrderedDict()
+        # Stale and hard expiry deadlines, only for keys put with a TTL
+        self._deadlines: dict[KT, tuple[float | None, float]] = {}
+        # Value sizes, only tracked when a byte budget is set
+        self._sizes: dict[KT, int] = {}
+        self._bytes = 0
+        self._evictions = 0
+        self._flight = SingleFlight()
+
+    def _discard(self, key: KT) -> None:
+        """Drop key and its bookkeeping"""
+        del self._cache[key]
+        self._deadlines.pop(key, None)
+        self._bytes -= self._sizes.pop(key, 0)
+
+    def _evict(self) -> None:
+        """Evict the least recently used key"""
+        key = next(iter(self._cache))
+        self._discard(key)
+        self._evictions += 1
+
+    def _expired(self, key: KT) -> bool:
+        """Drop key if its hard deadline passed"""
+        deadline = self._deadlines.get(key)
+        if deadline is None or deadline[1] > time.monotonic():
+            return False
+        self._discard(key)
+        return True
+
+    def _stale(self, key: KT) -> bool:
+        deadline = self._deadlines.get(key)
+        if deadline is None or deadline[0] is None:
+            return False
+        return deadline[0] <= time.monotonic()
 
     def get(self, key: KT) -> VT | None:
         """
@@ -31,36 +90,112 @@ class LRUCache(Generic[KT, VT]):
             key: Cache key
 
         Returns:
-            Optional[VT]: Cached value if exists
+            Optional[VT]: Cached value if exists and is fresh
 
         """
         try:
             if key not in self._cache:
                 return None
+            if self._deadlines and (self._expired(key) or self._stale(key)):
+                return None
             value = self._cache.pop(key)
             self._cache[key] = value
             return value
         except Exception as e:
             raise CacheError(f"Failed to get value: {e!s}", cause=e)
 
-    def put(self, key: KT, value: VT) -> None:
+    def put(
+        self,
+        key: KT,
+        value: VT,
+        ttl: float | None = None,
+        stale_ttl: float | None = None,
+    ) -> None:
         """
         Put value in cache
 
         Args:
             key: Cache key
             value: Value to cache
+            ttl: Optional time to live in seconds
+            stale_ttl: Extra seconds the value can be served stale by
+                :meth:`get_or_compute` after ``ttl``
 
         """
         try:
+            size = 0
+            if self.max_bytes is not None:
+                size = self._sizer(value)
+                if size > self.max_bytes:
+                    # A value larger than the whole budget is never cached
+                    if key in self._cache:
+                        self._discard(key)
+                    return
             if key in self._cache:
-                self._cache.pop(key)
+                self._discard(key)
             elif len(self._cache) >= self.capacity:
-                self._cache.popitem(last=False)
+                self._evict()
             self._cache[key] = value
+            if self.max_bytes is not None:
+                self._sizes[key] = size
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    self._evict()
+            if ttl is None:
+                self._deadlines.pop(key, None)
+            else:
+                expires_at = time.monotonic() + ttl
+                if stale_ttl:
+                    self._deadlines[key] = (expires_at, expires_at + stale_ttl)
+                else:
+                    self._deadlines[key] = (None, expires_at)
         except Exception as e:
             raise CacheError(f"Failed to put value: {e!s}", cause=e)
 
+    async def get_or_compute(
+        self,
+        key: KT,
+        factory: Callable[[], Awaitable[VT]],
+        ttl: float | None = None,
+        stale_ttl: float | None = None,
+    ) -> VT:
+        """
+        Get value from cache, computing it once on a miss
+
+        Concurrent misses on the same key share a single ``factory`` call.
+        With ``stale_ttl`` an expired value keeps being served for that many
+        extra seconds while a single background refresh recomputes it.
+
+        Args:
+            key: Cache key
+            factory: Async callable producing the value
+            ttl: Optional time to live in seconds
+            stale_ttl: Optional seconds to serve the value stale after ``ttl``
+
+        Returns:
+            VT: Cached or computed value
+
+        """
+        compute = partial(self._compute, key, factory, ttl, stale_ttl)
+        if key not in self._cache or (self._deadlines and self._expired(key)):
+            return await self._flight.do(key, compute)
+        if self._stale(key):
+            self._flight.refresh(key, compute)
+        value = self._cache.pop(key)
+        self._cache[key] = value
+        return value
+
+    async def _compute(
+        self,
+        key: KT,
+        factory: Callable[[], Awaitable[VT]],
+        ttl: float | None,
+        stale_ttl: float | None,
+    ) -> VT:
+        value = await factory()
+        self.put(key, value, ttl, stale_ttl)
+        return value
+
     def remove(self, key: KT) -> None:
         """
         Remove value from cache
@@ -71,7 +206,7 @@ class LRUCache(Generic[KT, VT]):
         """
         try:
             if key in self._cache:
-                self._cache.pop(key)
+                self._discard(key)
         except Exception as e:
             raise CacheError(f"Failed to remove value: {e!s}", cause=e)
 
@@ -79,6 +214,9 @@ class LRUCache(Generic[KT, VT]):
         """Clear all values from cache"""
         try:
             self._cache.clear()
+            self._deadlines.clear()
+            self._sizes.clear()
+            self._bytes = 0
         except Exception as e:
             raise CacheError(f"Failed to clear cache: {e!s}", cause=e)
 
@@ -87,6 +225,27 @@ class LRUCache(Generic[KT, VT]):
         """Get current cache size"""
         return len(self._cache)
 
+    @property
+    def nbytes(self) -> int:
+        """Get total size of stored values, tracked when ``max_bytes`` is set"""
+        return self._bytes
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            dict[str, Any]: Cache statistics
+
+        """
+        return {
+            "size": len(self._cache),
+            "capacity": self.capacity,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self._evictions,
+        }
+
     def __contains__(self, key: KT) -> bool:
         """Check if key exists in cache"""
         return key in self._cache
@@ -94,3 +253,173 @@ class LRUCache(Generic[KT, VT]):
     def __len__(self) -> int:
         """Get current cache size"""
         return len(self._cache)
+
+
+class ConcurrentLRUCache(Generic[KT, VT]):
+    """Thread-safe LRU cache split into lock-striped shards
+
+    Keys are spread over ``shards`` independent LRU partitions by hash, so
+    writers touching different shards never contend. While the GIL is
+    enabled reads take no lock at all: a lookup and the promotion of the
+    key are each a single atomic ``OrderedDict`` operation. Eviction is per
+    shard, so the cache holds at most ``capacity`` items overall.
+    """
+
+    def __init__(self, capacity: int, shards: int = 16):
+        """
+        Initialize concurrent LRU cache
+
+        Args:
+            capacity: Maximum number of items to store
+            shards: Number of lock-striped partitions
+
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be greater than 0")
+        if shards < 1:
+            raise ValueError("shards must be greater than 0")
+        self.capacity = capacity
+        shards = min(shards, capacity)
+        base, extra = divmod(capacity, shards)
+        # One entry per shard in each list, indexed by key hash, so the hot
+        # paths do no attribute or method lookups beyond the shard's own
+        self._count = shards
+        self._data: list[OrderedDict[KT, VT]] = [OrderedDict() for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._limits = [base + (1 if index < extra else 0) for index in range(shards)]
+
+    def _group(self, keys: Iterable[KT]) -> dict[int, list[KT]]:
+        groups: dict[int, list[KT]] = {}
+        count = self._count
+        for key in keys:
+            groups.setdefault(hash(key) % count, []).append(key)
+        return groups
+
+    def _put(self, index: int, key: KT, value: VT) -> None:
+        """Insert or update a key, caller must hold the shard lock"""
+        data = self._data[index]
+        if key in data:
+            data[key] = value
+            data.move_to_end(key)
+            return
+        if len(data) >= self._limits[index]:
+            data.popitem(last=False)
+        data[key] = value
+
+    def get(self, key: KT) -> VT | None:
+        """
+        Get value from cache
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[VT]: Cached value if exists
+
+        """
+        index = hash(key) % self._count
+        data = self._data[index]
+        if not _LOCK_FREE_READS:
+            with self._locks[index]:
+                value = data.get(key, _MISSING)
+                if value is _MISSING:
+                    return None
+                data.move_to_end(key)
+                return value  # type: ignore[return-value]
+
+        value = data.get(key, _MISSING)
+        if value is _MISSING:
+            return None
+        try:
+            data.move_to_end(key)
+        except KeyError:
+            # Evicted or removed since the lookup
+            pass
+        return value  # type: ignore[return-value]
+
+    def put(self, key: KT, value: VT) -> None:
+        """
+        Put value in cache
+
+        Args:
+            key: Cache key
+            value: Value to cache
+
+        """
+        index = hash(key) % self._count
+        data = self._data[index]
+        with self._locks[index]:
+            if key in data:
+                data[key] = value
+                data.move_to_end(key)
+                return
+            if len(data) >= self._limits[index]:
+                data.popitem(last=False)
+            data[key] = value
+
+    def get_many(self, keys: Iterable[KT]) -> dict[KT, VT]:
+        """
+        Get several values, taking each shard lock once
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            dict[KT, VT]: Cached values for the keys that exist
+
+        """
+        found: dict[KT, VT] = {}
+        for index, group in self._group(keys).items():
+            data = self._data[index]
+            with self._locks[index]:
+                for key in group:
+                    value = data.get(key, _MISSING)
+                    if value is not _MISSING:
+                        data.move_to_end(key)
+                        found[key] = value  # type: ignore[assignment]
+        return found
+
+    def put_many(self, items: Mapping[KT, VT] | Iterable[tuple[KT, VT]]) -> None:
+        """
+        Put several values, taking each shard lock once
+
+        Args:
+            items: Mapping or iterable of key/value pairs
+
+        """
+        pairs = dict(items)
+        for index, group in self._group(pairs).items():
+            with self._locks[index]:
+                for key in group:
+                    self._put(index, key, pairs[key])
+
+    def remove(self, key: KT) -> None:
+        """
+        Remove value from cache
+
+        Args:
+            key: Cache key
+
+        """
+        index = hash(key) % self._count
+        with self._locks[index]:
+            self._data[index].pop(key, None)
+
+    def clear(self) -> None:
+        """Clear all values from cache"""
+        for data, lock in zip(self._data, self._locks, strict=True):
+            with lock:
+                data.clear()
+
+    @property
+    def size(self) -> int:
+        """Get current cache size"""
+        return sum(len(data) for data in self._data)
+
+    def __contains__(self, key: KT) -> bool:
+        """Check if key exists in cache"""
+        return key in self._data[hash(key) % self._count]
+
+    def __len__(self) -> int:
+        """Get current cache size"""
+        return self.size
@@ -1,9 +1,14 @@
 """Cache management module."""
 
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any
 
 from ..module import BaseModule, ModuleConfig
+from .singleflight import SingleFlight
+from .sizers import SIZERS, get_sizer
+from .strategies import STRATEGIES, BoundedStrategy, create_strategy
 
 
 @dataclass
@@ -15,12 +20,40 @@ class CacheManagerConfig(ModuleConfig):
 
     # Optional fields
     max_size: int = 1000
-    ttl: float = 60.0  # Time to live in seconds
+    ttl: float | None = 60.0  # Time to live in seconds, None disables expiry
+    eviction_policy: str = "lru"  # One of lru, lfu, fifo or size
+    sweep_interval: float | None = None  # Background expiry sweep in seconds
+    max_bytes: int | None = None  # Memory budget in bytes, None disables it
+    # One of auto, shallow, deep, len or nbytes. None picks auto when
+    # entries are sized for eviction, else the constant-time shallow sizer
+    sizer: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def validate(self) -> None:
+        """Validate configuration."""
+        if self.max_size < 1:
+            raise ValueError("max_size must be greater than 0")
+        if self.ttl is not None and self.ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if self.eviction_policy.lower() not in STRATEGIES:
+            raise ValueError(f"Unknown eviction policy: {self.eviction_policy}")
+        if self.sweep_interval is not None and self.sweep_interval <= 0:
+            raise ValueError("sweep_interval must be greater than 0")
+        if self.max_bytes is not None and self.max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
+        if self.sizer is not None and self.sizer.lower() not in SIZERS:
+            raise ValueError(f"Unknown sizer: {self.sizer}")
+
 
 class CacheManager(BaseModule[CacheManagerConfig]):
-    """Cache manager implementation."""
+    """Cache manager implementation.
+
+    Entries are bounded by ``max_size`` and, optionally, by a ``max_bytes``
+    memory budget measured with ``sizer``. Unless sizes drive eviction, the
+    default sizer is shallow, so sets never walk large values just to
+    report ``memory_estimate``. Entries expire after ``ttl``; the entry
+    evicted when the cache is full is chosen by ``eviction_policy``.
+    """
 
     def __init__(self, config: CacheManagerConfig | None = None) -> None:
         """Initialize cache manager.
@@ -29,15 +62,39 @@ class CacheManager(BaseModule[CacheManagerConfig]):
             config: Cache manager configuration
         """
         super().__init__(config or CacheManagerConfig(name="cache-manager"))
-        self._cache: dict[str, Any] = {}
+        self._strategy: BoundedStrategy = self._create_strategy()
+        self._flight = SingleFlight()
+
+    def _create_strategy(self) -> BoundedStrategy:
+        """Create the eviction strategy described by the configuration."""
+        return create_strategy(
+            self.config.eviction_policy,
+            max_size=self.config.max_size,
+            ttl=self.config.ttl,
+            sizer=get_sizer(self._sizer_name()),
+            max_bytes=self.config.max_bytes,
+        )
+
+    def _sizer_name(self) -> str:
+        """Get the configured sizer, cheap unless sizes drive eviction."""
+        if self.config.sizer is not None:
+            return self.config.sizer
+        if self.config.max_bytes is not None or self.config.eviction_policy.lower() == "size":
+            return "auto"
+        return "shallow"
 
     async def _setup(self) -> None:
         """Setup cache manager."""
-        self._cache.clear()
+        self.config.validate()
+        self._strategy = self._create_strategy()
+        if self.config.sweep_interval is not None:
+            self._strategy.start_sweeper(self.config.sweep_interval)
 
     async def _teardown(self) -> None:
         """Cleanup cache manager."""
-        self._cache.clear()
+        await self._flight.cancel()
+        await self._strategy.stop_sweeper()
+        await self._strategy.clear()
 
     async def get(self, key: str) -> Any:
         """Get cache entry.
@@ -46,22 +103,68 @@ class CacheManager(BaseModule[CacheManagerConfig]):
             key: Cache key
 
         Returns:
-            Cache entry if found, None otherwise
+            Cache entry if found and not expired, None otherwise
         """
         if not self.is_initialized:
             await self.initialize()
-        return self._cache.get(key)
+        return await self._strategy.get(key)
 
-    async def set(self, key: str, value: Any) -> None:
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
         """Set cache entry.
 
         Args:
             key: Cache key
             value: Cache value
+            ttl: Optional time to live in seconds, defaults to the configured TTL
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        await self._strategy.set(key, value, ttl)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+        stale_ttl: float | None = None,
+    ) -> Any:
+        """Get cache entry, computing it once on a miss.
+
+        Concurrent misses on the same key share a single ``factory`` call.
+        With ``stale_ttl`` an expired value keeps being served for that many
+        extra seconds while a single background refresh recomputes it.
+
+        Args:
+            key: Cache key
+            factory: Async callable producing the value
+            ttl: Optional time to live in seconds, defaults to the configured TTL
+            stale_ttl: Optional seconds to serve the value stale after ``ttl``
+
+        Returns:
+            Cached or computed value
         """
         if not self.is_initialized:
             await self.initialize()
-        self._cache[key] = value
+        compute = partial(self._compute, key, factory, ttl, stale_ttl)
+        found = await self._strategy.get_stale(key)
+        if found is None:
+            return await self._flight.do(key, compute)
+        value, stale = found
+        if stale:
+            self._flight.refresh(key, compute)
+        return value
+
+    async def _compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: float | None,
+        stale_ttl: float | None,
+    ) -> Any:
+        """Compute and store a cache entry."""
+        value = await factory()
+        await self._strategy.set(key, value, ttl, stale_ttl)
+        return value
 
     async def delete(self, key: str) -> None:
         """Delete cache entry.
@@ -71,13 +174,13 @@ class CacheManager(BaseModule[CacheManagerConfig]):
         """
         if not self.is_initialized:
             await self.initialize()
-        self._cache.pop(key, None)
+        await self._strategy.delete(key)
 
     async def clear(self) -> None:
         """Clear all cache entries."""
         if not self.is_initialized:
             await self.initialize()
-        self._cache.clear()
+        await self._strategy.clear()
 
     async def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -87,8 +190,19 @@ class CacheManager(BaseModule[CacheManagerConfig]):
         """
         if not self.is_initialized:
             await self.initialize()
+        stats = await self._strategy.get_stats()
         return {
-            "size": len(self._cache),
+            "size": stats["size"],
             "max_size": self.config.max_size,
             "ttl": self.config.ttl,
+            "eviction_policy": self.config.eviction_policy,
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_ratio": stats["hit_ratio"],
+            "evictions": stats["evictions"],
+            "expirations": stats["expirations"],
+            "rejections": stats["rejections"],
+            "memory_estimate": stats["bytes"],
+            "max_bytes": self.config.max_bytes,
+            "inflight": len(self._flight),
         }
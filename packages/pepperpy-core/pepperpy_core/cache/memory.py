@@ -1,16 +1,60 @@
 """Memory cache implementation."""
 
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import Any
 
 from .exceptions import CacheError
+from .singleflight import SingleFlight
+from .sizers import Sizer, auto_sizeof
+
+# Cached value, hard expiry and stale deadline (monotonic seconds)
+_Entry = tuple[Any, float | None, float | None]
 
 
 class MemoryCache:
     """Simple in-memory cache implementation."""
 
-    def __init__(self) -> None:
-        """Initialize memory cache."""
-        self._cache: dict[str, Any] = {}
+    def __init__(self, max_bytes: int | None = None, sizer: Sizer = auto_sizeof) -> None:
+        """Initialize memory cache.
+
+        Args:
+            max_bytes: Optional budget for the total size of stored values,
+                the least recently used values are evicted until it fits
+            sizer: Callable measuring a value in bytes when ``max_bytes`` is set
+        """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
+        self.max_bytes = max_bytes
+        self._sizer = sizer
+        self._cache: dict[str, _Entry] = {}
+        # Value sizes, only tracked when a byte budget is set
+        self._sizes: dict[str, int] = {}
+        self._bytes = 0
+        self._evictions = 0
+        self._flight = SingleFlight()
+
+    def _discard(self, key: str) -> None:
+        """Drop key and its size."""
+        del self._cache[key]
+        self._bytes -= self._sizes.pop(key, 0)
+
+    def _lookup(self, key: str) -> _Entry | None:
+        """Find a live entry, dropping it if expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at = entry[1]
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._discard(key)
+            return None
+        if self.max_bytes is not None:
+            # Re-inserting keeps the dict ordered from least to most recently
+            # used, the order values are evicted in
+            del self._cache[key]
+            self._cache[key] = entry
+        return entry
 
     def get(self, key: str) -> Any | None:
         """Get value from cache.
@@ -19,28 +63,118 @@ class MemoryCache:
             key: Cache key
 
         Returns:
-            Cached value if found, None otherwise
+            Cached value if found and fresh, None otherwise
 
         Raises:
             CacheError: If get operation fails
         """
         try:
-            return self._cache.get(key)
+            entry = self._lookup(key)
+            if entry is None:
+                return None
+            value, _, stale_at = entry
+            if stale_at is not None and stale_at <= time.monotonic():
+                return None
+            return value
         except Exception as e:
             raise CacheError(f"Failed to get value: {e}", cause=e)
 
-    def set(self, key: str, value: Any, ttl: int | float | None = None) -> None:
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | float | None = None,
+        stale_ttl: int | float | None = None,
+    ) -> None:
         """Set value in cache.
 
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds
+            stale_ttl: Extra seconds the value can be served stale by
+                :meth:`get_or_compute` after ``ttl``
 
         Raises:
             CacheError: If set operation fails
         """
         try:
-            self._cache[key] = value
+            if key in self._cache:
+                self._discard(key)
+            if self.max_bytes is not None:
+                size = self._sizer(value)
+                if size > self.max_bytes:
+                    # A value larger than the whole budget is never cached
+                    return
+                while self._cache and self._bytes + size > self.max_bytes:
+                    self._discard(next(iter(self._cache)))
+                    self._evictions += 1
+                self._sizes[key] = size
+                self._bytes += size
+
+            if ttl is None:
+                self._cache[key] = (value, None, None)
+                return
+            expires_at = time.monotonic() + ttl
+            if stale_ttl:
+                self._cache[key] = (value, expires_at + stale_ttl, expires_at)
+            else:
+                self._cache[key] = (value, expires_at, None)
         except Exception as e:
             raise CacheError(f"Failed to set value: {e}", cause=e)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Cache statistics
+        """
+        return {
+            "size": len(self._cache),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self._evictions,
+        }
+
+    async def get_or_compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: int | float | None = None,
+        stale_ttl: int | float | None = None,
+    ) -> Any:
+        """Get value from cache, computing it once on a miss.
+
+        Concurrent misses on the same key share a single ``factory`` call.
+        With ``stale_ttl`` an expired value keeps being served for that many
+        extra seconds while a single background refresh recomputes it.
+
+        Args:
+            key: Cache key
+            factory: Async callable producing the value
+            ttl: Time to live in seconds
+            stale_ttl: Optional seconds to serve the value stale after ``ttl``
+
+        Returns:
+            Cached or computed value
+        """
+        compute = partial(self._compute, key, factory, ttl, stale_ttl)
+        entry = self._lookup(key)
+        if entry is None:
+            return await self._flight.do(key, compute)
+        value, _, stale_at = entry
+        if stale_at is not None and stale_at <= time.monotonic():
+            self._flight.refresh(key, compute)
+        return value
+
+    async def _compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: int | float | None,
+        stale_ttl: int | float | None,
+    ) -> Any:
+        """Compute and store a value."""
+        value = await factory()
+        self.set(key, value, ttl, stale_ttl)
+        return value
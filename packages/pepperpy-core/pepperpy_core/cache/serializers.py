@@ -0,0 +1,156 @@
+"""Cache value serializers."""
+
+import importlib.util
+import json
+import pickle
+from typing import Any, Protocol, runtime_checkable
+
+_msgpack_spec = importlib.util.find_spec("msgpack")
+has_msgpack = bool(_msgpack_spec)
+
+
+@runtime_checkable
+class Serializer(Protocol):
+    """Serializer protocol."""
+
+    def dumps(self, value: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class JSONSerializer:
+    """JSON serializer, portable but limited to JSON types."""
+
+    def dumps(self, value: Any) -> bytes:
+        """Serialize value.
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            Serialized value
+        """
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        """Deserialize value.
+
+        Args:
+            data: Serialized value
+
+        Returns:
+            Deserialized value
+        """
+        return json.loads(data)
+
+
+class PickleSerializer:
+    """Pickle serializer, supports arbitrary Python objects."""
+
+    def __init__(self, protocol: int = pickle.HIGHEST_PROTOCOL) -> None:
+        """Initialize serializer.
+
+        Args:
+            protocol: Pickle protocol version
+        """
+        self.protocol = protocol
+
+    def dumps(self, value: Any) -> bytes:
+        """Serialize value.
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            Serialized value
+        """
+        return pickle.dumps(value, protocol=self.protocol)
+
+    def loads(self, data: bytes) -> Any:
+        """Deserialize value.
+
+        Args:
+            data: Serialized value
+
+        Returns:
+            Deserialized value
+        """
+        return pickle.loads(data)
+
+
+class MsgpackSerializer:
+    """MessagePack serializer, compact and portable."""
+
+    def __init__(self) -> None:
+        """Initialize serializer.
+
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        if not has_msgpack:
+            raise ImportError(
+                "msgpack is not installed. Please install it with `pip install msgpack`"
+            )
+        import msgpack  # type: ignore
+
+        self._msgpack = msgpack
+
+    def dumps(self, value: Any) -> bytes:
+        """Serialize value.
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            Serialized value
+        """
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        """Deserialize value.
+
+        Args:
+            data: Serialized value
+
+        Returns:
+            Deserialized value
+        """
+        return self._msgpack.unpackb(data, raw=False)
+
+
+SERIALIZERS: dict[str, type[Serializer]] = {
+    "json": JSONSerializer,
+    "pickle": PickleSerializer,
+    "msgpack": MsgpackSerializer,
+}
+
+
+def get_serializer(serializer: str | Serializer) -> Serializer:
+    """Resolve a serializer by name.
+
+    Args:
+        serializer: Serializer name (json, pickle or msgpack) or instance
+
+    Returns:
+        Serializer instance
+
+    Raises:
+        ValueError: If the serializer name is unknown
+    """
+    if not isinstance(serializer, str):
+        return serializer
+    try:
+        return SERIALIZERS[serializer.lower()]()
+    except KeyError:
+        raise ValueError(f"Unknown serializer: {serializer}") from None
+
+
+__all__ = [
+    "JSONSerializer",
+    "MsgpackSerializer",
+    "PickleSerializer",
+    "SERIALIZERS",
+    "Serializer",
+    "get_serializer",
+    "has_msgpack",
+]
@@ -0,0 +1,82 @@
+"""Request coalescing for cache computations."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent computations of the same key.
+
+    The first caller for a key starts the computation in its own task and
+    every concurrent caller awaits that same task, so an expensive factory
+    runs once per key no matter how many callers miss at the same time.
+    Cancelling a waiting caller never cancels the shared computation.
+    """
+
+    def __init__(self) -> None:
+        """Initialize single-flight group."""
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``factory`` for ``key`` unless a run is already in flight.
+
+        Args:
+            key: Computation key
+            factory: Async callable producing the value
+
+        Returns:
+            Result of the shared computation
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start(key, factory)
+        return await asyncio.shield(task)
+
+    def refresh(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> None:
+        """Start ``factory`` for ``key`` in the background if not in flight.
+
+        Failures of background refreshes are dropped, callers keep being
+        served whatever value is still cached.
+
+        Args:
+            key: Computation key
+            factory: Async callable producing the value
+        """
+        if key not in self._inflight:
+            self._start(key, factory)
+
+    async def cancel(self) -> None:
+        """Cancel every computation in flight."""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._inflight.clear()
+
+    def _start(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> asyncio.Task[Any]:
+        task = asyncio.ensure_future(factory())
+        self._inflight[key] = task
+        task.add_done_callback(partial(self._done, key))
+        return task
+
+    def _done(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved, waiters re-raise it themselves
+            task.exception()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a computation for key is in flight."""
+        return key in self._inflight
+
+    def __len__(self) -> int:
+        """Get number of computations in flight."""
+        return len(self._inflight)
+
+
+__all__ = ["SingleFlight"]
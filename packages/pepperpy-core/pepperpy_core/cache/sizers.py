@@ -0,0 +1,155 @@
+"""Cache value sizers."""
+
+import sys
+import types
+from collections.abc import Callable
+from typing import Any
+
+Sizer = Callable[[Any], int]
+
+_ATOMIC = (str, bytes, bytearray, memoryview, int, float, complex, bool, type(None))
+# Shared program objects a value refers to without owning
+_SHARED = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+)
+
+
+def shallow_sizeof(value: Any) -> int:
+    """Size of the object itself, ignoring referenced objects.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Size in bytes
+    """
+    return sys.getsizeof(value)
+
+
+def deep_sizeof(value: Any) -> int:
+    """Size of the object and everything it references.
+
+    Walks containers, mappings and instance attributes, counting each
+    object once. Objects exposing ``nbytes`` (e.g. numpy arrays) count
+    their buffer size. Modules, classes and functions are shared rather
+    than owned by the value, so they are neither counted nor walked.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Size in bytes
+    """
+    seen: set[int] = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, _SHARED):
+            continue
+        if isinstance(obj, _ATOMIC):
+            total += sys.getsizeof(obj)
+            continue
+        nbytes = getattr(obj, "nbytes", None)
+        if isinstance(nbytes, int):
+            total += nbytes
+            continue
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+    return total
+
+
+def len_sizeof(value: Any) -> int:
+    """Size as ``len(value)``, exact for bytes-like values.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Size in bytes
+    """
+    return len(value)
+
+
+def nbytes_sizeof(value: Any) -> int:
+    """Size of the value buffer, for numpy arrays and similar.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Size in bytes
+    """
+    return int(value.nbytes)
+
+
+def auto_sizeof(value: Any) -> int:
+    """Pick the cheapest accurate sizer for the value type.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Size in bytes
+    """
+    if isinstance(value, _ATOMIC):
+        return sys.getsizeof(value)
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return deep_sizeof(value)
+
+
+SIZERS: dict[str, Sizer] = {
+    "shallow": shallow_sizeof,
+    "deep": deep_sizeof,
+    "len": len_sizeof,
+    "nbytes": nbytes_sizeof,
+    "auto": auto_sizeof,
+}
+
+
+def get_sizer(sizer: str | Sizer) -> Sizer:
+    """Resolve a sizer by name.
+
+    Args:
+        sizer: Sizer name (shallow, deep, len, nbytes or auto) or callable
+
+    Returns:
+        Sizer callable
+
+    Raises:
+        ValueError: If the sizer name is unknown
+    """
+    if not isinstance(sizer, str):
+        return sizer
+    try:
+        return SIZERS[sizer.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown sizer: {sizer}") from None
+
+
+__all__ = [
+    "SIZERS",
+    "Sizer",
+    "auto_sizeof",
+    "deep_sizeof",
+    "get_sizer",
+    "len_sizeof",
+    "nbytes_sizeof",
+    "shallow_sizeof",
+]
@@ -1,8 +1,17 @@
 """Cache strategies implementation"""
 
+import asyncio
+import contextlib
+import heapq
+import itertools
+import sys
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any
 
+from .sizers import Sizer
+
 
 class CacheStrategy(ABC):
     """Base class for cache strategies"""
@@ -18,13 +27,600 @@ class CacheStrategy(ABC):
         pass
 
 
-class LRUStrategy(CacheStrategy):
-    """Least Recently Used cache strategy"""
+class _Entry:
+    """Cache entry shared by the bounded strategies"""
+
+    __slots__ = ("key", "value", "expires_at", "stale_at", "size")
+
+    def __init__(self, key: str, value: Any, expires_at: float | None, size: int) -> None:
+        self.key = key
+        self.value = value
+        self.expires_at = expires_at
+        # Past stale_at the value is only served through get_stale()
+        self.stale_at: float | None = None
+        self.size = size
+
+
+class _LRUNode(_Entry):
+    """Doubly-linked list node used by the LRU strategy"""
+
+    __slots__ = ("prev", "next")
+
+    def __init__(self, key: str, value: Any, expires_at: float | None, size: int) -> None:
+        super().__init__(key, value, expires_at, size)
+        self.prev: _LRUNode = self
+        self.next: _LRUNode = self
+
+
+class _LFUNode(_Entry):
+    """Entry tagged with its access frequency used by the LFU strategy"""
+
+    __slots__ = ("freq",)
+
+    def __init__(self, key: str, value: Any, expires_at: float | None, size: int) -> None:
+        super().__init__(key, value, expires_at, size)
+        self.freq = 1
+
+
+class _SizeNode(_Entry):
+    """Entry tracked in the size heap, ``version`` invalidates stale heap items"""
+
+    __slots__ = ("version", "heap_size")
+
+    def __init__(self, key: str, value: Any, expires_at: float | None, size: int) -> None:
+        super().__init__(key, value, expires_at, size)
+        self.version = 0
+        self.heap_size = size
+
+
+class BoundedStrategy(CacheStrategy):
+    """Bounded cache strategy with per-entry TTL and statistics
+
+    Subclasses only decide the eviction order through the ``_insert``,
+    ``_touch``, ``_unlink`` and ``_victim`` hooks. Expired entries are
+    dropped lazily on read and, optionally, by a background sweeper task.
+    Entry sizes are estimated with ``sizer`` to report memory usage and,
+    when ``max_bytes`` is set, entries are evicted until the total fits.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: int | float | None = None,
+        sizer: Sizer = sys.getsizeof,
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Initialize strategy
+
+        Args:
+            max_size: Maximum number of entries to keep
+            ttl: Default time to live in seconds, ``None`` disables expiry
+            sizer: Callable estimating the size of a value in bytes
+            max_bytes: Maximum total estimated size, ``None`` disables it
+
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizer = sizer
+        self._entries: dict[str, Any] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejections = 0
+        self._sweeper: asyncio.Task[None] | None = None
+
+    @abstractmethod
+    def _insert(self, key: str, value: Any, expires_at: float | None, size: int) -> _Entry:
+        """Create and link a new entry"""
+        pass
+
+    @abstractmethod
+    def _touch(self, entry: Any) -> None:
+        """Record an access to an entry"""
+        pass
+
+    @abstractmethod
+    def _unlink(self, entry: Any) -> None:
+        """Detach an entry from the eviction structure"""
+        pass
+
+    @abstractmethod
+    def _victim(self) -> Any | None:
+        """Return the next entry to evict"""
+        pass
+
+    @abstractmethod
+    def _reset(self) -> None:
+        """Reset the eviction structure"""
+        pass
+
+    def _expires_at(self, ttl: int | float | None) -> float | None:
+        ttl = self.ttl if ttl is None else ttl
+        return None if ttl is None else time.monotonic() + ttl
+
+    def _remove(self, entry: _Entry) -> None:
+        del self._entries[entry.key]
+        self._bytes -= entry.size
+        self._unlink(entry)
+
+    def _evict_one(self) -> str | None:
+        entry = self._victim()
+        if entry is None:
+            return None
+        self._remove(entry)
+        self._evictions += 1
+        return entry.key
+
+    def _lookup(self, key: str) -> _Entry | None:
+        """Find a live entry, dropping it if hard-expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(entry)
+            self._expirations += 1
+            return None
+        return entry
+
+    async def get(self, key: str) -> Any | None:
+        """
+        Get cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if present and fresh, None otherwise
+
+        """
+        entry = self._lookup(key)
+        if entry is None or (entry.stale_at is not None and entry.stale_at <= time.monotonic()):
+            self._misses += 1
+            return None
+        self._touch(entry)
+        self._hits += 1
+        return entry.value
+
+    async def get_stale(self, key: str) -> tuple[Any, bool] | None:
+        """
+        Get cached value even if it is stale
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[tuple[Any, bool]]: Cached value and whether it is
+            stale, None if absent or expired
+
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._touch(entry)
+        self._hits += 1
+        stale = entry.stale_at is not None and entry.stale_at <= time.monotonic()
+        return entry.value, stale
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | float | None = None,
+        stale_ttl: int | float | None = None,
+    ) -> None:
+        """
+        Set cache value, evicting an entry if the strategy is full
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds, defaults to the strategy TTL
+            stale_ttl: Extra seconds the value is kept after ``ttl`` so it
+                can still be served stale through :meth:`get_stale`
+
+        """
+        expires_at = self._expires_at(ttl)
+        stale_at = None
+        if stale_ttl and expires_at is not None:
+            stale_at, expires_at = expires_at, expires_at + stale_ttl
+        size = self._sizer(value)
+        entry = self._entries.get(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # A value larger than the whole budget is never cached
+            if entry is not None:
+                self._remove(entry)
+            self._rejections += 1
+            return
+        if entry is not None:
+            self._bytes += size - entry.size
+            entry.value = value
+            entry.expires_at = expires_at
+            entry.stale_at = stale_at
+            entry.size = size
+            self._touch(entry)
+        else:
+            if len(self._entries) >= self.max_size:
+                self._evict_one()
+            entry = self._insert(key, value, expires_at, size)
+            entry.stale_at = stale_at
+            self._entries[key] = entry
+            self._bytes += size
+        if self.max_bytes is not None:
+            while self._bytes > self.max_bytes and self._evict_one() is not None:
+                pass
+
+    async def delete(self, key: str) -> bool:
+        """
+        Delete cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bool: True if the key was present
+
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        self._remove(entry)
+        return True
+
+    async def clear(self) -> None:
+        """Remove all cached values"""
+        self._entries.clear()
+        self._bytes = 0
+        self._reset()
+
+    async def evict(self) -> str | None:
+        """
+        Evict a single entry according to the strategy
+
+        Returns:
+            Optional[str]: Evicted key, None if the strategy is empty
+
+        """
+        return self._evict_one()
+
+    async def sweep(self) -> int:
+        """
+        Remove every expired entry
+
+        Returns:
+            int: Number of removed entries
+
+        """
+        now = time.monotonic()
+        expired = [
+            entry
+            for entry in self._entries.values()
+            if entry.expires_at is not None and entry.expires_at <= now
+        ]
+        for entry in expired:
+            self._remove(entry)
+        self._expirations += len(expired)
+        return len(expired)
+
+    def start_sweeper(self, interval: float) -> None:
+        """
+        Start the background task that periodically sweeps expired entries
+
+        Args:
+            interval: Seconds between sweeps
+
+        """
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_loop(interval))
+
+    async def stop_sweeper(self) -> None:
+        """Stop the background sweeper task"""
+        if self._sweeper is None:
+            return
+        self._sweeper.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._sweeper
+        self._sweeper = None
+
+    async def _sweep_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.sweep()
+
+    async def get_stats(self) -> dict[str, Any]:
+        """
+        Get strategy statistics
+
+        Returns:
+            Strategy statistics
+
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "rejections": self._rejections,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __contains__(self, key: str) -> bool:
+        """Check if a fresh key exists without touching it"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        deadline = entry.expires_at if entry.stale_at is None else entry.stale_at
+        return deadline is None or deadline > time.monotonic()
+
+    def __len__(self) -> int:
+        """Get current number of entries, including not yet swept ones"""
+        return len(self._entries)
+
+
+class LRUStrategy(BoundedStrategy):
+    """Least Recently Used cache strategy
+
+    Entries live in a hash map pointing into a circular doubly-linked
+    list, so lookups, promotions and evictions are all O(1).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: int | float | None = None,
+        sizer: Sizer = sys.getsizeof,
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Initialize LRU strategy
+
+        Args:
+            max_size: Maximum number of entries to keep
+            ttl: Default time to live in seconds, ``None`` disables expiry
+            sizer: Callable estimating the size of a value in bytes
+            max_bytes: Maximum total estimated size, ``None`` disables it
+
+        """
+        super().__init__(max_size, ttl, sizer, max_bytes)
+        self._head = _LRUNode("", None, None, 0)
+
+    def _insert(self, key: str, value: Any, expires_at: float | None, size: int) -> _Entry:
+        node = _LRUNode(key, value, expires_at, size)
+        self._link_front(node)
+        return node
+
+    def _link_front(self, node: _LRUNode) -> None:
+        first = self._head.next
+        node.prev = self._head
+        node.next = first
+        first.prev = node
+        self._head.next = node
+
+    def _touch(self, entry: _LRUNode) -> None:
+        if self._head.next is entry:
+            return
+        self._unlink(entry)
+        self._link_front(entry)
+
+    def _unlink(self, entry: _LRUNode) -> None:
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        entry.prev = entry.next = entry
+
+    def _victim(self) -> _LRUNode | None:
+        last = self._head.prev
+        return None if last is self._head else last
+
+    def _reset(self) -> None:
+        self._head.prev = self._head.next = self._head
+
+
+class LFUStrategy(BoundedStrategy):
+    """Least Frequently Used cache strategy
+
+    Entries are grouped in per-frequency buckets and the minimum frequency
+    is tracked, so lookups, promotions and evictions are all O(1). Ties
+    within a bucket are broken by recency (oldest first).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: int | float | None = None,
+        sizer: Sizer = sys.getsizeof,
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Initialize LFU strategy
+
+        Args:
+            max_size: Maximum number of entries to keep
+            ttl: Default time to live in seconds, ``None`` disables expiry
+            sizer: Callable estimating the size of a value in bytes
+            max_bytes: Maximum total estimated size, ``None`` disables it
+
+        """
+        super().__init__(max_size, ttl, sizer, max_bytes)
+        self._buckets: dict[int, OrderedDict[str, _LFUNode]] = {}
+        self._min_freq = 0
+
+    def _insert(self, key: str, value: Any, expires_at: float | None, size: int) -> _Entry:
+        node = _LFUNode(key, value, expires_at, size)
+        self._buckets.setdefault(1, OrderedDict())[key] = node
+        self._min_freq = 1
+        return node
+
+    def _touch(self, entry: _LFUNode) -> None:
+        bucket = self._buckets[entry.freq]
+        del bucket[entry.key]
+        if not bucket:
+            del self._buckets[entry.freq]
+            if self._min_freq == entry.freq:
+                self._min_freq += 1
+        entry.freq += 1
+        self._buckets.setdefault(entry.freq, OrderedDict())[entry.key] = entry
+
+    def _unlink(self, entry: _LFUNode) -> None:
+        bucket = self._buckets[entry.freq]
+        del bucket[entry.key]
+        if not bucket:
+            # The minimum frequency is recomputed lazily by ``_victim``
+            del self._buckets[entry.freq]
+
+    def _victim(self) -> _LFUNode | None:
+        if self._min_freq not in self._buckets:
+            self._min_freq = min(self._buckets, default=0)
+        bucket = self._buckets.get(self._min_freq)
+        if not bucket:
+            return None
+        return next(iter(bucket.values()))
+
+    def _reset(self) -> None:
+        self._buckets.clear()
+        self._min_freq = 0
+
+
+class FIFOStrategy(LRUStrategy):
+    """First In First Out cache strategy
+
+    Reuses the LRU list but never promotes entries on access, so the
+    oldest inserted entry is always evicted first.
+    """
+
+    def _touch(self, entry: _LRUNode) -> None:
+        pass
+
+
+class SizeStrategy(BoundedStrategy):
+    """Size-weighted cache strategy
+
+    Evicts the largest entries first, so a single oversized value gives
+    way before many small ones. Entries are kept in a max-heap keyed by
+    size with lazy invalidation, making eviction O(log n).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: int | float | None = None,
+        sizer: Sizer = sys.getsizeof,
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Initialize size-weighted strategy
+
+        Args:
+            max_size: Maximum number of entries to keep
+            ttl: Default time to live in seconds, ``None`` disables expiry
+            sizer: Callable estimating the size of a value in bytes
+            max_bytes: Maximum total estimated size, ``None`` disables it
+
+        """
+        super().__init__(max_size, ttl, sizer, max_bytes)
+        self._heap: list[tuple[int, int, int, _SizeNode]] = []
+        self._counter = itertools.count()
+
+    def _push(self, node: _SizeNode) -> None:
+        node.heap_size = node.size
+        heapq.heappush(self._heap, (-node.size, next(self._counter), node.version, node))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        self._heap = [item for item in self._heap if item[2] == item[3].version]
+        heapq.heapify(self._heap)
+
+    def _insert(self, key: str, value: Any, expires_at: float | None, size: int) -> _Entry:
+        node = _SizeNode(key, value, expires_at, size)
+        self._push(node)
+        return node
+
+    def _touch(self, entry: _SizeNode) -> None:
+        # Only a changed size requires a new heap position
+        if entry.size == entry.heap_size:
+            return
+        entry.version += 1
+        self._push(entry)
+
+    def _unlink(self, entry: _SizeNode) -> None:
+        entry.version += 1
+
+    def _victim(self) -> _SizeNode | None:
+        while self._heap:
+            _, _, version, node = self._heap[0]
+            if version == node.version:
+                return node
+            heapq.heappop(self._heap)
+        return None
+
+    def _reset(self) -> None:
+        self._heap.clear()
+
+
+STRATEGIES: dict[str, type[BoundedStrategy]] = {
+    "lru": LRUStrategy,
+    "lfu": LFUStrategy,
+    "fifo": FIFOStrategy,
+    "size": SizeStrategy,
+}
+
+
+def create_strategy(
+    policy: str,
+    max_size: int = 1000,
+    ttl: int | float | None = None,
+    sizer: Sizer = sys.getsizeof,
+    max_bytes: int | None = None,
+) -> BoundedStrategy:
+    """
+    Create a cache strategy by eviction policy name
+
+    Args:
+        policy: Eviction policy, one of ``lru``, ``lfu``, ``fifo`` or ``size``
+        max_size: Maximum number of entries to keep
+        ttl: Default time to live in seconds, ``None`` disables expiry
+        sizer: Callable estimating the size of a value in bytes
+        max_bytes: Maximum total estimated size, ``None`` disables it
+
+    Returns:
+        BoundedStrategy: Strategy instance
 
-    pass
+    Raises:
+        ValueError: If the policy is unknown
 
+    """
+    try:
+        strategy_cls = STRATEGIES[policy.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown eviction policy: {policy}") from None
+    return strategy_cls(max_size, ttl, sizer, max_bytes)
 
-class LFUStrategy(CacheStrategy):
-    """Least Frequently Used cache strategy"""
 
-    pass
+__all__ = [
+    "BoundedStrategy",
+    "CacheStrategy",
+    "FIFOStrategy",
+    "LFUStrategy",
+    "LRUStrategy",
+    "STRATEGIES",
+    "SizeStrategy",
+    "create_strategy",
+]
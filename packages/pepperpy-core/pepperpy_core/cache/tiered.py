@@ -0,0 +1,118 @@
+"""Tiered cache implementation."""
+
+from typing import Any, Protocol
+
+from .base import BaseCache
+from .config import CacheConfig
+
+
+class CacheTier(Protocol):
+    """Async cache protocol shared by cache tiers."""
+
+    async def initialize(self) -> None: ...
+
+    async def cleanup(self) -> None: ...
+
+    async def get(self, key: str) -> Any: ...
+
+    async def set(self, key: str, value: Any) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def clear(self) -> None: ...
+
+
+class TieredCache(BaseCache[CacheConfig]):
+    """Two-level cache with a fast L1 in front of a larger L2.
+
+    Reads try L1 first and promote L2 hits into L1. Writes go through to
+    both tiers, so L2 (typically a :class:`~.disk.DiskCache`) keeps every
+    value across restarts while L1 (e.g. a ``CacheManager``) serves the hot
+    set from memory.
+    """
+
+    def __init__(self, l1: CacheTier, l2: CacheTier, config: CacheConfig | None = None) -> None:
+        """Initialize tiered cache.
+
+        Args:
+            l1: Fast first-level cache
+            l2: Larger, usually persistent, second-level cache
+            config: Cache configuration
+        """
+        super().__init__(config or CacheConfig(name="tiered-cache"))
+        self.l1 = l1
+        self.l2 = l2
+        self._l1_hits = 0
+        self._l2_hits = 0
+        self._misses = 0
+
+    async def _setup(self) -> None:
+        """Initialize both tiers."""
+        await self.l1.initialize()
+        await self.l2.initialize()
+
+    async def _teardown(self) -> None:
+        """Cleanup both tiers."""
+        await self.l1.cleanup()
+        await self.l2.cleanup()
+
+    async def get(self, key: str) -> Any:
+        """Get value from the first tier holding it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found, None otherwise
+        """
+        value = await self.l1.get(key)
+        if value is not None:
+            self._l1_hits += 1
+            return value
+        value = await self.l2.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        self._l2_hits += 1
+        await self.l1.set(key, value)
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Set value in both tiers.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        await self.l2.set(key, value)
+        await self.l1.set(key, value)
+
+    async def delete(self, key: str) -> None:
+        """Delete value from both tiers.
+
+        Args:
+            key: Cache key
+        """
+        await self.l1.delete(key)
+        await self.l2.delete(key)
+
+    async def clear(self) -> None:
+        """Clear both tiers."""
+        await self.l1.clear()
+        await self.l2.clear()
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Cache statistics
+        """
+        return {
+            "name": self.config.name,
+            "l1_hits": self._l1_hits,
+            "l2_hits": self._l2_hits,
+            "misses": self._misses,
+        }
+
+
+__all__ = ["CacheTier", "TieredCache"]
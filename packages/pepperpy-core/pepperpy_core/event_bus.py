@@ -0,0 +1,468 @@
+"""Cross-process event bus over Unix domain sockets."""
+
+import asyncio
+import importlib.util
+import os
+import stat
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any
+
+from .base import BaseConfigData
+from .events import Event, EventError, EventHandler, EventManager, Subscriber
+from .module import BaseModule
+
+_msgpack_spec = importlib.util.find_spec("msgpack")
+has_msgpack = bool(_msgpack_spec)
+
+# Frame kinds, each frame is one msgpack array starting with its kind
+_SUBSCRIBE = "s"
+_UNSUBSCRIBE = "u"
+_EVENT = "e"
+
+
+@dataclass
+class EventBusConfig(BaseConfigData):
+    """Event bus configuration."""
+
+    # Unix socket the hub listens on and clients connect to
+    path: str = "/tmp/pepperpy-events.sock"
+    # Bytes buffered for a peer before its events are dropped
+    max_buffer: int = 1 << 20
+    # Seconds between client reconnection attempts
+    reconnect_delay: float = 0.5
+    # Bytes read from the socket at a time
+    read_size: int = 1 << 16
+
+    def validate(self) -> None:
+        """Validate configuration."""
+        if not self.path:
+            raise ValueError("path is required")
+        if self.max_buffer < 1:
+            raise ValueError("max_buffer must be greater than 0")
+        if self.reconnect_delay <= 0:
+            raise ValueError("reconnect_delay must be greater than 0")
+        if self.read_size < 1:
+            raise ValueError("read_size must be greater than 0")
+
+
+def _load_msgpack() -> Any:
+    """Import msgpack, which frames events on the wire."""
+    if not has_msgpack:
+        raise ImportError("msgpack is not installed. Please install it with `pip install msgpack`")
+    import msgpack  # type: ignore
+
+    return msgpack
+
+
+class _Connection:
+    """Framed msgpack stream over a socket."""
+
+    def __init__(
+        self,
+        msgpack: Any,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        max_buffer: int,
+    ) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._packb = msgpack.packb
+        self._unpacker = msgpack.Unpacker(raw=False)
+        self._max_buffer = max_buffer
+        self.sent = 0
+        self.dropped = 0
+
+    def encode(self, *frame: Any) -> bytes:
+        """Encode a frame."""
+        return self._packb(frame, use_bin_type=True)
+
+    def send(self, data: bytes) -> bool:
+        """Write an encoded frame without waiting.
+
+        Frames are dropped instead of buffered without bound while the peer
+        does not keep up.
+
+        Returns:
+            True if the frame was written
+        """
+        transport = self._writer.transport
+        if transport.is_closing() or transport.get_write_buffer_size() > self._max_buffer:
+            self.dropped += 1
+            return False
+        self._writer.write(data)
+        self.sent += 1
+        return True
+
+    async def frames(self, read_size: int) -> Any:
+        """Iterate over received frames until the peer disconnects."""
+        while data := await self._reader.read(read_size):
+            self._unpacker.feed(data)
+            for frame in self._unpacker:
+                yield frame
+
+    async def close(self) -> None:
+        """Close the socket."""
+        self._writer.close()
+        with suppress(ConnectionError):
+            await self._writer.wait_closed()
+
+
+class _Peer:
+    """Client connected to the hub."""
+
+    def __init__(self, connection: _Connection) -> None:
+        self.connection = connection
+        self.patterns: set[str] = set()
+        self.last: bytes | None = None
+
+    def forward(self, event: Event) -> None:
+        """Routing handler, ``event.data`` holds the encoded frame."""
+        frame = event.data
+        # Overlapping patterns resolve to this peer once per pattern
+        if frame is not self.last:
+            self.last = frame
+            self.connection.send(frame)
+
+
+class EventBus(BaseModule[EventBusConfig]):
+    """Hub fanning events out to local processes.
+
+    The hub listens on a Unix socket, typically in the parent of pre-forked
+    workers, and each worker connects with an :class:`EventBusClient`.
+    Clients register the patterns they subscribe to, so the hub only writes
+    an event to the processes that want it. Events are encoded once per
+    publication as compact msgpack frames.
+
+    Events published by the hub or by any client reach the hub's own
+    :attr:`events` manager and every other subscribed client.
+    """
+
+    def __init__(self, config: EventBusConfig, events: EventManager | None = None) -> None:
+        """Initialize event bus.
+
+        Args:
+            config: Event bus configuration
+            events: Local event manager, a new one by default
+        """
+        super().__init__(config)
+        self.events = events or EventManager()
+        # Peers indexed by their subscriptions, reusing the topic trie
+        self._routes = EventManager()
+        self._peers: set[_Peer] = set()
+        self._readers: set[asyncio.Task[None]] = set()
+        self._server: asyncio.AbstractServer | None = None
+        self._accepting = False
+        self._msgpack: Any = None
+        self._published = 0
+
+    async def _setup(self) -> None:
+        """Setup event bus."""
+        self.config.validate()
+        self._msgpack = _load_msgpack()
+        await self._claim_path()
+        self.events.initialize()
+        self._routes.initialize()
+        self._accepting = True
+        self._server = await asyncio.start_unix_server(self._accept, path=self.config.path)
+
+    async def _claim_path(self) -> None:
+        """Remove a socket left behind by a hub that is gone.
+
+        Raises:
+            EventError: If another hub answers on the path or the path is
+                not a socket
+        """
+        path = self.config.path
+        try:
+            _, writer = await asyncio.open_unix_connection(path)
+        except FileNotFoundError:
+            return
+        except ConnectionRefusedError as e:
+            # Nothing listens, only a stale socket may be removed
+            with suppress(FileNotFoundError):
+                if not stat.S_ISSOCK(os.stat(path).st_mode):
+                    raise EventError(f"Event bus path is not a socket: {path}", cause=e)
+                os.unlink(path)
+            return
+        except OSError as e:
+            raise EventError(f"Event bus path cannot be checked: {path}", cause=e)
+        writer.close()
+        with suppress(ConnectionError):
+            await writer.wait_closed()
+        raise EventError(f"Another event bus hub is listening on {path}")
+
+    async def _teardown(self) -> None:
+        """Teardown event bus."""
+        self._accepting = False
+        if self._server is not None:
+            self._server.close()
+        # Drop the peers first, closing the server waits for them
+        for reader in list(self._readers):
+            reader.cancel()
+        for reader in list(self._readers):
+            with suppress(asyncio.CancelledError):
+                await reader
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        self._routes.cleanup()
+        with suppress(FileNotFoundError):
+            os.unlink(self.config.path)
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve a connected client."""
+        if not self._accepting:
+            # Accepted just before teardown, which no longer waits for it
+            writer.close()
+            return
+        task = asyncio.current_task()
+        assert task is not None
+        self._readers.add(task)
+        peer = _Peer(_Connection(self._msgpack, reader, writer, self.config.max_buffer))
+        self._peers.add(peer)
+        try:
+            async for frame in peer.connection.frames(self.config.read_size):
+                self._receive(peer, frame)
+        except (ConnectionError, ValueError, TypeError, IndexError):
+            # Reset connection or malformed frames, drop the peer
+            pass
+        finally:
+            for pattern in peer.patterns:
+                self._routes.unsubscribe(pattern, peer.forward)
+            self._peers.discard(peer)
+            self._readers.discard(task)
+            await peer.connection.close()
+
+    def _receive(self, peer: _Peer, frame: Any) -> None:
+        """Apply a frame sent by a client."""
+        kind = frame[0]
+        if kind == _EVENT:
+            event = Event(frame[1], frame[2], frame[3])
+            self._fan_out(event, peer)
+            # Handler failures belong to the hub, not to the sender
+            with suppress(EventError):
+                self.events.emit(event)
+        elif kind == _SUBSCRIBE and frame[1] not in peer.patterns:
+            self._routes.subscribe(frame[1], peer.forward)
+            peer.patterns.add(frame[1])
+        elif kind == _UNSUBSCRIBE and frame[1] in peer.patterns:
+            self._routes.unsubscribe(frame[1], peer.forward)
+            peer.patterns.discard(frame[1])
+
+    def _fan_out(self, event: Event, origin: _Peer | None = None) -> None:
+        """Write an event to the subscribed clients, except its origin."""
+        try:
+            frame = self._msgpack.packb(
+                (_EVENT, event.name, event.data, event.metadata), use_bin_type=True
+            )
+        except (TypeError, ValueError) as e:
+            raise EventError(f"Event cannot be encoded: {event.name}", cause=e)
+        if origin is not None:
+            # Mark the frame as already seen by its origin
+            origin.last = frame
+        self._routes.emit(Event(event.name, frame))
+        self._published += 1
+
+    def publish(self, event: Event) -> None:
+        """Publish an event locally and to every subscribed client.
+
+        Args:
+            event: Event data, msgpack serializable
+
+        Raises:
+            EventError: If the bus is not initialized, the event cannot be
+                encoded or a local inline handler failed
+        """
+        if not self.is_initialized:
+            raise EventError("Event bus not initialized")
+        self._fan_out(event)
+        self.events.emit(event)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get event bus statistics.
+
+        Returns:
+            Event bus statistics
+        """
+        return {
+            "name": self.config.name,
+            "path": self.config.path,
+            "peers": len(self._peers),
+            "subscriptions": sum(len(peer.patterns) for peer in self._peers),
+            "published": self._published,
+            "sent": sum(peer.connection.sent for peer in self._peers),
+            "dropped": sum(peer.connection.dropped for peer in self._peers),
+        }
+
+
+class EventBusClient(BaseModule[EventBusConfig]):
+    """Process-side end of an :class:`EventBus`.
+
+    Events received from the hub are emitted on :attr:`events`. The client
+    reconnects when the hub goes away and registers its subscriptions
+    again; events published while disconnected are dropped.
+    """
+
+    def __init__(self, config: EventBusConfig, events: EventManager | None = None) -> None:
+        """Initialize event bus client.
+
+        Args:
+            config: Event bus configuration
+            events: Local event manager, a new one by default
+        """
+        super().__init__(config)
+        self.events = events or EventManager()
+        self._patterns: dict[str, int] = {}
+        self._connection: _Connection | None = None
+        self._connected = asyncio.Event()
+        self._reader: asyncio.Task[None] | None = None
+        self._msgpack: Any = None
+        self._received = 0
+        self._dropped = 0
+
+    async def _setup(self) -> None:
+        """Setup event bus client."""
+        self.config.validate()
+        self._msgpack = _load_msgpack()
+        self.events.initialize()
+        self._reader = asyncio.create_task(self._run())
+
+    async def _teardown(self) -> None:
+        """Teardown event bus client."""
+        if self._reader is not None:
+            self._reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reader
+            self._reader = None
+
+    async def wait_connected(self, timeout: float | None = None) -> None:
+        """Wait until the client is connected to the hub.
+
+        Args:
+            timeout: Seconds to wait, None to wait forever
+
+        Raises:
+            TimeoutError: If the hub was not reached in time
+        """
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    async def _run(self) -> None:
+        """Keep a connection to the hub and emit received events."""
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.config.path)
+            except OSError:
+                await asyncio.sleep(self.config.reconnect_delay)
+                continue
+            connection = _Connection(self._msgpack, reader, writer, self.config.max_buffer)
+            for pattern in self._patterns:
+                connection.send(connection.encode(_SUBSCRIBE, pattern))
+            self._connection = connection
+            self._connected.set()
+            try:
+                async for frame in connection.frames(self.config.read_size):
+                    if frame[0] == _EVENT:
+                        self._received += 1
+                        with suppress(EventError):
+                            self.events.emit(Event(frame[1], frame[2], frame[3]))
+            except (ConnectionError, ValueError, TypeError, IndexError):
+                pass
+            finally:
+                self._connected.clear()
+                self._connection = None
+                await connection.close()
+            await asyncio.sleep(self.config.reconnect_delay)
+
+    def subscribe(self, pattern: str, handler: EventHandler, **options: Any) -> Subscriber | None:
+        """Subscribe to events published on the bus.
+
+        Args:
+            pattern: Event name or topic pattern with ``*`` and ``#``
+            handler: Event handler, sync or async
+            **options: Queue options of :meth:`EventManager.subscribe`
+
+        Returns:
+            Local subscriber
+
+        Raises:
+            EventError: If the client is not initialized
+        """
+        if not self.is_initialized:
+            raise EventError("Event bus client not initialized")
+        subscriber = self.events.subscribe(pattern, handler, **options)
+        self._patterns[pattern] = self._patterns.get(pattern, 0) + 1
+        if self._patterns[pattern] == 1 and self._connection is not None:
+            self._connection.send(self._connection.encode(_SUBSCRIBE, pattern))
+        return subscriber
+
+    def unsubscribe(self, pattern: str, handler: EventHandler) -> None:
+        """Unsubscribe from events published on the bus.
+
+        Args:
+            pattern: Event name or topic pattern
+            handler: Event handler
+
+        Raises:
+            EventError: If the client is not initialized
+        """
+        if not self.is_initialized:
+            raise EventError("Event bus client not initialized")
+        self.events.unsubscribe(pattern, handler)
+        if pattern not in self._patterns:
+            return
+        self._patterns[pattern] -= 1
+        if self._patterns[pattern] == 0:
+            del self._patterns[pattern]
+            if self._connection is not None:
+                self._connection.send(self._connection.encode(_UNSUBSCRIBE, pattern))
+
+    def publish(self, event: Event) -> bool:
+        """Publish an event locally and to the other processes.
+
+        Args:
+            event: Event data, msgpack serializable
+
+        Returns:
+            True if the event was handed to the hub
+
+        Raises:
+            EventError: If the client is not initialized, the event cannot
+                be encoded or a local inline handler failed
+        """
+        if not self.is_initialized:
+            raise EventError("Event bus client not initialized")
+        sent = False
+        if self._connection is not None:
+            try:
+                frame = self._connection.encode(_EVENT, event.name, event.data, event.metadata)
+            except (TypeError, ValueError) as e:
+                raise EventError(f"Event cannot be encoded: {event.name}", cause=e)
+            sent = self._connection.send(frame)
+        if not sent:
+            self._dropped += 1
+        self.events.emit(event)
+        return sent
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get event bus client statistics.
+
+        Returns:
+            Event bus client statistics
+        """
+        return {
+            "name": self.config.name,
+            "path": self.config.path,
+            "connected": self._connection is not None,
+            "patterns": len(self._patterns),
+            "received": self._received,
+            "dropped": self._dropped,
+        }
+
+
+__all__ = [
+    "EventBus",
+    "EventBusClient",
+    "EventBusConfig",
+    "has_msgpack",
+]
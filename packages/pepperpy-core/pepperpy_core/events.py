@@ -1,6 +1,10 @@
 """Event system implementation."""
 
-from collections.abc import Callable
+import asyncio
+import inspect
+import random
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -22,15 +26,322 @@ class Event:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-EventHandler = Callable[[Event], None]
+# Sync handlers return None, async handlers return an awaitable
+EventHandler = Callable[[Event], Any]
+
+OVERFLOW_POLICIES = ("drop_oldest", "block", "sample")
+
+# Queue size given to async handlers subscribed without one
+DEFAULT_QUEUE_SIZE = 1000
+
+# Resolved topics cached before the cache is reset
+_MATCH_CACHE_SIZE = 4096
+
+
+class Subscriber:
+    """Event subscriber.
+
+    Without a queue the handler runs inline in ``emit``. With a queue,
+    events are buffered and a dedicated consumer task runs the handler, so
+    a slow subscriber never delays the emitter or other subscribers. When
+    the queue is full the overflow policy applies:
+
+    - ``drop_oldest``: discard the oldest queued event
+    - ``block``: make ``publish`` wait for space
+    - ``sample``: admit a ``sample_rate`` fraction of events, each
+      replacing the oldest queued one, and discard the rest
+    """
+
+    def __init__(
+        self,
+        handler: EventHandler,
+        queue_size: int | None = None,
+        overflow: str = "drop_oldest",
+        sample_rate: float = 0.1,
+    ) -> None:
+        """Initialize subscriber.
+
+        Args:
+            handler: Event handler, sync or async
+            queue_size: Queue capacity, None to run a sync handler inline
+            overflow: Policy when the queue is full
+            sample_rate: Fraction of overflowing events kept by ``sample``
+
+        Raises:
+            ValueError: If the queue size, policy or sample rate is invalid
+        """
+        if queue_size is None and inspect.iscoroutinefunction(handler):
+            queue_size = DEFAULT_QUEUE_SIZE
+        if queue_size is not None and queue_size < 1:
+            raise ValueError("queue_size must be greater than 0")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.handler = handler
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.sample_rate = sample_rate
+        self._queue: deque[Event] = deque()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._consumer: asyncio.Task[None] | None = None
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_error: Exception | None = None
+
+    @property
+    def is_queued(self) -> bool:
+        """Check if events are delivered through a queue."""
+        return self.queue_size is not None
+
+    def deliver(self, event: Event) -> None:
+        """Run the handler inline.
+
+        Args:
+            event: Event data
+
+        Raises:
+            Exception: If the handler fails
+        """
+        try:
+            self.handler(event)
+        except Exception as e:
+            self.errors += 1
+            self.last_error = e
+            raise
+        self.delivered += 1
+
+    def offer(self, event: Event) -> bool:
+        """Queue an event without waiting.
+
+        A full ``block`` queue drops its oldest event, as there is no way
+        to wait here.
+
+        Args:
+            event: Event data
+
+        Returns:
+            True if the event was queued
+        """
+        assert self.queue_size is not None
+        if len(self._queue) >= self.queue_size:
+            if self.overflow == "sample" and random.random() >= self.sample_rate:
+                self.dropped += 1
+                return False
+            self._queue.popleft()
+            self.dropped += 1
+        self._enqueue(event)
+        return True
+
+    async def put(self, event: Event) -> bool:
+        """Queue an event, waiting for space under the ``block`` policy.
+
+        Args:
+            event: Event data
+
+        Returns:
+            True if the event was queued
+        """
+        assert self.queue_size is not None
+        if self.overflow != "block":
+            return self.offer(event)
+        while len(self._queue) >= self.queue_size:
+            self._space.clear()
+            await self._space.wait()
+        self._enqueue(event)
+        return True
+
+    def _enqueue(self, event: Event) -> None:
+        """Append an event and make sure the consumer is running."""
+        self._queue.append(event)
+        self._idle.clear()
+        self._ready.set()
+        if self._consumer is None:
+            try:
+                self._consumer = asyncio.get_running_loop().create_task(self._consume())
+            except RuntimeError:
+                # No loop yet, the first call from inside one starts it
+                pass
+
+    async def _consume(self) -> None:
+        """Run the handler for queued events, isolating its failures."""
+        while True:
+            while not self._queue:
+                self._idle.set()
+                self._ready.clear()
+                await self._ready.wait()
+            event = self._queue.popleft()
+            self._space.set()
+            try:
+                result = self.handler(event)
+                if inspect.isawaitable(result):
+                    await result
+                self.delivered += 1
+            except Exception as e:
+                self.errors += 1
+                self.last_error = e
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        if self._queue and self._consumer is None:
+            self._consumer = asyncio.get_running_loop().create_task(self._consume())
+        await self._idle.wait()
+
+    def close(self) -> None:
+        """Stop the consumer and discard queued events."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            self._consumer = None
+        self._queue.clear()
+        self._idle.set()
+        self._space.set()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get subscriber statistics.
+
+        Returns:
+            Subscriber statistics
+        """
+        return {
+            "queued": len(self._queue),
+            "queue_size": self.queue_size,
+            "overflow": self.overflow,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+
+class Coalescer:
+    """Debounce bursts of events sharing a key.
+
+    The first event of a burst is delivered right away (leading edge).
+    Later events are held back while they keep arriving less than
+    ``window`` seconds apart, and once the burst goes quiet the latest one
+    is delivered (trailing edge). ``max_wait`` bounds how long a steady
+    flood can hold back the trailing delivery.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[Event], Any],
+        window: float,
+        key: Callable[[Event], Hashable] | None = None,
+        max_wait: float | None = None,
+    ) -> None:
+        """Initialize coalescer.
+
+        Args:
+            deliver: Called with each event let through
+            window: Quiet seconds that end a burst
+            key: Groups events coalesced together, defaults to the topic
+            max_wait: Longest delay of a trailing delivery, None for no bound
+
+        Raises:
+            ValueError: If window or max_wait is not positive
+        """
+        if window <= 0:
+            raise ValueError("window must be greater than 0")
+        if max_wait is not None and max_wait <= 0:
+            raise ValueError("max_wait must be greater than 0")
+        self._deliver = deliver
+        self.window = window
+        self.max_wait = max_wait
+        self._key = key
+        # Per key: latest held event, trailing timer and burst start
+        self._bursts: dict[Hashable, list[Any]] = {}
+        self.coalesced = 0
+
+    def admit(self, event: Event) -> bool:
+        """Decide whether an event is delivered now.
+
+        Args:
+            event: Event data
+
+        Returns:
+            True on the leading edge, False if the event is held back
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Trailing deliveries need a loop, without one nothing coalesces
+            return True
+        key = event.name if self._key is None else self._key(event)
+        now = loop.time()
+        burst = self._bursts.get(key)
+        if burst is None:
+            timer = loop.call_later(self.window, self._flush, key)
+            self._bursts[key] = [None, timer, now]
+            return True
+
+        if burst[0] is not None:
+            self.coalesced += 1
+        burst[0] = event
+        burst[1].cancel()
+        delay = self.window
+        if self.max_wait is not None:
+            delay = max(0.0, min(delay, burst[2] + self.max_wait - now))
+        burst[1] = loop.call_later(delay, self._flush, key)
+        return False
+
+    def _flush(self, key: Hashable) -> None:
+        """End a burst, delivering its latest held event."""
+        event = self._bursts.pop(key)[0]
+        if event is not None:
+            self._deliver(event)
+
+    def close(self) -> None:
+        """Drop held events and cancel their timers."""
+        for burst in self._bursts.values():
+            burst[1].cancel()
+        self._bursts.clear()
+
+
+class _TopicNode:
+    """Topic trie node."""
+
+    __slots__ = ("children", "subscribers", "coalescer")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TopicNode] = {}
+        self.subscribers: list[Subscriber] = []
+        self.coalescer: Coalescer | None = None
+
+
+# Subscribers of a concrete topic and the coalescer applying to it
+_Route = tuple[tuple[Subscriber, ...], Coalescer | None]
 
 
 class EventManager:
-    """Event manager implementation."""
+    """Event manager implementation.
+
+    Event names are dot-separated topics. Subscriptions may use ``*`` to
+    match exactly one level and a trailing ``#`` to match any number of
+    levels, including none: ``files.read.*`` matches ``files.read.text``
+    and ``llm.#`` matches ``llm`` and ``llm.chat.done``. Patterns live in
+    a trie, so resolving a topic costs time proportional to its depth, and
+    resolved topics are cached until the subscriptions change.
+
+    Sync handlers subscribed without a queue run inline. Async handlers and
+    handlers subscribed with ``queue_size`` each get a bounded queue and a
+    consumer task, so emitting never waits on them.
+
+    Topics can opt in to coalescing with :meth:`coalesce`, merging bursts
+    of same-key events into single deliveries.
+    """
 
     def __init__(self) -> None:
         """Initialize event manager."""
-        self._handlers: dict[str, list[EventHandler]] = {}
+        # Subscribers by pattern, each list shared with its trie node
+        self._handlers: dict[str, list[Subscriber]] = {}
+        self._coalescers: dict[str, Coalescer] = {}
+        self._root = _TopicNode()
+        self._cache: dict[str, _Route] = {}
         self._initialized: bool = False
 
     def initialize(self) -> None:
@@ -43,27 +354,139 @@ class EventManager:
         """Cleanup event manager."""
         if not self._initialized:
             return
+        for subscribers in self._handlers.values():
+            for subscriber in subscribers:
+                subscriber.close()
+        for coalescer in self._coalescers.values():
+            coalescer.close()
         self._handlers.clear()
+        self._coalescers.clear()
+        self._root = _TopicNode()
+        self._cache.clear()
         self._initialized = False
 
-    def subscribe(self, event_name: str, handler: EventHandler | None = None) -> None:
+    def _node(self, pattern: str) -> _TopicNode:
+        """Get or create the trie node of a pattern."""
+        levels = pattern.split(".")
+        if "#" in levels[:-1]:
+            raise ValueError(f"'#' must be the last level of a pattern: {pattern}")
+        node = self._root
+        for level in levels:
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        return node
+
+    def _match(self, topic: str) -> _Route:
+        """Resolve the subscribers and coalescer of a concrete topic."""
+        cached = self._cache.get(topic)
+        if cached is not None:
+            return cached
+
+        matched: list[_TopicNode] = []
+        nodes = [self._root]
+        for level in topic.split("."):
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                if "#" in children:
+                    matched.append(children["#"])
+                if level in children:
+                    next_nodes.append(children[level])
+                if "*" in children:
+                    next_nodes.append(children["*"])
+            nodes = next_nodes
+            if not nodes:
+                break
+        for node in nodes:
+            matched.append(node)
+            if "#" in node.children:
+                matched.append(node.children["#"])
+
+        subscribers = tuple(s for node in matched for s in node.subscribers)
+        # The most specific pattern wins: exact levels are matched last
+        coalescer = next((node.coalescer for node in reversed(matched) if node.coalescer), None)
+        if len(self._cache) >= _MATCH_CACHE_SIZE:
+            self._cache.clear()
+        route = self._cache[topic] = (subscribers, coalescer)
+        return route
+
+    def coalesce(
+        self,
+        pattern: str,
+        window: float | None,
+        key: Callable[[Event], Hashable] | None = None,
+        max_wait: float | None = None,
+    ) -> None:
+        """Coalesce bursts of events on matching topics.
+
+        The first event of a burst is delivered immediately and the latest
+        one once no same-key event arrived for ``window`` seconds, the
+        ones in between are dropped.
+
+        Args:
+            pattern: Event name or topic pattern with ``*`` and ``#``
+            window: Quiet seconds that end a burst, None to stop coalescing
+            key: Groups events coalesced together, defaults to the topic
+            max_wait: Longest delay of a trailing delivery, None for no bound
+
+        Raises:
+            EventError: If event manager not initialized
+            ValueError: If the pattern or window is invalid
+        """
+        if not self._initialized:
+            raise EventError("Event manager not initialized")
+
+        node = self._node(pattern)
+        if node.coalescer is not None:
+            node.coalescer.close()
+            node.coalescer = None
+            del self._coalescers[pattern]
+        if window is not None:
+            node.coalescer = Coalescer(self._deliver_trailing, window, key, max_wait)
+            self._coalescers[pattern] = node.coalescer
+        self._cache.clear()
+
+    def subscribe(
+        self,
+        event_name: str,
+        handler: EventHandler | None = None,
+        *,
+        queue_size: int | None = None,
+        overflow: str = "drop_oldest",
+        sample_rate: float = 0.1,
+    ) -> Subscriber | None:
         """Subscribe to event.
 
         Args:
-            event_name: Event name
-            handler: Event handler
+            event_name: Event name or topic pattern with ``*`` and ``#``
+            handler: Event handler, sync or async
+            queue_size: Queue capacity for asynchronous delivery, None runs
+                sync handlers inline
+            overflow: Policy when the queue is full, one of ``drop_oldest``,
+                ``block`` or ``sample``
+            sample_rate: Fraction of overflowing events kept by ``sample``
+
+        Returns:
+            Subscriber, or None if no handler was given
 
         Raises:
             EventError: If event manager not initialized
+            ValueError: If the pattern or queue settings are invalid
         """
         if not self._initialized:
             raise EventError("Event manager not initialized")
 
         if event_name not in self._handlers:
-            self._handlers[event_name] = []
+            self._handlers[event_name] = self._node(event_name).subscribers
 
-        if handler:
-            self._handlers[event_name].append(handler)
+        if not handler:
+            return None
+        subscriber = Subscriber(handler, queue_size, overflow, sample_rate)
+        self._handlers[event_name].append(subscriber)
+        self._cache.clear()
+        return subscriber
 
     def unsubscribe(self, event_name: str, handler: EventHandler | None = None) -> None:
         """Unsubscribe from event.
@@ -81,28 +504,121 @@ class EventManager:
         if event_name not in self._handlers:
             return
 
-        if handler:
-            self._handlers[event_name].remove(handler)
-        else:
-            self._handlers[event_name].clear()
+        subscribers = self._handlers[event_name]
+        self._cache.clear()
+        if not handler:
+            for subscriber in subscribers:
+                subscriber.close()
+            subscribers.clear()
+            return
+
+        for subscriber in subscribers:
+            if subscriber.handler == handler:
+                subscriber.close()
+                subscribers.remove(subscriber)
+                return
+
+    def _dispatch(self, event: Event, subscribers: tuple[Subscriber, ...]) -> Exception | None:
+        """Deliver an event, returning the first inline handler error."""
+        error: Exception | None = None
+        for subscriber in subscribers:
+            if subscriber.is_queued:
+                subscriber.offer(event)
+                continue
+            try:
+                subscriber.deliver(event)
+            except Exception as e:
+                error = error or e
+        return error
+
+    def _deliver_trailing(self, event: Event) -> None:
+        """Deliver an event released by a coalescer."""
+        if self._initialized:
+            # Nobody to raise to, failures stay on the subscribers
+            self._dispatch(event, self._match(event.name)[0])
 
     def emit(self, event: Event) -> None:
-        """Emit event.
+        """Emit event without waiting for queued subscribers.
 
         Args:
             event: Event data
 
         Raises:
-            EventError: If event manager not initialized
+            EventError: If event manager not initialized, or if an inline
+                handler failed after every handler was called
+        """
+        self.emit_many((event,))
+
+    def emit_many(self, events: Iterable[Event]) -> None:
+        """Emit a batch of events without waiting for queued subscribers.
+
+        Args:
+            events: Events in delivery order
+
+        Raises:
+            EventError: If event manager not initialized, or if an inline
+                handler failed after every event was delivered
         """
         if not self._initialized:
             raise EventError("Event manager not initialized")
 
-        if event.name not in self._handlers:
-            return
+        error: Exception | None = None
+        match = self._match
+        for event in events:
+            subscribers, coalescer = match(event.name)
+            if coalescer is not None and not coalescer.admit(event):
+                continue
+            failure = self._dispatch(event, subscribers)
+            error = error or failure
+        if error is not None:
+            raise EventError(f"Event handler failed: {error}", cause=error)
 
-        for handler in self._handlers[event.name]:
+    async def publish(self, event: Event) -> None:
+        """Emit event, waiting for space in ``block`` subscriber queues.
+
+        Args:
+            event: Event data
+
+        Raises:
+            EventError: If event manager not initialized, or if an inline
+                handler failed after every handler was called
+        """
+        if not self._initialized:
+            raise EventError("Event manager not initialized")
+
+        subscribers, coalescer = self._match(event.name)
+        if coalescer is not None and not coalescer.admit(event):
+            return
+        error: Exception | None = None
+        for subscriber in subscribers:
+            if subscriber.is_queued:
+                await subscriber.put(event)
+                continue
             try:
-                handler(event)
+                subscriber.deliver(event)
             except Exception as e:
-                raise EventError(f"Event handler failed: {e}", cause=e)
+                error = error or e
+        if error is not None:
+            raise EventError(f"Event handler failed: {error}", cause=error)
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        for subscribers in list(self._handlers.values()):
+            for subscriber in list(subscribers):
+                await subscriber.join()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get event manager statistics.
+
+        Returns:
+            Subscriber statistics by event name or pattern
+        """
+        stats: dict[str, Any] = {
+            name: [subscriber.get_stats() for subscriber in subscribers]
+            for name, subscribers in self._handlers.items()
+        }
+        if self._coalescers:
+            stats["coalesced"] = {
+                pattern: coalescer.coalesced for pattern, coalescer in self._coalescers.items()
+            }
+        return stats
@@ -1,10 +1,26 @@
 """Metrics module exports."""
 
-from .base import MetricsConfig, MetricsCollector
+from .base import MetricsCollector, MetricsConfig
 from .decorators import timing
+from .exporter import OpenMetricsConfig, OpenMetricsExporter, render_openmetrics
+from .registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    default_registry,
+)
 
 __all__ = [
     "MetricsConfig",
     "MetricsCollector",
+    "MetricsRegistry",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "default_registry",
+    "OpenMetricsConfig",
+    "OpenMetricsExporter",
+    "render_openmetrics",
     "timing",
 ]
@@ -1,9 +1,12 @@
 """Base metrics implementation."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
 from ..module import BaseModule, ModuleConfig
+from .exceptions import MetricValueError
+from .registry import MetricFamily, MetricsRegistry
 
 
 @dataclass
@@ -30,17 +33,21 @@ class MetricsCollector(BaseModule[MetricsConfig]):
             config: Metrics configuration
         """
         super().__init__(config or MetricsConfig(name="metrics-collector"))
-        self._metrics: dict[str, Any] = {}
+        self._registry = MetricsRegistry()
+        # Recorded families, ordered from oldest to newest update
+        self._families: dict[str, MetricFamily] = {}
         self._count: int = 0
 
     async def _setup(self) -> None:
         """Setup metrics collector."""
-        self._metrics.clear()
+        self._registry = MetricsRegistry()
+        self._families.clear()
         self._count = 0
 
     async def _teardown(self) -> None:
         """Cleanup metrics collector."""
-        self._metrics.clear()
+        self._registry = MetricsRegistry()
+        self._families.clear()
         self._count = 0
 
     async def collect(
@@ -56,24 +63,50 @@ class MetricsCollector(BaseModule[MetricsConfig]):
         if not self.is_initialized:
             await self.initialize()
 
+        self.record(name, value, tags)
+
+    def record(self, name: str, value: Any, tags: dict[str, str] | None = None) -> None:
+        """Record metric without waiting, usable outside an event loop.
+
+        Args:
+            name: Metric name
+            value: Metric value
+            tags: Optional metric tags
+
+        Raises:
+            MetricValueError: If the value is not a number, or the tags
+                differ from those the metric was first recorded with
+        """
         if not self.config.enabled:
             return
-
-        self._metrics[name] = {
-            "value": value,
-            "tags": tags or {},
-            "timestamp": self._count,
-        }
+        if not isinstance(value, int | float):
+            raise MetricValueError(f"Metric {name} value must be a number")
+
+        tags = tags or {}
+        # Re-inserting keeps the dict ordered from oldest to newest update
+        family = self._families.pop(name, None)
+        if family is None:
+            family = self._registry.gauge(name, labels=sorted(tags))
+        self._families[name] = family
+        family.labels(**tags).set(value)
         self._count += 1
 
-        # Buffer management
-        if len(self._metrics) > self.config.buffer_size:
-            # Remove oldest metrics
-            sorted_metrics = sorted(
-                self._metrics.items(), key=lambda x: x[1]["timestamp"]
-            )
-            for name, _ in sorted_metrics[: -self.config.buffer_size]:
-                del self._metrics[name]
+        # Buffer management: remove oldest metrics
+        while len(self._families) > self.config.buffer_size:
+            oldest = self._families.pop(next(iter(self._families)))
+            self._registry.unregister(oldest.name)
+
+    def families(self) -> Iterator[MetricFamily]:
+        """Get the metrics as gauges, one series per tag combination.
+
+        Register this method with
+        :meth:`~pepperpy_core.metrics.MetricsRegistry.register_collector` to
+        export the collected metrics.
+
+        Yields:
+            Metric families
+        """
+        yield from self._registry.iter_families()
 
     async def get_stats(self) -> dict[str, Any]:
         """Get metrics statistics.
@@ -89,6 +122,6 @@ class MetricsCollector(BaseModule[MetricsConfig]):
             "enabled": self.config.enabled,
             "interval": self.config.interval,
             "buffer_size": self.config.buffer_size,
-            "metrics_count": len(self._metrics),
+            "metrics_count": len(self._families),
             "total_collected": self._count,
         }
@@ -2,11 +2,13 @@
 
 import asyncio
 import functools
+import itertools
 import time
 from collections.abc import Callable, Coroutine
 from typing import Any, ParamSpec, TypeVar, Union, cast
 
-from .base import MetricsCollector, MetricsConfig
+from .base import MetricsCollector
+from .registry import MetricsRegistry, default_registry
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -18,18 +20,40 @@ AsyncFunc = Callable[P, Coroutine[Any, Any, R]]
 AnyFunc = Union[SyncFunc[P, R], AsyncFunc[P, R]]
 
 
+def _check_sample(sample: int) -> None:
+    """Validate a sampling rate."""
+    if sample < 1:
+        raise ValueError("sample must be greater than 0")
+
+
 def timing(
     collector: MetricsCollector | None = None,
+    *,
+    registry: MetricsRegistry | None = None,
+    name: str | None = None,
+    sample: int = 1,
 ) -> Callable[[AnyFunc[P, R]], AnyFunc[P, R]]:
     """Decorator to measure function execution time.
 
+    Durations are recorded in seconds into a histogram of the registry,
+    named after the function unless ``name`` is given. Recording happens
+    in the calling thread and allocates nothing, so it suits hot
+    synchronous code and works without an event loop.
+
     Args:
-        collector: Optional metrics collector. If not provided, a new one will be created.
+        collector: Optional metrics collector also receiving each duration
+        registry: Registry holding the histogram, the default registry by default
+        name: Histogram name, ``<module>.<qualname>_seconds`` by default
+        sample: Time one call in this many, the others run untouched
 
     Returns:
         Decorated function
+
+    Raises:
+        ValueError: If sample is lower than 1
     """
-    metrics = collector or MetricsCollector(MetricsConfig(name="timing-metrics"))
+    _check_sample(sample)
+    registry = registry or default_registry
 
     def decorator(func: AnyFunc[P, R]) -> AnyFunc[P, R]:
         """Decorate function.
@@ -40,59 +64,83 @@ def timing(
         Returns:
             Decorated function
         """
+        key = f"{func.__module__}.{func.__qualname__}"
+        histogram = registry.histogram(
+            name or f"{key}_seconds", f"Execution time of {key}"
+        ).labels()
+        record = histogram.record
+        perf_counter = time.perf_counter
+        ticks = itertools.count()
+        tags = {"unit": "seconds"}
+
+        # Resolved once, subscripting the aliases on each call is costly
+        call = cast(SyncFunc[P, R], func)
+        call_async = cast(AsyncFunc[P, R], func)
+
         if asyncio.iscoroutinefunction(func):
 
             @functools.wraps(func)
             async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                start_time = time.perf_counter()
+                if sample > 1 and next(ticks) % sample:
+                    return await call_async(*args, **kwargs)
+                start_time = perf_counter()
                 try:
-                    result = await cast(AsyncFunc[P, R], func)(*args, **kwargs)
-                    return result
+                    return await call_async(*args, **kwargs)
                 finally:
-                    duration = time.perf_counter() - start_time
-                    await metrics.collect(
-                        name=f"{func.__module__}.{func.__qualname__}",
-                        value=duration,
-                        tags={"unit": "seconds"},
-                    )
+                    duration = perf_counter() - start_time
+                    record(duration)
+                    if collector is not None:
+                        await collector.collect(name=key, value=duration, tags=tags)
 
             return cast(AnyFunc[P, R], async_wrapper)
-        else:
 
-            @functools.wraps(func)
-            def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                start_time = time.perf_counter()
-                try:
-                    result = cast(SyncFunc[P, R], func)(*args, **kwargs)
-                    return result
-                finally:
-                    duration = time.perf_counter() - start_time
-                    # Criar task para coletar métricas de forma assíncrona
-                    asyncio.create_task(
-                        metrics.collect(
-                            name=f"{func.__module__}.{func.__qualname__}",
-                            value=duration,
-                            tags={"unit": "seconds"},
-                        )
-                    )
-
-            return cast(AnyFunc[P, R], sync_wrapper)
+        @functools.wraps(func)
+        def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if sample > 1 and next(ticks) % sample:
+                return call(*args, **kwargs)
+            start_time = perf_counter()
+            try:
+                return call(*args, **kwargs)
+            finally:
+                duration = perf_counter() - start_time
+                record(duration)
+                if collector is not None:
+                    collector.record(key, duration, tags)
+
+        return cast(AnyFunc[P, R], sync_wrapper)
 
     return decorator
 
 
 def count(
     collector: MetricsCollector | None = None,
+    *,
+    registry: MetricsRegistry | None = None,
+    name: str | None = None,
+    sample: int = 1,
 ) -> Callable[[AnyFunc[P, R]], AnyFunc[P, R]]:
     """Decorator to count function calls.
 
+    Calls are counted into a counter of the registry, named after the
+    function unless ``name`` is given, from the calling thread and
+    without an event loop. With sampling, one call in ``sample`` adds
+    ``sample`` to the counter, an unbiased estimate.
+
     Args:
-        collector: Optional metrics collector. If not provided, a new one will be created.
+        collector: Optional metrics collector also receiving the running
+            count on counted calls
+        registry: Registry holding the counter, the default registry by default
+        name: Counter name, ``<module>.<qualname>_calls_total`` by default
+        sample: Count one call in this many, the others run untouched
 
     Returns:
         Decorated function
+
+    Raises:
+        ValueError: If sample is lower than 1
     """
-    metrics = collector or MetricsCollector(MetricsConfig(name="count-metrics"))
+    _check_sample(sample)
+    registry = registry or default_registry
 
     def decorator(func: AnyFunc[P, R]) -> AnyFunc[P, R]:
         """Decorate function.
@@ -103,44 +151,42 @@ def count(
         Returns:
             Decorated function
         """
-        counter = 0
+        key = f"{func.__module__}.{func.__qualname__}"
+        counter = registry.counter(name or f"{key}_calls_total", f"Calls of {key}").labels()
+        inc = counter.inc
+        ticks = itertools.count()
+        tags = {"type": "counter"}
+
+        # Resolved once, subscripting the aliases on each call is costly
+        call = cast(SyncFunc[P, R], func)
+        call_async = cast(AsyncFunc[P, R], func)
 
         if asyncio.iscoroutinefunction(func):
 
             @functools.wraps(func)
             async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                nonlocal counter
-                counter += 1
+                if sample > 1 and next(ticks) % sample:
+                    return await call_async(*args, **kwargs)
+                inc(sample)
                 try:
-                    result = await cast(AsyncFunc[P, R], func)(*args, **kwargs)
-                    return result
+                    return await call_async(*args, **kwargs)
                 finally:
-                    await metrics.collect(
-                        name=f"{func.__module__}.{func.__qualname__}",
-                        value=counter,
-                        tags={"type": "counter"},
-                    )
+                    if collector is not None:
+                        await collector.collect(name=key, value=counter.value, tags=tags)
 
             return cast(AnyFunc[P, R], async_wrapper)
-        else:
 
-            @functools.wraps(func)
-            def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                nonlocal counter
-                counter += 1
-                try:
-                    result = cast(SyncFunc[P, R], func)(*args, **kwargs)
-                    return result
-                finally:
-                    # Criar task para coletar métricas de forma assíncrona
-                    asyncio.create_task(
-                        metrics.collect(
-                            name=f"{func.__module__}.{func.__qualname__}",
-                            value=counter,
-                            tags={"type": "counter"},
-                        )
-                    )
-
-            return cast(AnyFunc[P, R], sync_wrapper)
+        @functools.wraps(func)
+        def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if sample > 1 and next(ticks) % sample:
+                return call(*args, **kwargs)
+            inc(sample)
+            try:
+                return call(*args, **kwargs)
+            finally:
+                if collector is not None:
+                    collector.record(key, counter.value, tags)
+
+        return cast(AnyFunc[P, R], sync_wrapper)
 
     return decorator
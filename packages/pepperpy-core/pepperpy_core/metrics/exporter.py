@@ -0,0 +1,302 @@
+"""OpenMetrics exposition over HTTP."""
+
+import asyncio
+import math
+import re
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any
+
+from ..module import BaseModule, ModuleConfig
+from .registry import HistogramSnapshot, MetricsRegistry, default_registry
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_INVALID_NAME = re.compile(r"[^a-zA-Z0-9_:]")
+_INVALID_LABEL = re.compile(r"[^a-zA-Z0-9_]")
+_INF = 'le="+Inf"'
+# Sample name suffixes of each metric type
+_SUFFIXES = {
+    "counter": ("_total",),
+    "gauge": (),
+    "histogram": ("_bucket", "_count", "_sum"),
+}
+
+
+@dataclass
+class OpenMetricsConfig(ModuleConfig):
+    """OpenMetrics exporter configuration."""
+
+    host: str = "127.0.0.1"
+    port: int = 9464
+    path: str = "/metrics"
+    # Series rendered per scrape, the rest are left out
+    max_series: int = 10_000
+    # Buckets rendered per histogram series, neighbours are merged beyond
+    max_buckets: int = 64
+    # Seconds a rendered page is served again to further scrapes
+    cache_ttl: float = 1.0
+    # Seconds a client has to send its request
+    read_timeout: float = 5.0
+
+    def validate(self) -> None:
+        """Validate configuration."""
+        if not 0 <= self.port <= 65535:
+            raise ValueError("port must be between 0 and 65535")
+        if not self.path.startswith("/"):
+            raise ValueError("path must start with /")
+        if self.max_series < 1:
+            raise ValueError("max_series must be greater than 0")
+        if self.max_buckets < 1:
+            raise ValueError("max_buckets must be greater than 0")
+        if self.cache_ttl < 0:
+            raise ValueError("cache_ttl must be non-negative")
+        if self.read_timeout <= 0:
+            raise ValueError("read_timeout must be greater than 0")
+
+
+def _name(name: str) -> str:
+    """Make a valid metric name."""
+    name = _INVALID_NAME.sub("_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _label_name(name: str) -> str:
+    """Make a valid label name."""
+    name = _INVALID_LABEL.sub("_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _escape(value: str) -> str:
+    """Escape a label value or help text."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    """Format a sample value."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _labels(labels: dict[str, str], extra: str = "") -> str:
+    """Format a label set."""
+    pairs = [f'{_label_name(name)}="{_escape(str(value))}"' for name, value in labels.items()]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _buckets(snapshot: HistogramSnapshot, limit: int) -> list[tuple[float, int]]:
+    """Get cumulative buckets, merging neighbours down to a limit."""
+    step = math.ceil(len(snapshot.buckets) / limit) if snapshot.buckets else 1
+    cumulative = []
+    seen = 0
+    for index, (upper, count) in enumerate(snapshot.buckets):
+        seen += count
+        if (index + 1) % step == 0 or index == len(snapshot.buckets) - 1:
+            cumulative.append((upper, seen))
+    return cumulative
+
+
+def render_openmetrics(
+    registry: MetricsRegistry, max_series: int = 10_000, max_buckets: int = 64
+) -> tuple[str, bool]:
+    """Render a registry in the OpenMetrics text format.
+
+    Families and series are read lazily and reading stops at the series
+    limit, so collectors past it are never called. Families whose sanitized
+    name, or the name of one of their samples, was already rendered are
+    skipped, as a repeated family makes scrapers reject the whole page.
+
+    Args:
+        registry: Registry to render, including its collectors
+        max_series: Series rendered, the rest are left out
+        max_buckets: Buckets rendered per histogram series
+
+    Returns:
+        Exposition text, and whether series were left out
+    """
+    lines: list[str] = []
+    series = 0
+    taken: set[str] = set()
+    for family in registry.iter_families():
+        name = _name(family.name)
+        if family.kind == "counter" and name.endswith("_total"):
+            name = name[: -len("_total")]
+        names = {name, *(name + suffix for suffix in _SUFFIXES[family.kind])}
+        if not names.isdisjoint(taken):
+            continue
+        taken |= names
+        header = True
+        for labels, child in family.children():
+            if series >= max_series:
+                lines.append("# EOF")
+                return "\n".join(lines) + "\n", True
+            series += 1
+            if header:
+                lines.append(f"# TYPE {name} {family.kind}")
+                if family.help:
+                    lines.append(f"# HELP {name} {_escape(family.help)}")
+                header = False
+            if family.kind == "counter":
+                lines.append(f"{name}_total{_labels(labels)} {_number(child.value)}")
+            elif family.kind == "gauge":
+                lines.append(f"{name}{_labels(labels)} {_number(child.value)}")
+            else:
+                snapshot = child.snapshot()
+                for upper, count in _buckets(snapshot, max_buckets):
+                    le = _labels(labels, f'le="{_number(upper)}"')
+                    lines.append(f"{name}_bucket{le} {count}")
+                lines.append(f"{name}_bucket{_labels(labels, _INF)} {snapshot.count}")
+                lines.append(f"{name}_count{_labels(labels)} {snapshot.count}")
+                lines.append(f"{name}_sum{_labels(labels)} {_number(snapshot.total)}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n", False
+
+
+class OpenMetricsExporter(BaseModule[OpenMetricsConfig]):
+    """Serves a metrics registry to Prometheus-compatible scrapers.
+
+    A minimal asyncio HTTP server answers ``GET`` requests on the configured
+    path with the OpenMetrics text of the registry, including the metric
+    families of its registered collectors. A scrape renders at most
+    ``max_series`` series with ``max_buckets`` buckets each, in a worker
+    thread, and scrapes within ``cache_ttl`` of each other share one
+    rendering, so the cost of being scraped stays bounded however many
+    series exist.
+    """
+
+    def __init__(
+        self, config: OpenMetricsConfig | None = None, registry: MetricsRegistry | None = None
+    ) -> None:
+        """Initialize OpenMetrics exporter.
+
+        Args:
+            config: Exporter configuration
+            registry: Registry to serve, the default registry by default
+        """
+        super().__init__(config or OpenMetricsConfig(name="openmetrics-exporter"))
+        self.registry = registry or default_registry
+        self._server: asyncio.AbstractServer | None = None
+        self._page: bytes = b""
+        self._rendered_at: float | None = None
+        self._rendering = asyncio.Lock()
+        self._scrapes = 0
+        self._truncated = False
+
+    async def _setup(self) -> None:
+        """Setup OpenMetrics exporter."""
+        self.config.validate()
+        self._server = await asyncio.start_server(self._serve, self.config.host, self.config.port)
+
+    async def _teardown(self) -> None:
+        """Teardown OpenMetrics exporter."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._page = b""
+        self._rendered_at = None
+
+    @property
+    def port(self) -> int | None:
+        """Get the port the exporter listens on, useful when configured as 0."""
+        if self._server is None or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+
+    def _fresh(self) -> bool:
+        """Check if the last rendering is younger than the cache TTL."""
+        return (
+            self._rendered_at is not None
+            and time.monotonic() - self._rendered_at < self.config.cache_ttl
+        )
+
+    def _store(self, text: str, truncated: bool, started: float) -> bytes:
+        """Keep a rendering for the following scrapes."""
+        self._page = text.encode()
+        self._rendered_at = started
+        self._truncated = truncated
+        return self._page
+
+    def render(self) -> bytes:
+        """Render the registry, reusing a rendering younger than the cache TTL.
+
+        Returns:
+            Exposition text
+        """
+        if self._fresh():
+            return self._page
+        started = time.monotonic()
+        text, truncated = render_openmetrics(
+            self.registry, self.config.max_series, self.config.max_buckets
+        )
+        return self._store(text, truncated, started)
+
+    async def _scrape(self) -> bytes:
+        """Render for a scrape in a worker thread, keeping the loop responsive.
+
+        Concurrent scrapes wait for a single rendering.
+        """
+        async with self._rendering:
+            if self._fresh():
+                return self._page
+            started = time.monotonic()
+            text, truncated = await asyncio.to_thread(
+                render_openmetrics, self.registry, self.config.max_series, self.config.max_buckets
+            )
+            return self._store(text, truncated, started)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer one HTTP request."""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.config.read_timeout)
+            method, target, _ = head.split(b"\r\n", 1)[0].decode("latin-1").split(" ", 2)
+            path = target.split("?", 1)[0]
+            if method not in ("GET", "HEAD"):
+                status, body, content_type = "405 Method Not Allowed", b"", "text/plain"
+            elif path != self.config.path:
+                status, body, content_type = "404 Not Found", b"", "text/plain"
+            else:
+                self._scrapes += 1
+                status, body, content_type = "200 OK", await self._scrape(), CONTENT_TYPE
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+            )
+            if method != "HEAD":
+                writer.write(body)
+            await writer.drain()
+        except (TimeoutError, asyncio.IncompleteReadError, ValueError, ConnectionError):
+            # Slow, truncated or malformed request, drop the connection
+            pass
+        finally:
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get OpenMetrics exporter statistics.
+
+        Returns:
+            OpenMetrics exporter statistics
+        """
+        return {
+            "name": self.config.name,
+            "port": self.port,
+            "path": self.config.path,
+            "scrapes": self._scrapes,
+            "truncated": self._truncated,
+        }
+
+
+__all__ = [
+    "CONTENT_TYPE",
+    "OpenMetricsConfig",
+    "OpenMetricsExporter",
+    "render_openmetrics",
+]
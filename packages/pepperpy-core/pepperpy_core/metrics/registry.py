@@ -0,0 +1,578 @@
+"""High-frequency metrics registry."""
+
+import math
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from math import frexp
+from typing import Any
+
+from .exceptions import MetricError, MetricValueError
+
+# Default histogram range: one nanosecond to about eleven days in seconds
+DEFAULT_LOWEST = 1e-9
+DEFAULT_HIGHEST = 1e6
+
+
+class _Shard:
+    """Values recorded by one thread."""
+
+    __slots__ = ("value", "count", "total", "counts")
+
+    def __init__(self, buckets: int = 0) -> None:
+        self.value = 0.0
+        self.count = 0
+        self.total = 0.0
+        self.counts = [0] * buckets
+
+
+class _Owner:
+    """Thread-local token, collected when its thread exits."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire(ref: "weakref.ReferenceType[_Sharded]", shard: _Shard) -> None:
+    """Retire a dead thread's shard, unless its metric is gone too."""
+    metric = ref()
+    if metric is not None:
+        metric._retire(shard)
+
+
+class _Sharded:
+    """Metric keeping one shard per recording thread.
+
+    Each thread only ever writes its own shard, so recording takes no lock;
+    readers merge the shards, seeing every completed record. When a thread
+    exits its shard is folded into a single retired shard, so short-lived
+    threads do not grow the metric. The shard list is replaced rather than
+    changed in place, so readers always sum a consistent set.
+    """
+
+    _buckets = 0
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._retired: _Shard | None = None
+        self._lock = threading.RLock()
+
+    def _shard(self) -> _Shard:
+        """Create the calling thread's shard."""
+        shard = _Shard(self._buckets)
+        owner = _Owner()
+        weakref.finalize(owner, _retire, weakref.ref(self), shard)
+        with self._lock:
+            self._shards = [*self._shards, shard]
+        self._local.shard = shard
+        self._local.owner = owner
+        return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        """Fold a shard no thread writes anymore into the retired shard."""
+        with self._lock:
+            merged = _Shard(self._buckets)
+            for part in (self._retired, shard):
+                if part is None:
+                    continue
+                merged.value += part.value
+                merged.count += part.count
+                merged.total += part.total
+                for index, count in enumerate(part.counts):
+                    if count:
+                        merged.counts[index] += count
+            others = [s for s in self._shards if s is not shard and s is not self._retired]
+            self._retired = merged
+            self._shards = [merged, *others]
+
+
+class Counter(_Sharded):
+    """Monotonically increasing value."""
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative increment
+
+        Raises:
+            MetricValueError: If amount is negative
+        """
+        if amount < 0:
+            raise MetricValueError("Counter increment must be non-negative")
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        shard.value += amount
+
+    @property
+    def value(self) -> float:
+        """Get the counter value."""
+        return sum(shard.value for shard in self._shards)
+
+
+class Gauge(_Sharded):
+    """Value that goes up and down."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._base = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge.
+
+        Args:
+            value: New value
+        """
+        self._base = value - sum(shard.value for shard in self._shards)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge.
+
+        Args:
+            amount: Increment
+        """
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        shard.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge.
+
+        Args:
+            amount: Decrement
+        """
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        """Get the gauge value."""
+        return self._base + sum(shard.value for shard in self._shards)
+
+
+@dataclass
+class HistogramSnapshot:
+    """Merged state of a histogram."""
+
+    count: int
+    total: float
+    # Non-empty buckets as (upper bound, count), in increasing order
+    buckets: list[tuple[float, int]] = field(default_factory=list)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Upper bound of the bucket holding the quantile, 0.0 if empty
+        """
+        if not 0 <= q <= 1:
+            raise MetricValueError("Quantile must be between 0 and 1")
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for upper, count in self.buckets:
+            seen += count
+            if seen >= rank:
+                return upper
+        return 0.0
+
+
+class Histogram(_Sharded):
+    """Distribution in log-linear buckets, HDR histogram style.
+
+    Every power of two between ``lowest`` and ``highest`` is split into
+    ``2 ** precision`` equal buckets, bounding the relative error of any
+    quantile to ``2 ** -precision``. Recording computes a bucket index from
+    the float's exponent and mantissa, in constant time. Values outside
+    the range land in the first or last bucket, zero and negative values
+    in the first.
+    """
+
+    def __init__(
+        self,
+        lowest: float = DEFAULT_LOWEST,
+        highest: float = DEFAULT_HIGHEST,
+        precision: int = 5,
+    ) -> None:
+        """Initialize histogram.
+
+        Args:
+            lowest: Smallest value told apart from zero
+            highest: Largest value told apart from larger ones
+            precision: Bits of mantissa resolved, between 1 and 10
+
+        Raises:
+            MetricValueError: If the range or precision is invalid
+        """
+        if not 0 < lowest < highest:
+            raise MetricValueError("Histogram range must satisfy 0 < lowest < highest")
+        if not 1 <= precision <= 10:
+            raise MetricValueError("precision must be between 1 and 10")
+        super().__init__()
+        self._sub = 1 << precision
+        self._min_exp = math.frexp(lowest)[1]
+        self._buckets = (math.frexp(highest)[1] - self._min_exp + 1) * self._sub
+        self._last = self._buckets - 1
+        # The mantissa is in [0.5, 1), scaling it by twice the sub-bucket
+        # count picks one of the exponent's sub-buckets
+        self._scale = 2 * self._sub
+        self._offset = (self._min_exp + 1) * self._sub
+
+    def record(self, value: float) -> None:
+        """Record a value.
+
+        Args:
+            value: Observed value
+        """
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        if value > 0:
+            mantissa, exponent = frexp(value)
+            index = exponent * self._sub + int(mantissa * self._scale) - self._offset
+            if index < 0:
+                index = 0
+            elif index > self._last:
+                index = self._last
+        else:
+            index = 0
+        shard.counts[index] += 1
+        shard.count += 1
+        shard.total += value
+
+    def upper_bound(self, index: int) -> float:
+        """Get the upper bound of a bucket.
+
+        Args:
+            index: Bucket index
+
+        Returns:
+            Largest value recorded in the bucket
+        """
+        exponent, sub = divmod(index, self._sub)
+        return math.ldexp(0.5 + (sub + 1) / (2 * self._sub), exponent + self._min_exp)
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Merge the shards.
+
+        Returns:
+            Histogram snapshot
+        """
+        merged = [0] * self._buckets
+        count = 0
+        total = 0.0
+        for shard in list(self._shards):
+            count += shard.count
+            total += shard.total
+            for index, bucket in enumerate(shard.counts):
+                if bucket:
+                    merged[index] += bucket
+        buckets = [
+            (self.upper_bound(index), bucket) for index, bucket in enumerate(merged) if bucket
+        ]
+        return HistogramSnapshot(count, total, buckets)
+
+    def quantiles(self, *qs: float) -> list[float]:
+        """Estimate quantiles.
+
+        Args:
+            *qs: Quantiles between 0 and 1
+
+        Returns:
+            Estimates in the order asked
+        """
+        snapshot = self.snapshot()
+        return [snapshot.quantile(q) for q in qs]
+
+
+METRIC_TYPES: dict[str, type[_Sharded]] = {
+    "counter": Counter,
+    "gauge": Gauge,
+    "histogram": Histogram,
+}
+
+# Child methods a family without labels exposes directly
+_METHODS = ("inc", "dec", "set", "record", "snapshot", "quantiles")
+
+
+class MetricFamily:
+    """Metric of one name, with a child per label combination."""
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        help: str = "",
+        labels: Sequence[str] = (),
+        **options: Any,
+    ) -> None:
+        """Initialize metric family.
+
+        Args:
+            name: Metric name
+            kind: Metric type, counter, gauge or histogram
+            help: Description
+            labels: Label names
+            **options: Histogram range and precision
+        """
+        self.name = name
+        self.kind = kind
+        self.help = help
+        self.label_names = tuple(labels)
+        self._options = options
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        self._child: Any = None
+        if not self.label_names:
+            # Bind the unlabelled child's methods, so recording on the family
+            # costs the same as recording on the child
+            self._child = self.labels()
+            for method in _METHODS:
+                bound = getattr(self._child, method, None)
+                if bound is not None:
+                    setattr(self, method, bound)
+
+    def labels(self, *values: str, **labels: str) -> Any:
+        """Get the child for a label combination.
+
+        Keep the child around on hot paths, recording on it skips this
+        lookup.
+
+        Args:
+            *values: Label values in declaration order
+            **labels: Label values by name
+
+        Returns:
+            Counter, gauge or histogram
+
+        Raises:
+            MetricValueError: If the labels do not match the declared ones
+        """
+        if labels:
+            if values or labels.keys() != set(self.label_names):
+                raise MetricValueError(f"Expected labels {self.label_names} for {self.name}")
+            values = tuple(str(labels[name]) for name in self.label_names)
+        elif len(values) != len(self.label_names):
+            raise MetricValueError(f"Expected labels {self.label_names} for {self.name}")
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._children[values] = METRIC_TYPES[self.kind](**self._options)
+        return child
+
+    def children(self) -> Iterator[tuple[dict[str, str], Any]]:
+        """Iterate over the children and their labels."""
+        for values, child in list(self._children.items()):
+            yield dict(zip(self.label_names, values, strict=True)), child
+
+    def __getattr__(self, name: str) -> Any:
+        """Read the unlabelled child, e.g. ``family.value``."""
+        if name.startswith("_") or self._child is None:
+            raise AttributeError(name)
+        return getattr(self._child, name)
+
+
+class MetricsRegistry:
+    """Registry of counters, gauges and histograms.
+
+    Recording is designed for hot paths: counters and histograms write to
+    a per-thread shard without locks, and shards are only merged when the
+    registry is read.
+    """
+
+    def __init__(self) -> None:
+        """Initialize metrics registry."""
+        self._families: dict[str, MetricFamily] = {}
+        self._collectors: list[Callable[[], Iterable[MetricFamily]]] = []
+        self._lock = threading.Lock()
+
+    def _register(
+        self, name: str, kind: str, help: str, labels: Sequence[str], **options: Any
+    ) -> MetricFamily:
+        """Get or create a metric family."""
+        family = self._families.get(name)
+        if family is None:
+            with self._lock:
+                family = self._families.get(name)
+                if family is None:
+                    family = MetricFamily(name, kind, help, labels, **options)
+                    self._families[name] = family
+        if family.kind != kind or family.label_names != tuple(labels):
+            raise MetricError(f"Metric {name} already registered as a different {family.kind}")
+        return family
+
+    def counter(self, name: str, help: str = "", labels: Sequence[str] = ()) -> MetricFamily:
+        """Get or create a counter.
+
+        Args:
+            name: Metric name
+            help: Description
+            labels: Label names
+
+        Returns:
+            Counter family, record on it directly when it has no labels
+
+        Raises:
+            MetricError: If the name is registered with another type or labels
+        """
+        return self._register(name, "counter", help, labels)
+
+    def gauge(self, name: str, help: str = "", labels: Sequence[str] = ()) -> MetricFamily:
+        """Get or create a gauge.
+
+        Args:
+            name: Metric name
+            help: Description
+            labels: Label names
+
+        Returns:
+            Gauge family, record on it directly when it has no labels
+
+        Raises:
+            MetricError: If the name is registered with another type or labels
+        """
+        return self._register(name, "gauge", help, labels)
+
+    def histogram(
+        self,
+        name: str,
+        help: str = "",
+        labels: Sequence[str] = (),
+        lowest: float = DEFAULT_LOWEST,
+        highest: float = DEFAULT_HIGHEST,
+        precision: int = 5,
+    ) -> MetricFamily:
+        """Get or create a histogram.
+
+        Args:
+            name: Metric name
+            help: Description
+            labels: Label names
+            lowest: Smallest value told apart from zero
+            highest: Largest value told apart from larger ones
+            precision: Bits of mantissa resolved, between 1 and 10
+
+        Returns:
+            Histogram family, record on it directly when it has no labels
+
+        Raises:
+            MetricError: If the name is registered with another type or labels
+        """
+        return self._register(
+            name, "histogram", help, labels, lowest=lowest, highest=highest, precision=precision
+        )
+
+    def get(self, name: str) -> MetricFamily | None:
+        """Get a registered metric family.
+
+        Args:
+            name: Metric name
+
+        Returns:
+            Metric family, None if not registered
+        """
+        return self._families.get(name)
+
+    def iter_families(self) -> Iterator[MetricFamily]:
+        """Iterate over the registered metric families, then those of the collectors.
+
+        Collectors are only called when the iteration reaches them, so a
+        reader stopping early, like a bounded scrape, skips the rest. A
+        name is only given once: registered families take precedence over
+        collected ones, and earlier collectors over later ones.
+        """
+        families = list(self._families.values())
+        yield from families
+        seen = {family.name for family in families}
+        for collector in list(self._collectors):
+            for family in collector():
+                if family.name not in seen:
+                    seen.add(family.name)
+                    yield family
+
+    def families(self) -> list[MetricFamily]:
+        """Get the registered metric families, then those of the collectors."""
+        return list(self.iter_families())
+
+    def unregister(self, name: str) -> None:
+        """Remove a metric family.
+
+        Args:
+            name: Metric name
+        """
+        with self._lock:
+            self._families.pop(name, None)
+
+    def register_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """Add a source of metric families built when the registry is read.
+
+        This feeds metrics kept elsewhere, e.g. ``collector.families`` of a
+        :class:`~pepperpy_core.metrics.MetricsCollector`, to exporters.
+        Generators are read only as far as the reader needs.
+
+        Args:
+            collector: Function returning or yielding metric families
+        """
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def unregister_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """Remove a source of metric families.
+
+        Args:
+            collector: Function passed to :meth:`register_collector`
+        """
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def collect(self) -> dict[str, Any]:
+        """Read every metric, merging the shards.
+
+        Returns:
+            Values by metric name and label combination; histograms give
+            count, sum and the p50, p95 and p99 estimates
+        """
+        result: dict[str, Any] = {}
+        for family in self.families():
+            series = []
+            for labels, child in family.children():
+                if family.kind == "histogram":
+                    snapshot = child.snapshot()
+                    value: Any = {
+                        "count": snapshot.count,
+                        "sum": snapshot.total,
+                        "p50": snapshot.quantile(0.5),
+                        "p95": snapshot.quantile(0.95),
+                        "p99": snapshot.quantile(0.99),
+                    }
+                else:
+                    value = child.value
+                series.append({"labels": labels, "value": value})
+            result[family.name] = series
+        return result
+
+
+# Registry used when none is given explicitly
+default_registry = MetricsRegistry()
+
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "HistogramSnapshot",
+    "MetricFamily",
+    "MetricsRegistry",
+    "default_registry",
+]
@@ -1,6 +1,8 @@
 """Monitoring utilities."""
 
-from typing import Protocol, TypeVar
+from typing import Any, Protocol, TypeVar
+
+from .metrics.registry import default_registry
 
 
 # Define protocol for prometheus types
@@ -43,40 +45,72 @@ except ImportError:
 Counter = type[CounterProtocol] if prometheus_available else None
 Histogram = type[HistogramProtocol] if prometheus_available else None
 
+
+class _RegistryHistogram:
+    """Histogram of the default registry, mirrored to prometheus if installed.
+
+    Recording into the registry makes the metric available to the
+    OpenMetrics exporter whether or not prometheus_client is installed.
+    """
+
+    def __init__(self, target: Any, mirror: Any = None) -> None:
+        self._target = target
+        self._mirror = mirror
+
+    def observe(self, amount: float) -> None:
+        self._target.record(amount)
+        if self._mirror is not None:
+            self._mirror.observe(amount)
+
+    def labels(self, **kwargs: str) -> "_RegistryHistogram":
+        mirror = self._mirror.labels(**kwargs) if self._mirror is not None else None
+        return _RegistryHistogram(self._target.labels(**kwargs), mirror)
+
+
+class _RegistryCounter:
+    """Counter of the default registry, mirrored to prometheus if installed."""
+
+    def __init__(self, target: Any, mirror: Any = None) -> None:
+        self._target = target
+        self._mirror = mirror
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._target.inc(amount)
+        if self._mirror is not None:
+            self._mirror.inc(amount)
+
+    def labels(self, **kwargs: str) -> "_RegistryCounter":
+        mirror = self._mirror.labels(**kwargs) if self._mirror is not None else None
+        return _RegistryCounter(self._target.labels(**kwargs), mirror)
+
+
+def _histogram(name: str, help: str, label: str) -> HistogramProtocol:
+    """Create a histogram exported by the registry and prometheus."""
+    mirror = PromHistogram(name, help, [label]) if prometheus_available and PromHistogram else None
+    return _RegistryHistogram(default_registry.histogram(name, help, (label,)), mirror)
+
+
 # Component initialization time histogram
-COMPONENT_INIT_TIME: HistogramProtocol | None = (
-    PromHistogram(
-        "component_init_time_seconds",
-        "Time spent initializing components",
-        ["component_name"],
-    )
-    if prometheus_available and PromHistogram
-    else None
+COMPONENT_INIT_TIME: HistogramProtocol = _histogram(
+    "component_init_time_seconds", "Time spent initializing components", "component_name"
 )
 
 # Component cleanup time histogram
-COMPONENT_CLEANUP_TIME: HistogramProtocol | None = (
-    PromHistogram(
-        "component_cleanup_time_seconds",
-        "Time spent cleaning up components",
-        ["component_name"],
-    )
-    if prometheus_available and PromHistogram
-    else None
+COMPONENT_CLEANUP_TIME: HistogramProtocol = _histogram(
+    "component_cleanup_time_seconds", "Time spent cleaning up components", "component_name"
 )
 
 # Render time histogram
-RENDER_TIME: HistogramProtocol | None = (
-    PromHistogram("render_time_seconds", "Time spent rendering", ["template_name"])
-    if prometheus_available and PromHistogram
-    else None
+RENDER_TIME: HistogramProtocol = _histogram(
+    "render_time_seconds", "Time spent rendering", "template_name"
 )
 
 # Error counter
-ERROR_COUNT: CounterProtocol | None = (
+ERROR_COUNT: CounterProtocol = _RegistryCounter(
+    default_registry.counter("errors_total", "Number of errors", ("error_type",)),
     PromCounter("error_count", "Number of errors", ["error_type"])
     if prometheus_available and PromCounter
-    else None
+    else None,
 )
 
 
@@ -96,5 +130,4 @@ def record_error(error_type: str) -> None:
     Args:
         error_type: Type of error
     """
-    if ERROR_COUNT:
-        ERROR_COUNT.labels(error_type=error_type).inc()
+    ERROR_COUNT.labels(error_type=error_type).inc()
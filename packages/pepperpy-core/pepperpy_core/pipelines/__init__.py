@@ -3,15 +3,22 @@
 from typing import TypeVar
 
 from .base import Pipeline, PipelineStep
+from .cache import StepCache
+from .checkpoint import Checkpointer
 from .manager import PipelineManager
+from .profile import PipelineProfile, StepProfile
 
 InputT = TypeVar("InputT")
 OutputT = TypeVar("OutputT")
 
 __all__ = [
+    "Checkpointer",
     "Pipeline",
     "PipelineStep",
     "PipelineManager",
+    "PipelineProfile",
+    "StepCache",
+    "StepProfile",
     "InputT",
     "OutputT",
 ]
@@ -1,15 +1,45 @@
 """Base classes for pipeline implementation."""
 
+import asyncio
+import itertools
+import time
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from typing import Any, Generic, TypeVar
 
 from ..config.config import Config
+from .cache import CacheBackend, StepCache
+from .checkpoint import Checkpointer
+from .profile import PipelineProfile, StepProfile, peak_rss, timed_call
 
 InputT = TypeVar("InputT")
 OutputT = TypeVar("OutputT")
 StepInputT = TypeVar("StepInputT")
 StepOutputT = TypeVar("StepOutputT")
 
+EXECUTORS = ("coroutine", "thread", "process")
+
+# Marks the end of a stage's output
+_END = object()
+
+
+class _Failure:
+    """Stage error travelling down to the consumer."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
 
 @dataclass
 class PipelineConfig(Config):
@@ -17,6 +47,16 @@ class PipelineConfig(Config):
 
     name: str
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Items buffered between two streaming stages
+    queue_size: int = 16
+    # Keep stream outputs in input order when steps run several workers
+    ordered: bool = True
+    # Seconds a step may spend on one item, None for no limit
+    timeout: float | None = None
+    # Items processed between two checkpoints of a streaming run
+    checkpoint_every: int = 100
+    # Measure every step, see Pipeline.profile
+    profile: bool = True
 
 
 @dataclass
@@ -28,7 +68,26 @@ class PipelineResult(Generic[OutputT]):
 
 
 class PipelineStep(Generic[StepInputT, StepOutputT]):
-    """Base class for pipeline steps."""
+    """Base class for pipeline steps.
+
+    ``concurrency`` sets how many items a streaming pipeline hands to the
+    step at once. ``executor`` selects how an item is processed:
+    ``coroutine`` awaits :meth:`execute`, while ``thread`` and ``process``
+    run the synchronous :meth:`process` in a thread or a worker process,
+    for blocking or CPU-bound work.
+
+    Setting ``version`` opts the step in to result caching when its
+    pipeline has a cache; bump it whenever the step's code changes. Its
+    :meth:`cache_params` are part of the cache key too.
+    With ``checkpoint`` set, a checkpointed pipeline records the step's
+    inputs, so a run can restart from the step by its ``name``.
+    """
+
+    name: str | None = None
+    concurrency: int = 1
+    executor: str = "coroutine"
+    version: str | None = None
+    checkpoint: bool = False
 
     async def execute(self, input_data: StepInputT) -> StepOutputT:
         """Execute pipeline step.
@@ -41,27 +100,205 @@ class PipelineStep(Generic[StepInputT, StepOutputT]):
         """
         raise NotImplementedError
 
+    def process(self, input_data: StepInputT) -> StepOutputT:
+        """Process an item synchronously, for thread and process executors.
+
+        Args:
+            input_data: Input data to process
+
+        Returns:
+            Processed output data
+        """
+        raise NotImplementedError
+
+    def cache_params(self) -> Any:
+        """Get the settings the step's output depends on, for its cache key.
+
+        Defaults to the instance attributes as they are when the step is
+        added to a pipeline. Override it to leave out state or to replace
+        attributes that cannot be pickled, steps with unpicklable settings
+        are not cached.
+
+        Returns:
+            Picklable settings
+        """
+        return vars(self)
+
+    async def stream(self, items: AsyncIterator[StepInputT]) -> AsyncIterator[StepOutputT]:
+        """Process a stream of items.
+
+        Runs :meth:`execute` once per item by default. Steps that split,
+        batch or filter items override this instead; with a concurrency
+        above one each worker then runs its own stream over a share of the
+        items, and outputs come in completion order.
+
+        Args:
+            items: Input items
+
+        Yields:
+            Processed items
+        """
+        async for item in items:
+            yield await self.execute(item)
+
+
+def _streams(step: PipelineStep[Any, Any]) -> bool:
+    """Check if a step overrides stream instead of processing items."""
+    return type(step).stream is not PipelineStep.stream
+
+
+def step_name(step: PipelineStep[Any, Any]) -> str:
+    """Get a step's name, its class name by default."""
+    return step.name or type(step).__name__
+
 
 class Pipeline(Generic[InputT, OutputT]):
-    """Base pipeline implementation."""
+    """Base pipeline implementation.
 
-    def __init__(self, config: PipelineConfig) -> None:
+    ``budget`` and ``timeout`` are set by the :class:`PipelineManager` that
+    runs the pipeline: every item processed by a step holds a slot of the
+    shared budget and may take at most ``timeout`` seconds. Steps overriding
+    ``stream`` hold a slot and get ``timeout`` seconds per output, not
+    counting their waits for input.
+
+    With a ``cache``, outputs of versioned steps are memoized by input, so
+    only new or changed inputs are processed on a re-run. With a
+    ``checkpoints`` store, streaming runs persist their progress and can
+    resume after a crash.
+    """
+
+    def __init__(
+        self,
+        config: PipelineConfig,
+        cache: CacheBackend | None = None,
+        checkpoints: CacheBackend | None = None,
+    ) -> None:
         """Initialize pipeline.
 
         Args:
             config: Pipeline configuration
+            cache: Memory or disk cache for versioned step outputs
+            checkpoints: Memory or disk cache persisting run progress
         """
         self.config = config
         self._steps: list[PipelineStep[Any, Any]] = []
+        self.budget: asyncio.Semaphore | None = None
+        self.timeout = config.timeout
+        self.cache = StepCache(cache) if cache is not None else None
+        self.checkpoints = checkpoints
+        # Checkpointer of the latest streaming run
+        self.checkpointer: Checkpointer | None = None
+        # Step measurements of the latest run
+        self.last_profile: PipelineProfile | None = None
+        self._step_profiles: dict[int, StepProfile] = {}
+        self._processes: ProcessPoolExecutor | None = None
 
     def add_step(self, step: PipelineStep[Any, Any]) -> None:
         """Add step to pipeline.
 
         Args:
             step: Pipeline step to add
+
+        Raises:
+            ValueError: If the step's concurrency or executor is invalid
         """
+        if step.concurrency < 1:
+            raise ValueError("concurrency must be greater than 0")
+        if step.executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {step.executor}")
+        if self.cache is not None and step.version is not None:
+            self.cache.register(step)
         self._steps.append(step)
 
+    def close(self) -> None:
+        """Shut down the worker processes of process steps."""
+        if self._processes is not None:
+            self._processes.shutdown(cancel_futures=True)
+            self._processes = None
+
+    def _start_profile(self, steps: list[PipelineStep[Any, Any]]) -> PipelineProfile | None:
+        """Reset the step measurements for a new run."""
+        self._step_profiles = {}
+        if not self.config.profile:
+            return None
+        profile = PipelineProfile()
+        for step in steps:
+            stats = StepProfile(step_name(step), step.concurrency)
+            profile.steps.append(stats)
+            self._step_profiles[id(step)] = stats
+        self.last_profile = profile
+        return profile
+
+    def profile(self) -> str:
+        """Report the step measurements of the latest run.
+
+        The bottleneck is the step with the lowest capacity, the items per
+        second its workers sustain when never waiting: it is the step that
+        more concurrency would speed up.
+
+        Returns:
+            Profile report, empty if no run was profiled
+        """
+        return self.last_profile.report() if self.last_profile else ""
+
+    async def _call(self, step: PipelineStep[Any, Any], item: Any) -> Any:
+        """Process one item with a step, reusing its cached output."""
+        key = None
+        if self.cache is not None and step.version is not None:
+            key = self.cache.key(step, item)
+        if key is not None:
+            assert self.cache is not None
+            found, output = await self.cache.get(key)
+            if found:
+                if stats := self._step_profiles.get(id(step)):
+                    stats.cached += 1
+                return output
+
+        if self.budget is None:
+            output = await self._invoke(step, item)
+        else:
+            async with self.budget:
+                output = await self._invoke(step, item)
+        if key is not None:
+            assert self.cache is not None
+            await self.cache.set(key, output)
+        return output
+
+    async def _invoke(self, step: PipelineStep[Any, Any], item: Any) -> Any:
+        """Process one item with a step's executor, measuring it if profiled."""
+        stats = self._step_profiles.get(id(step))
+        if step.executor == "coroutine":
+            work = step.execute(item)
+        else:
+            pool = None
+            if step.executor == "process":
+                if self._processes is None:
+                    workers = sum(s.concurrency for s in self._steps if s.executor == "process")
+                    self._processes = ProcessPoolExecutor(workers)
+                pool = self._processes
+            loop = asyncio.get_running_loop()
+            if stats is None:
+                work = loop.run_in_executor(pool, step.process, item)
+            else:
+                # Measured where it runs, the loop thread's clock would miss it
+                work = loop.run_in_executor(pool, timed_call, step.process, item)
+        if self.timeout is not None:
+            work = asyncio.wait_for(work, self.timeout)
+        if stats is None:
+            return await work
+
+        started = time.perf_counter()
+        rss = peak_rss()
+        cpu = time.thread_time()
+        output = await work
+        if step.executor == "coroutine":
+            cpu = time.thread_time() - cpu
+            rss = peak_rss() - rss
+        else:
+            output, cpu, rss = output
+        stats.record(started, time.perf_counter() - started, cpu, rss)
+        return output
+
     async def execute(self, input_data: InputT) -> PipelineResult[OutputT]:
         """Execute pipeline.
 
@@ -72,10 +309,336 @@ class Pipeline(Generic[InputT, OutputT]):
             Pipeline execution result
         """
         current_data: Any = input_data
+        profile = self._start_profile(self._steps)
 
         for step in self._steps:
-            current_data = await step.execute(current_data)
+            current_data = await self._call(step, current_data)
+
+        metadata: dict[str, Any] = {"steps": len(self._steps)}
+        if self.cache is not None:
+            metadata["cache"] = self.cache.get_stats()
+        if profile is not None:
+            metadata["profile"] = profile.to_dict()
+        return PipelineResult[OutputT](output=current_data, metadata=metadata)
+
+    async def stream(
+        self,
+        inputs: Iterable[InputT] | AsyncIterable[InputT],
+        *,
+        start_at: str | None = None,
+    ) -> AsyncIterator[OutputT]:
+        """Execute pipeline over a stream of inputs.
+
+        Every step runs as its own stage of ``concurrency`` workers,
+        connected to the next stage by a queue of ``config.queue_size``
+        items, so step N works on an item while step N+1 still handles the
+        previous one. A full queue pauses the stage feeding it. Items carry
+        sequence numbers, so with ``config.ordered`` a stage of several
+        workers still emits them in input order.
+
+        With checkpoints, progress is saved every ``config.checkpoint_every``
+        consumed outputs and when the run stops. An output counts as
+        consumed once the next one is requested, so the last output handed
+        out before a crash is produced again on resume. Running again after an
+        unfinished run skips the inputs already done, which requires the
+        same inputs in the same order and steps producing one output per
+        item. ``start_at`` restarts from a step that recorded its inputs,
+        ignoring ``inputs``.
+
+        The first failure stops every stage and is raised here; closing the
+        iterator early stops them too.
+
+        Args:
+            inputs: Input items, sync or async iterable
+            start_at: Name of the step to restart from
+
+        Yields:
+            Output items
+
+        Raises:
+            ValueError: If the queue size, checkpoint settings or step name
+                are invalid
+        """
+        if self.config.queue_size < 1:
+            raise ValueError("queue_size must be greater than 0")
+        steps = self._steps
+        checkpointer = None
+        # Input positions of the items in flight, by sequence number
+        origin: dict[int, int] = {}
+        entries: AsyncGenerator[tuple[int, Any], None] = _enumerate(inputs)
+        if self.checkpoints is not None:
+            if self.config.checkpoint_every < 1:
+                raise ValueError("checkpoint_every must be greater than 0")
+            if start_at is not None:
+                names = [step_name(step) for step in steps]
+                if start_at not in names:
+                    raise ValueError(f"Unknown step: {start_at}")
+                steps = steps[names.index(start_at) :]
+            if any(_streams(step) for step in steps):
+                raise ValueError("Checkpointing needs steps producing one output per item")
+            checkpointer = Checkpointer(
+                self.checkpoints, self.config.name, self.config.checkpoint_every, start_at
+            )
+            await checkpointer.load()
+            self.checkpointer = checkpointer
+            if start_at is not None:
+                entries = checkpointer.replay(start_at)
+        elif start_at is not None:
+            raise ValueError("start_at needs a checkpoints store")
+
+        self._start_profile(steps)
+        queues = [asyncio.Queue[Any](self.config.queue_size) for _ in range(len(steps) + 1)]
+        source = _pending(entries, checkpointer, origin) if checkpointer else _values(entries)
+        stages = [asyncio.create_task(_feed(source, queues[0]))]
+        for index, (step, inbound, outbound) in enumerate(
+            zip(steps, queues, queues[1:], strict=False)
+        ):
+            record = None
+            # The step restarted from already has its inputs recorded
+            if checkpointer and step.checkpoint and not (start_at and index == 0):
+                recorder = await checkpointer.recorder(step_name(step))
+                record = _recording(recorder.add, origin)
+            stages.append(asyncio.create_task(self._run_stage(step, inbound, outbound, record)))
+
+        def stop(stage: asyncio.Task[None]) -> None:
+            # A failed stage reports to the consumer and stops the others
+            if not stage.cancelled() and stage.exception() is not None:
+                for other in stages:
+                    other.cancel()
+                # Raise right away rather than after the buffered outputs
+                while not queues[-1].empty():
+                    queues[-1].get_nowait()
+                queues[-1].put_nowait(_Failure(stage.exception()))
+
+        for stage in stages:
+            stage.add_done_callback(stop)
+        finished = False
+        try:
+            while (entry := await queues[-1].get()) is not _END:
+                if isinstance(entry, _Failure):
+                    raise entry.error
+                yield entry[1]
+                if checkpointer and checkpointer.complete(origin.pop(entry[0])):
+                    await checkpointer.save()
+            finished = True
+        finally:
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            if checkpointer:
+                await checkpointer.save(finished)
+
+    async def _run_stage(
+        self,
+        step: PipelineStep[Any, Any],
+        inbound: asyncio.Queue[Any],
+        outbound: asyncio.Queue[Any],
+        record: Callable[[int, Any], Awaitable[None]] | None = None,
+    ) -> None:
+        """Run a step's workers between two queues."""
+        stats = self._step_profiles.get(id(step))
+        if _streams(step):
+            counter = itertools.count()
+
+            async def work() -> None:
+                meter = _Meter(self.budget, self.timeout)
+                items = meter.inputs(_drain(inbound))
+                async with aclosing(items), aclosing(step.stream(items)) as outputs:
+                    if stats is None:
+                        while (item := await meter.pull(outputs)) is not _END:
+                            await outbound.put((next(counter), item))
+                        return
+                    # Items are not seen one by one, so the time between two
+                    # outputs counts as processing, input waits included
+                    started, rss, cpu = time.perf_counter(), peak_rss(), time.thread_time()
+                    while (item := await meter.pull(outputs)) is not _END:
+                        now = time.perf_counter()
+                        stats.record(
+                            started, now - started, time.thread_time() - cpu, peak_rss() - rss
+                        )
+                        await outbound.put((next(counter), item))
+                        started, rss, cpu = time.perf_counter(), peak_rss(), time.thread_time()
+                        stats.wait_out += started - now
+
+        else:
+            reorder = None
+            if self.config.ordered and step.concurrency > 1:
+                reorder = _Reorder(outbound, step.concurrency + self.config.queue_size)
+
+            async def work() -> None:
+                while True:
+                    waited = time.perf_counter()
+                    entry = await inbound.get()
+                    if stats is not None:
+                        stats.wait_in += time.perf_counter() - waited
+                    if entry is _END:
+                        break
+                    seq, item = entry
+                    if record is not None:
+                        await record(seq, item)
+                    if reorder is not None:
+                        await reorder.reserve(seq)
+                    output = await self._call(step, item)
+                    waited = time.perf_counter()
+                    if reorder is None:
+                        await outbound.put((seq, output))
+                    else:
+                        await reorder.put(seq, output)
+                    if stats is not None:
+                        stats.wait_out += time.perf_counter() - waited
+                # Let the sibling workers see the end too
+                inbound.put_nowait(_END)
+
+        await asyncio.gather(*(work() for _ in range(step.concurrency)))
+        await outbound.put(_END)
+
+
+class _Meter:
+    """Budget slot and timeout of a worker of a step overriding stream.
+
+    While the step works towards its next output the worker holds a slot
+    of the budget and the timeout runs; both are paused whenever the step
+    waits for input, so only processing counts, as for other steps.
+    """
+
+    def __init__(self, budget: asyncio.Semaphore | None, timeout: float | None) -> None:
+        self._budget = budget
+        self._timeout = timeout
+        self._held = False
+        self._deadline: asyncio.Timeout | None = None
+
+    async def _resume(self) -> None:
+        """Take a budget slot and restart the timeout."""
+        if self._budget is not None and not self._held:
+            await self._budget.acquire()
+            self._held = True
+        deadline = self._deadline
+        if deadline is not None and self._timeout is not None and not deadline.expired():
+            deadline.reschedule(asyncio.get_running_loop().time() + self._timeout)
+
+    def _pause(self) -> None:
+        """Give the budget slot back and stop the timeout."""
+        if self._held:
+            assert self._budget is not None
+            self._budget.release()
+            self._held = False
+        if self._deadline is not None and not self._deadline.expired():
+            self._deadline.reschedule(None)
+
+    async def pull(self, outputs: AsyncIterator[Any]) -> Any:
+        """Get the step's next output, ``_END`` once it is done.
+
+        Raises:
+            TimeoutError: If the step processed longer than the timeout
+        """
+        async with asyncio.timeout(None) as self._deadline:
+            try:
+                await self._resume()
+                return await anext(outputs, _END)
+            finally:
+                self._pause()
+                self._deadline = None
+
+    async def inputs(self, items: AsyncGenerator[Any, None]) -> AsyncGenerator[Any, None]:
+        """Hand items to the step, pausing while it waits for them."""
+        async with aclosing(items):
+            while True:
+                self._pause()
+                try:
+                    item = await anext(items)
+                except StopAsyncIteration:
+                    return
+                await self._resume()
+                yield item
+
+
+class _Reorder:
+    """Release items to a queue in sequence order."""
+
+    def __init__(self, queue: asyncio.Queue[Any], window: int) -> None:
+        self._queue = queue
+        # Items may start at most this far ahead of the next one released
+        self._window = window
+        self._next = 0
+        self._done: dict[int, Any] = {}
+        self._moved = asyncio.Condition()
+
+    async def reserve(self, seq: int) -> None:
+        """Wait until an item may start without outrunning the window."""
+        async with self._moved:
+            await self._moved.wait_for(lambda: seq < self._next + self._window)
+
+    async def put(self, seq: int, item: Any) -> None:
+        """Add a finished item, releasing every item now in order."""
+        async with self._moved:
+            self._done[seq] = item
+            while self._next in self._done:
+                await self._queue.put((self._next, self._done.pop(self._next)))
+                self._next += 1
+            self._moved.notify_all()
+
+
+async def _enumerate(
+    items: Iterable[Any] | AsyncIterable[Any],
+) -> AsyncGenerator[tuple[int, Any], None]:
+    """Number sync or async inputs by position."""
+    position = 0
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield position, item
+            position += 1
+    else:
+        for item in items:
+            yield position, item
+            position += 1
+
+
+async def _values(entries: AsyncGenerator[tuple[int, Any], None]) -> AsyncGenerator[Any, None]:
+    """Drop the positions of numbered inputs."""
+    async with aclosing(entries):
+        async for _, item in entries:
+            yield item
+
+
+async def _pending(
+    entries: AsyncGenerator[tuple[int, Any], None],
+    checkpointer: Checkpointer,
+    origin: dict[int, int],
+) -> AsyncGenerator[Any, None]:
+    """Skip inputs done before, remembering the positions of the others."""
+    seq = 0
+    async with aclosing(entries):
+        async for position, item in entries:
+            if not checkpointer.is_done(position):
+                origin[seq] = position
+                seq += 1
+                yield item
+
+
+def _recording(
+    add: Callable[[int, Any], Awaitable[None]], origin: dict[int, int]
+) -> Callable[[int, Any], Awaitable[None]]:
+    """Record step inputs under their input positions."""
+
+    def record(seq: int, item: Any) -> Awaitable[None]:
+        return add(origin[seq], item)
+
+    return record
+
+
+async def _feed(items: AsyncIterable[Any], queue: asyncio.Queue[Any]) -> None:
+    """Queue inputs with their sequence numbers."""
+    seq = 0
+    async with aclosing(items):
+        async for item in items:
+            await queue.put((seq, item))
+            seq += 1
+    await queue.put(_END)
+
 
-        return PipelineResult[OutputT](
-            output=current_data, metadata={"steps": len(self._steps)}
-        )
+async def _drain(queue: asyncio.Queue[Any]) -> AsyncGenerator[Any, None]:
+    """Iterate over a stage's queue until its end marker."""
+    while (entry := await queue.get()) is not _END:
+        yield entry[1]
+    # Let the sibling workers see the end too
+    queue.put_nowait(_END)
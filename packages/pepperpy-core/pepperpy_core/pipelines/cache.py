@@ -0,0 +1,123 @@
+"""Pipeline step result caching."""
+
+import hashlib
+import inspect
+import pickle
+from typing import Any, Protocol
+
+
+class CacheBackend(Protocol):
+    """Cache the step outputs are stored in.
+
+    Both the synchronous :class:`~pepperpy_core.cache.memory.MemoryCache`
+    and the asynchronous :class:`~pepperpy_core.cache.disk.DiskCache` fit.
+    """
+
+    def get(self, key: str) -> Any:
+        """Get value from cache, None if missing."""
+        ...
+
+    def set(self, key: str, value: Any) -> Any:
+        """Set value in cache."""
+        ...
+
+
+class StepCache:
+    """Step outputs keyed by a content hash of their input.
+
+    A key covers the step's class, its ``version``, its settings and the
+    pickled input, so re-running a pipeline over unchanged inputs skips the
+    work and bumping the version of a changed step invalidates its outputs
+    only. Settings are the step's :meth:`cache_params`, taken when the step
+    is registered, so instances configured differently never share outputs.
+    """
+
+    def __init__(self, backend: CacheBackend) -> None:
+        """Initialize step cache.
+
+        Args:
+            backend: Cache storing the outputs
+        """
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        # Settings digest of each registered step, None when not picklable
+        self._identities: dict[int, str | None] = {}
+
+    @staticmethod
+    def _digest(value: Any) -> str | None:
+        """Hash a picklable value, None if it cannot be pickled."""
+        try:
+            data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def register(self, step: Any) -> None:
+        """Take the settings of a step, before it runs and changes state.
+
+        Args:
+            step: Pipeline step declaring a version
+        """
+        self._identities[id(step)] = self._digest((step.name, step.cache_params()))
+
+    def key(self, step: Any, item: Any) -> str | None:
+        """Build the cache key of a step input.
+
+        Args:
+            step: Pipeline step declaring a version
+            item: Step input
+
+        Returns:
+            Cache key, or None if the input or the step's settings cannot
+            be pickled
+        """
+        if id(step) not in self._identities:
+            self.register(step)
+        identity = self._identities[id(step)]
+        digest = self._digest(item)
+        if identity is None or digest is None:
+            return None
+        step_type = type(step)
+        return (
+            f"pipeline:{step_type.__module__}.{step_type.__qualname__}:{step.version}:"
+            f"{identity}:{digest}"
+        )
+
+    async def get(self, key: str) -> tuple[bool, Any]:
+        """Look up a step output.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Whether the output was found, and the output
+        """
+        stored = self.backend.get(key)
+        if inspect.isawaitable(stored):
+            stored = await stored
+        # Outputs are boxed so a cached None is told apart from a miss
+        if stored is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, stored[0]
+
+    async def set(self, key: str, output: Any) -> None:
+        """Store a step output.
+
+        Args:
+            key: Cache key
+            output: Step output
+        """
+        result = self.backend.set(key, [output])
+        if inspect.isawaitable(result):
+            await result
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get step cache statistics.
+
+        Returns:
+            Step cache statistics
+        """
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,188 @@
+"""Pipeline checkpointing."""
+
+import inspect
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from .cache import CacheBackend
+
+
+class StepRecorder:
+    """Persists the inputs of a step in chunks."""
+
+    def __init__(self, checkpointer: "Checkpointer", step: str, chunks: int) -> None:
+        """Initialize step recorder.
+
+        Args:
+            checkpointer: Checkpointer owning the recorder
+            step: Step name
+            chunks: Chunks already stored for the step
+        """
+        self._checkpointer = checkpointer
+        self.step = step
+        self.chunks = chunks
+        self._buffer: list[list[Any]] = []
+
+    async def add(self, item_id: int, item: Any) -> None:
+        """Record a step input, storing a chunk once it is full.
+
+        Args:
+            item_id: Position of the input in the run
+            item: Step input
+        """
+        self._buffer.append([item_id, item])
+        if len(self._buffer) >= self._checkpointer.every:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Store the buffered inputs."""
+        if not self._buffer:
+            return
+        key = self._checkpointer.inputs_key(self.step)
+        chunk, self._buffer = self._buffer, []
+        await self._checkpointer.store(f"{key}:{self.chunks}", chunk)
+        self.chunks += 1
+        await self._checkpointer.store(key, self.chunks)
+
+
+class Checkpointer:
+    """Progress and recorded step inputs of a pipeline run.
+
+    Progress is the set of input positions whose outputs were consumed,
+    kept as a watermark below which every input is done plus the done
+    positions above it. A run that stops before the end resumes by
+    skipping those positions.
+    """
+
+    def __init__(
+        self, backend: CacheBackend, run: str, every: int, start_at: str | None = None
+    ) -> None:
+        """Initialize checkpointer.
+
+        Args:
+            backend: Cache persisting checkpoints
+            run: Run name, the pipeline name
+            every: Items between two checkpoints
+            start_at: Step the run restarts from, None for the first step
+        """
+        self.backend = backend
+        self.run = run
+        self.every = every
+        self._state_key = f"checkpoint:{run}:state"
+        if start_at is not None:
+            self._state_key += f":{start_at}"
+        self.resumed = False
+        self.watermark = 0
+        self._done: set[int] = set()
+        self._since_save = 0
+        self._recorders: list[StepRecorder] = []
+
+    async def load(self) -> None:
+        """Load the progress of an unfinished run."""
+        state = await self.fetch(self._state_key)
+        if state and state.get("active"):
+            self.resumed = True
+            self.watermark = state["watermark"]
+            self._done = set(state["done"])
+
+    async def fetch(self, key: str) -> Any:
+        """Get a value from the backend."""
+        value = self.backend.get(key)
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    async def store(self, key: str, value: Any) -> None:
+        """Set a value in the backend."""
+        result = self.backend.set(key, value)
+        if inspect.isawaitable(result):
+            await result
+
+    def inputs_key(self, step: str) -> str:
+        """Get the key of a step's recorded inputs."""
+        return f"checkpoint:{self.run}:inputs:{step}"
+
+    def is_done(self, item_id: int) -> bool:
+        """Check if an input was fully processed by a previous attempt."""
+        return item_id < self.watermark or item_id in self._done
+
+    def complete(self, item_id: int) -> bool:
+        """Mark an input done.
+
+        Args:
+            item_id: Input position
+
+        Returns:
+            True once a checkpoint is due
+        """
+        self._done.add(item_id)
+        while self.watermark in self._done:
+            self._done.remove(self.watermark)
+            self.watermark += 1
+        self._since_save += 1
+        return self._since_save >= self.every
+
+    async def recorder(self, step: str) -> StepRecorder:
+        """Get a recorder for a step's inputs.
+
+        A resumed run appends to the inputs recorded before, a new run
+        replaces them.
+
+        Args:
+            step: Step name
+
+        Returns:
+            Step recorder
+        """
+        if self.resumed:
+            chunks = await self.fetch(self.inputs_key(step)) or 0
+        else:
+            chunks = 0
+            await self.store(self.inputs_key(step), chunks)
+        recorder = StepRecorder(self, step, chunks)
+        self._recorders.append(recorder)
+        return recorder
+
+    async def replay(self, step: str) -> AsyncGenerator[tuple[int, Any], None]:
+        """Iterate over the recorded inputs of a step.
+
+        Args:
+            step: Step name
+
+        Yields:
+            Input positions and inputs
+        """
+        key = self.inputs_key(step)
+        chunks = await self.fetch(key) or 0
+        # A resumed run records again the inputs in flight when it stopped
+        seen: set[int] = set()
+        for index in range(chunks):
+            for item_id, item in await self.fetch(f"{key}:{index}") or ():
+                if item_id not in seen:
+                    seen.add(item_id)
+                    yield item_id, item
+
+    async def save(self, finished: bool = False) -> None:
+        """Persist recorded inputs, then the progress.
+
+        Args:
+            finished: Whether the run completed, so the next one starts over
+        """
+        for recorder in self._recorders:
+            await recorder.flush()
+        state = {"active": not finished, "watermark": self.watermark, "done": sorted(self._done)}
+        await self.store(self._state_key, state)
+        self._since_save = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get checkpoint statistics.
+
+        Returns:
+            Checkpoint statistics
+        """
+        return {
+            "run": self.run,
+            "resumed": self.resumed,
+            "watermark": self.watermark,
+            "pending": len(self._done),
+        }
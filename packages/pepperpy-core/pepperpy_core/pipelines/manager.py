@@ -1,9 +1,14 @@
 """Pipeline manager module."""
 
+import asyncio
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from typing import Any
 
 from ..base import BaseConfigData, BaseManager
+from .base import Pipeline, PipelineResult
 
 
 @dataclass
@@ -15,7 +20,9 @@ class PipelineConfig(BaseConfigData):
 
     # Optional fields
     enabled: bool = True
+    # Step executions running at once across every active pipeline
     max_concurrent: int = 10
+    # Seconds a step may spend on one item, unless the pipeline sets it
     timeout: float = 60.0
     metadata: dict[str, Any] = field(default_factory=dict)
 
@@ -28,23 +35,111 @@ class PipelineConfig(BaseConfigData):
 
 
 class PipelineManager(BaseManager[PipelineConfig]):
-    """Pipeline manager implementation."""
+    """Pipeline manager implementation.
 
-    def __init__(self) -> None:
-        """Initialize pipeline manager."""
-        config = PipelineConfig()
-        super().__init__(config)
+    Pipelines run through the manager share a budget of ``max_concurrent``
+    step executions, whatever their number, stages and workers, so adding
+    pipelines or workers never oversubscribes the process.
+    """
+
+    def __init__(self, config: PipelineConfig | None = None) -> None:
+        """Initialize pipeline manager.
+
+        Args:
+            config: Pipeline manager configuration
+        """
+        super().__init__(config or PipelineConfig())
         self._active_pipelines: dict[str, Any] = {}
+        self._runs: Counter[str] = Counter()
+        self._budget: asyncio.Semaphore | None = None
+        # Budget, timeout and run count of each attached pipeline, by id,
+        # restored once its last run through the manager finishes
+        self._saved: dict[int, tuple[asyncio.Semaphore | None, float | None, int]] = {}
 
     async def _setup(self) -> None:
         """Setup pipeline manager."""
+        self.config.validate()
         await super()._setup()
         self._active_pipelines.clear()
+        self._runs.clear()
+        self._budget = asyncio.Semaphore(self.config.max_concurrent)
 
     async def _teardown(self) -> None:
         """Teardown pipeline manager."""
         await super()._teardown()
         self._active_pipelines.clear()
+        self._runs.clear()
+
+    def _attach(self, pipeline: Pipeline[Any, Any]) -> None:
+        """Put a pipeline under the shared budget and mark it active."""
+        self._ensure_initialized()
+        saved = self._saved.get(id(pipeline))
+        if saved is None:
+            self._saved[id(pipeline)] = (pipeline.budget, pipeline.timeout, 1)
+        else:
+            self._saved[id(pipeline)] = (saved[0], saved[1], saved[2] + 1)
+        pipeline.budget = self._budget
+        if pipeline.config.timeout is None:
+            pipeline.timeout = self.config.timeout
+        name = pipeline.config.name
+        self._active_pipelines[name] = pipeline
+        self._runs[name] += 1
+
+    def _detach(self, pipeline: Pipeline[Any, Any]) -> None:
+        """Mark a pipeline run finished, restoring its own limits after the last."""
+        budget, timeout, runs = self._saved.pop(id(pipeline))
+        if runs > 1:
+            self._saved[id(pipeline)] = (budget, timeout, runs - 1)
+        else:
+            pipeline.budget = budget
+            pipeline.timeout = timeout
+        name = pipeline.config.name
+        self._runs[name] -= 1
+        if self._runs[name] <= 0:
+            del self._runs[name]
+            self._active_pipelines.pop(name, None)
+
+    async def execute(self, pipeline: Pipeline[Any, Any], input_data: Any) -> PipelineResult[Any]:
+        """Execute a pipeline within the shared budget.
+
+        Args:
+            pipeline: Pipeline to run
+            input_data: Input data to process
+
+        Returns:
+            Pipeline execution result
+
+        Raises:
+            RuntimeError: If manager not initialized
+        """
+        self._attach(pipeline)
+        try:
+            return await pipeline.execute(input_data)
+        finally:
+            self._detach(pipeline)
+
+    async def stream(
+        self, pipeline: Pipeline[Any, Any], inputs: Iterable[Any] | AsyncIterable[Any]
+    ) -> AsyncIterator[Any]:
+        """Stream inputs through a pipeline within the shared budget.
+
+        Args:
+            pipeline: Pipeline to run
+            inputs: Input items, sync or async iterable
+
+        Yields:
+            Output items
+
+        Raises:
+            RuntimeError: If manager not initialized
+        """
+        self._attach(pipeline)
+        try:
+            async with aclosing(pipeline.stream(inputs)) as items:
+                async for item in items:
+                    yield item
+        finally:
+            self._detach(pipeline)
 
     async def get_stats(self) -> dict[str, Any]:
         """Get pipeline manager statistics.
@@ -56,6 +151,7 @@ class PipelineManager(BaseManager[PipelineConfig]):
         stats.update(
             {
                 "active_pipelines": len(self._active_pipelines),
+                "active_runs": sum(self._runs.values()),
                 "max_concurrent": self.config.max_concurrent,
                 "timeout": self.config.timeout,
             }
@@ -0,0 +1,158 @@
+"""Pipeline step profiling."""
+
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore
+
+# ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def peak_rss() -> int:
+    """Get the peak resident set size of the process in bytes, 0 if unknown."""
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
+
+
+def timed_call(func: Callable[[Any], Any], item: Any) -> tuple[Any, float, int]:
+    """Call a function, measuring it from the thread or process running it.
+
+    Args:
+        func: Function to call
+        item: Function argument
+
+    Returns:
+        Result, CPU seconds and peak RSS growth in bytes
+    """
+    rss = peak_rss()
+    cpu = time.thread_time()
+    result = func(item)
+    return result, time.thread_time() - cpu, peak_rss() - rss
+
+
+@dataclass
+class StepProfile:
+    """Measurements of one pipeline step."""
+
+    name: str
+    concurrency: int = 1
+    # Items processed and items answered from the step cache
+    items: int = 0
+    cached: int = 0
+    # Seconds spent processing items, summed over workers
+    wall_time: float = 0.0
+    # CPU seconds of the processing; for coroutine steps this includes
+    # whatever else ran on the loop meanwhile, so it is an upper bound
+    cpu_time: float = 0.0
+    # Seconds workers waited for input and for room in the next queue
+    wait_in: float = 0.0
+    wait_out: float = 0.0
+    # Growth of the process peak RSS while the step ran, in bytes
+    rss_delta: int = 0
+    started: float | None = None
+    finished: float | None = None
+
+    def record(self, started: float, wall: float, cpu: float, rss: int) -> None:
+        """Add a processed item.
+
+        Args:
+            started: perf_counter value when processing started
+            wall: Processing seconds
+            cpu: CPU seconds
+            rss: Peak RSS growth in bytes
+        """
+        self.items += 1
+        self.wall_time += wall
+        self.cpu_time += cpu
+        self.rss_delta += rss
+        if self.started is None:
+            self.started = started
+        self.finished = started + wall
+
+    @property
+    def items_per_second(self) -> float:
+        """Get the observed throughput, items over the active period."""
+        if self.started is None or self.finished is None:
+            return 0.0
+        span = self.finished - self.started
+        return self.items / span if span > 0 else 0.0
+
+    @property
+    def capacity(self) -> float:
+        """Get the items per second the step sustains without waiting."""
+        if not self.wall_time:
+            return float("inf")
+        return self.items * self.concurrency / self.wall_time
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "items": self.items,
+            "cached": self.cached,
+            "concurrency": self.concurrency,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "items_per_second": self.items_per_second,
+            "capacity": self.capacity,
+            "wait_in": self.wait_in,
+            "wait_out": self.wait_out,
+            "rss_delta": self.rss_delta,
+        }
+
+
+@dataclass
+class PipelineProfile:
+    """Step measurements of a pipeline run."""
+
+    steps: list[StepProfile] = field(default_factory=list)
+
+    @property
+    def bottleneck(self) -> StepProfile | None:
+        """Get the step with the lowest capacity, which limits throughput."""
+        busy = [step for step in self.steps if step.items]
+        return min(busy, key=lambda step: step.capacity, default=None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary.
+
+        Steps are listed in pipeline order, as step names need not be
+        unique, and the bottleneck is given by its position in that list.
+        """
+        bottleneck = self.bottleneck
+        return {
+            "steps": [step.to_dict() for step in self.steps],
+            "bottleneck": next(
+                (index for index, step in enumerate(self.steps) if step is bottleneck), None
+            ),
+        }
+
+    def report(self) -> str:
+        """Render a table of the steps, marking the bottleneck.
+
+        Returns:
+            Profile report
+        """
+        bottleneck = self.bottleneck
+        lines = [
+            f"{'step':<24} {'items':>8} {'workers':>7} {'wall s':>9} {'cpu s':>9} "
+            f"{'items/s':>10} {'capacity':>10} {'wait in':>9} {'wait out':>9} {'rss MB':>8}"
+        ]
+        for step in self.steps:
+            marker = "  <- bottleneck" if step is bottleneck else ""
+            lines.append(
+                f"{step.name:<24} {step.items:>8} {step.concurrency:>7} "
+                f"{step.wall_time:>9.3f} {step.cpu_time:>9.3f} "
+                f"{step.items_per_second:>10.1f} {step.capacity:>10.1f} "
+                f"{step.wait_in:>9.3f} {step.wait_out:>9.3f} "
+                f"{step.rss_delta / (1 << 20):>8.1f}{marker}"
+            )
+        return "\n".join(lines)
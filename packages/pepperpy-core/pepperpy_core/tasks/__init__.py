@@ -1,7 +1,23 @@
 """Task management package."""
 
-from .config import TaskConfig
-from .task import Task
+from .config import TaskConfig, TaskGroupConfig, TaskManagerConfig
+from .graph import TaskGraph
+from .group import TaskGroup
 from .manager import TaskManager
+from .queue import TaskQueue
+from .status import TaskStatus
+from .task import Task
+from .worker import TaskWorker
 
-__all__ = ["TaskConfig", "Task", "TaskManager"]
+__all__ = [
+    "Task",
+    "TaskConfig",
+    "TaskGraph",
+    "TaskGroup",
+    "TaskGroupConfig",
+    "TaskManager",
+    "TaskManagerConfig",
+    "TaskQueue",
+    "TaskStatus",
+    "TaskWorker",
+]
@@ -13,3 +13,69 @@ class TaskConfig(BaseConfigData):
     name: str
     enabled: bool = True
     metadata: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class TaskManagerConfig(TaskConfig):
+    """Task manager configuration."""
+
+    # Worker coroutines pulling from the queue
+    workers: int = 4
+    # Queued tasks before submit() blocks, 0 for unbounded
+    max_queue_size: int = 1000
+    # Threads for sync callables, None for the executor default
+    max_threads: int | None = None
+    # Processes for process mode tasks, None for the CPU count
+    max_processes: int | None = None
+    # Process results of at least this many bytes return via shared memory
+    shared_memory_threshold: int = 1 << 20
+    # Default per-task timeout in seconds
+    timeout: float | None = None
+    # Seconds a queued task waits to gain one priority level, None disables
+    aging_interval: float | None = 60.0
+    # Finished tasks kept for get_task and get_stats, older ones are dropped
+    max_history: int = 1000
+
+    def validate(self) -> None:
+        """Validate configuration."""
+        if self.workers < 1:
+            raise ValueError("workers must be greater than 0")
+        if self.max_queue_size < 0:
+            raise ValueError("max_queue_size must be non-negative")
+        if self.max_threads is not None and self.max_threads < 1:
+            raise ValueError("max_threads must be greater than 0")
+        if self.max_processes is not None and self.max_processes < 1:
+            raise ValueError("max_processes must be greater than 0")
+        if self.shared_memory_threshold < 0:
+            raise ValueError("shared_memory_threshold must be non-negative")
+        if self.timeout is not None and self.timeout <= 0:
+            raise ValueError("timeout must be greater than 0")
+        if self.aging_interval is not None and self.aging_interval <= 0:
+            raise ValueError("aging_interval must be greater than 0")
+        if self.max_history < 0:
+            raise ValueError("max_history must be non-negative")
+
+
+@dataclass
+class TaskGroupConfig(TaskConfig):
+    """Task group configuration."""
+
+    # Tasks of the group queued or running at once, None for no cap
+    max_concurrency: int | None = None
+    # Task starts per second, None for no limit
+    requests_per_second: float | None = None
+    # Task cost units (e.g. LLM tokens) per minute, None for no limit
+    tokens_per_minute: float | None = None
+    # Requests that may start back to back, defaults to one second's worth
+    burst: float | None = None
+
+    def validate(self) -> None:
+        """Validate configuration."""
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+        if self.requests_per_second is not None and self.requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0")
+        if self.tokens_per_minute is not None and self.tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be greater than 0")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError("burst must be at least 1")
@@ -19,3 +19,15 @@ class TaskNotFoundError(TaskError):
     """Task not found error."""
 
     pass
+
+
+class TaskTimeoutError(TaskExecutionError):
+    """Task timed out."""
+
+    pass
+
+
+class TaskCancelledError(TaskError):
+    """Task was cancelled."""
+
+    pass
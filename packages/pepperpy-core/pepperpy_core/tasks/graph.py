@@ -0,0 +1,140 @@
+"""Task dependency graph."""
+
+import hashlib
+import inspect
+import marshal
+import pickle
+from collections import deque
+from collections.abc import Iterable
+
+from .exceptions import TaskError, TaskNotFoundError
+from .task import Task
+
+
+class TaskGraph:
+    """Directed acyclic graph of tasks linked by ``depends_on``.
+
+    Tracks how many dependencies of each task are still unfinished, so the
+    tasks unblocked by a completion are found in time proportional to its
+    out-degree.
+    """
+
+    def __init__(self, tasks: Iterable[Task]) -> None:
+        """Initialize task graph.
+
+        Args:
+            tasks: Tasks forming the graph
+
+        Raises:
+            TaskError: If task names repeat or the graph has a cycle
+            TaskNotFoundError: If a task depends on a task outside the graph
+        """
+        self.tasks: dict[str, Task] = {}
+        for task in tasks:
+            if task.name in self.tasks:
+                raise TaskError(f"Duplicate task in graph: {task.name}")
+            self.tasks[task.name] = task
+
+        self._dependents: dict[str, list[str]] = {name: [] for name in self.tasks}
+        self._unmet: dict[str, int] = {}
+        for task in self.tasks.values():
+            for dep in task.depends_on:
+                if dep not in self.tasks:
+                    raise TaskNotFoundError(f"Task {task.name} depends on unknown task: {dep}")
+                self._dependents[dep].append(task.name)
+            self._unmet[task.name] = len(task.depends_on)
+        self.order = self._sort()
+
+    def _sort(self) -> list[str]:
+        """Topologically sort task names, raising on cycles."""
+        unmet = dict(self._unmet)
+        ready = deque(name for name, count in unmet.items() if count == 0)
+        order: list[str] = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for dependent in self._dependents[name]:
+                unmet[dependent] -= 1
+                if unmet[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self.tasks):
+            cycle = sorted(name for name, count in unmet.items() if count > 0)
+            raise TaskError(f"Task graph has a cycle through: {', '.join(cycle)}")
+        return order
+
+    def roots(self) -> list[Task]:
+        """Get tasks without dependencies."""
+        return [self.tasks[name] for name, count in self._unmet.items() if count == 0]
+
+    def complete(self, name: str) -> list[Task]:
+        """Record a finished task.
+
+        Args:
+            name: Finished task name
+
+        Returns:
+            Tasks whose dependencies are now all finished
+        """
+        ready = []
+        for dependent in self._dependents[name]:
+            self._unmet[dependent] -= 1
+            if self._unmet[dependent] == 0:
+                ready.append(self.tasks[dependent])
+        return ready
+
+    def downstream(self, name: str) -> list[Task]:
+        """Get every task depending on a task, directly or not.
+
+        Args:
+            name: Task name
+
+        Returns:
+            Dependent tasks
+        """
+        seen: set[str] = set()
+        stack = list(self._dependents[name])
+        while stack:
+            dependent = stack.pop()
+            if dependent not in seen:
+                seen.add(dependent)
+                stack.extend(self._dependents[dependent])
+        return [self.tasks[dependent] for dependent in seen]
+
+
+def fingerprint(task: Task) -> str | None:
+    """Fingerprint a task's function and inputs for memoization.
+
+    The function is identified by its code, the values its closure
+    captures and, for a bound method, its instance, so closures of one
+    factory or methods of different instances are told apart.
+
+    Args:
+        task: Task with its inputs bound
+
+    Returns:
+        Hex digest, or None if the function's state or the inputs cannot
+        be pickled
+    """
+    func = task.func
+    instance = None
+    if inspect.ismethod(func):
+        instance, func = func.__self__, func.__func__
+    code = getattr(func, "__code__", None)
+    try:
+        if code is None:
+            # Builtins and partials pickle by reference and arguments
+            identity = pickle.dumps(func, pickle.HIGHEST_PROTOCOL)
+        else:
+            cells = [cell.cell_contents for cell in func.__closure__ or ()]
+            identity = marshal.dumps(code) + pickle.dumps(
+                (func.__module__, func.__qualname__, cells, instance), pickle.HIGHEST_PROTOCOL
+            )
+        inputs = pickle.dumps(sorted(task.kwargs.items()), pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+    digest = hashlib.blake2b(identity, digest_size=16)
+    digest.update(inputs)
+    return digest.hexdigest()
+
+
+__all__ = ["TaskGraph", "fingerprint"]
@@ -0,0 +1,200 @@
+"""Rate-limited task groups."""
+
+import asyncio
+import time
+from contextlib import suppress
+from typing import Any
+
+from ..module import BaseModule
+from .config import TaskGroupConfig
+from .queue import TaskQueue
+from .task import Task
+
+
+class TokenBucket:
+    """Token bucket refilling continuously at a fixed rate."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held, i.e. the largest burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Get available tokens, negative while in debt."""
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until ``amount`` tokens are available and take them.
+
+        An amount above the capacity waits for a full bucket and leaves it
+        in debt, instead of waiting forever.
+
+        Args:
+            amount: Tokens to take
+        """
+        needed = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self._tokens >= needed:
+                self._tokens -= amount
+                return
+            await asyncio.sleep((needed - self._tokens) / self.rate)
+
+    def charge(self, amount: float) -> None:
+        """Take tokens without waiting, negative amounts refund.
+
+        Args:
+            amount: Tokens to take
+        """
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens - amount)
+
+
+class TaskGroup(BaseModule[TaskGroupConfig]):
+    """Named group of tasks sharing rate limits and a concurrency cap.
+
+    Tasks submitted to a group wait in its own priority queue. A dispatcher
+    moves them to the shared queue only once a concurrency slot and the
+    request and token budgets allow, so limited tasks never hold a worker
+    while they wait and starts are paced evenly instead of in bursts.
+    """
+
+    def __init__(self, config: TaskGroupConfig, queue: TaskQueue, maxsize: int = 0) -> None:
+        """Initialize task group.
+
+        Args:
+            config: Group configuration
+            queue: Shared queue the workers pull from
+            maxsize: Maximum tasks waiting for admission before push()
+                blocks, 0 for unbounded
+        """
+        super().__init__(config)
+        self._queue = queue
+        self._pending = TaskQueue(maxsize)
+        self._slots = (
+            asyncio.Semaphore(config.max_concurrency)
+            if config.max_concurrency is not None
+            else None
+        )
+        self._requests = (
+            TokenBucket(
+                config.requests_per_second,
+                config.burst or max(1.0, config.requests_per_second),
+            )
+            if config.requests_per_second is not None
+            else None
+        )
+        self._tokens = (
+            TokenBucket(config.tokens_per_minute / 60, config.tokens_per_minute)
+            if config.tokens_per_minute is not None
+            else None
+        )
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._watchers: set[asyncio.Task[None]] = set()
+        self._in_flight = 0
+        self._dispatched = 0
+
+    async def _setup(self) -> None:
+        """Setup task group."""
+        self.config.validate()
+        await self._pending.initialize()
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def _teardown(self) -> None:
+        """Teardown task group."""
+        tasks = [t for t in (self._dispatcher, *self._watchers) if t is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._dispatcher = None
+        self._watchers.clear()
+        await self._pending.cleanup()
+
+    async def push(self, task: Task) -> None:
+        """Queue a task for admission, waiting while the group queue is full.
+
+        Args:
+            task: Task to queue
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        await self._pending.push(task)
+
+    def charge(self, tokens: float) -> None:
+        """Adjust the token budget once a task's real cost is known.
+
+        Args:
+            tokens: Extra tokens used, negative to refund an overestimate
+        """
+        if self._tokens is not None:
+            self._tokens.charge(tokens)
+
+    async def join(self) -> None:
+        """Wait until every queued task has been admitted."""
+        await self._pending.join()
+
+    async def _dispatch(self) -> None:
+        """Admit pending tasks as limits allow."""
+        while True:
+            task: Task = await self._pending.pop()
+            try:
+                if task.is_cancelled:
+                    continue
+                if self._slots is not None:
+                    await self._slots.acquire()
+                if self._requests is not None:
+                    await self._requests.acquire()
+                if self._tokens is not None:
+                    await self._tokens.acquire(task.cost)
+                self._in_flight += 1
+                self._dispatched += 1
+                watcher = asyncio.create_task(self._release_after(task))
+                self._watchers.add(watcher)
+                watcher.add_done_callback(self._watchers.discard)
+                await self._queue.push(task)
+            finally:
+                self._pending.task_done()
+
+    async def _release_after(self, task: Task) -> None:
+        """Free the concurrency slot once the task finishes."""
+        try:
+            with suppress(Exception):
+                await task.wait()
+        finally:
+            self._in_flight -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get group statistics.
+
+        Returns:
+            Group statistics
+        """
+        return {
+            "name": self.config.name,
+            "pending": len(self._pending),
+            "in_flight": self._in_flight,
+            "dispatched": self._dispatched,
+            "max_concurrency": self.config.max_concurrency,
+            "requests_per_second": self.config.requests_per_second,
+            "tokens_per_minute": self.config.tokens_per_minute,
+            "tokens_available": self._tokens.tokens if self._tokens is not None else None,
+        }
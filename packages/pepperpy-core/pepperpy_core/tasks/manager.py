@@ -1,41 +1,155 @@
 """Task manager module."""
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ..base import BaseModule
-from .config import TaskConfig
+from .config import TaskGroupConfig, TaskManagerConfig
+from .exceptions import TaskError, TaskExecutionError, TaskNotFoundError
+from .graph import TaskGraph, fingerprint
+from .group import TaskGroup
+from .process import SharedMemoryProcessPool
+from .queue import TaskQueue
+from .status import TaskStatus
 from .task import Task
+from .worker import TaskWorker
 
 
-class TaskManager(BaseModule[TaskConfig]):
-    """Task manager implementation."""
+class TaskManager(BaseModule[TaskManagerConfig]):
+    """Task manager implementation.
 
-    def __init__(self) -> None:
-        """Initialize task manager."""
-        config = TaskConfig(name="task_manager")
-        super().__init__(config)
+    Submitted tasks go through a bounded priority queue to a pool of worker
+    coroutines. Async functions are awaited natively, sync functions run in
+    a thread pool so they do not block the event loop, or in a process pool
+    for CPU-bound ``mode="process"`` tasks.
+
+    Finished tasks stay available to :meth:`get_task` until more than
+    ``max_history`` of them have accumulated, then the oldest are dropped.
+    """
+
+    def __init__(self, config: TaskManagerConfig | None = None) -> None:
+        """Initialize task manager.
+
+        Args:
+            config: Task manager configuration
+        """
+        super().__init__(config or TaskManagerConfig(name="task_manager"))
         self._tasks: dict[str, Task] = {}
+        # Tracked tasks at which finished ones are next dropped
+        self._prune_at = 0
+        self._queue: TaskQueue | None = None
+        self._workers: list[TaskWorker] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._process_executor: SharedMemoryProcessPool | None = None
+        self._groups: dict[str, TaskGroup] = {}
+        # Latest (fingerprint, result) per graph task name
+        self._memo: dict[str, tuple[str, Any]] = {}
 
     async def _setup(self) -> None:
         """Setup task manager."""
+        self.config.validate()
         self._tasks.clear()
+        self._prune_at = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.max_threads,
+            thread_name_prefix=self.config.name,
+        )
+        # Worker processes are only spawned once a process task is submitted
+        self._process_executor = SharedMemoryProcessPool(
+            max_workers=self.config.max_processes,
+            threshold=self.config.shared_memory_threshold,
+        )
+        self._queue = TaskQueue(self.config.max_queue_size, self.config.aging_interval)
+        await self._queue.initialize()
+        self._workers = [
+            TaskWorker(self._queue, self._executor, self._process_executor)
+            for _ in range(self.config.workers)
+        ]
+        for worker in self._workers:
+            await worker.start()
 
     async def _teardown(self) -> None:
         """Teardown task manager."""
         for task in self._tasks.values():
             await task.cancel()
+        for group in self._groups.values():
+            await group.cleanup()
+        self._groups.clear()
+        for worker in self._workers:
+            await worker.cleanup()
+        self._workers.clear()
+        if self._queue is not None:
+            await self._queue.cleanup()
+            self._queue = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=False, cancel_futures=True)
+            self._process_executor = None
         self._tasks.clear()
 
     async def get_stats(self) -> dict[str, Any]:
         """Get task manager statistics."""
         self._ensure_initialized()
+        statuses = [t.status for t in self._tasks.values()]
         return {
             "total_tasks": len(self._tasks),
             "task_names": list(self._tasks.keys()),
             "active_tasks": sum(1 for t in self._tasks.values() if not t.is_cancelled),
+            "workers": len(self._workers),
+            "queued": len(self._queue) if self._queue is not None else 0,
+            "running": statuses.count(TaskStatus.RUNNING),
+            "completed": statuses.count(TaskStatus.COMPLETED),
+            "failed": statuses.count(TaskStatus.FAILED),
+            "cancelled": statuses.count(TaskStatus.CANCELLED),
+            "groups": {
+                name: await group.get_stats() for name, group in self._groups.items()
+            },
         }
 
+    async def add_group(self, config: TaskGroupConfig) -> TaskGroup:
+        """Register a task group.
+
+        Tasks submitted with ``group=config.name`` are admitted at most
+        ``max_concurrency`` at a time and paced to the group rate limits.
+        Like the shared queue, the group queue holds at most
+        ``max_queue_size`` tasks before submit() waits.
+
+        Args:
+            config: Group configuration
+
+        Returns:
+            Started task group
+        """
+        self._ensure_initialized()
+        assert self._queue is not None
+        if config.name in self._groups:
+            raise TaskError(f"Task group already exists: {config.name}")
+        group = TaskGroup(config, self._queue, self.config.max_queue_size)
+        await group.initialize()
+        self._groups[config.name] = group
+        return group
+
+    def get_group(self, name: str) -> TaskGroup:
+        """Get a task group by name.
+
+        Args:
+            name: Group name
+
+        Returns:
+            Task group
+
+        Raises:
+            TaskNotFoundError: If no group has that name
+        """
+        try:
+            return self._groups[name]
+        except KeyError:
+            raise TaskNotFoundError(f"Task group not found: {name}") from None
+
     async def create_task(
         self, name: str, func: Callable[..., Any], **kwargs: Any
     ) -> Task:
@@ -51,5 +165,217 @@ class TaskManager(BaseModule[TaskConfig]):
         """
         self._ensure_initialized()
         task = Task(name=name, func=func, **kwargs)
+        self._track(task)
+        return task
+
+    def _track(self, task: Task) -> None:
+        """Register a task, dropping the oldest finished ones past the history.
+
+        Tracked tasks are only scanned once their number has doubled since
+        the last scan, so registering stays cheap with many tasks in flight.
+        """
+        self._tasks.pop(task.name, None)
         self._tasks[task.name] = task
+        if len(self._tasks) <= self._prune_at:
+            return
+        finished = [name for name, tracked in self._tasks.items() if tracked.is_done]
+        for name in finished[: max(0, len(finished) - self.config.max_history)]:
+            del self._tasks[name]
+        self._prune_at = 2 * max(len(self._tasks), self.config.max_history)
+
+    async def submit(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *,
+        timeout: float | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+        mode: str = "thread",
+        group: str | None = None,
+        cost: float = 1.0,
+        **kwargs: Any,
+    ) -> Task:
+        """Create a task and queue it for execution.
+
+        Waits while the queue is full, so fast producers are slowed down to
+        the pace of the workers.
+
+        Args:
+            name: Task name
+            func: Task function, sync or async
+            timeout: Execution timeout in seconds, defaults to the config timeout
+            priority: Scheduling priority, higher runs first
+            deadline: Optional seconds from now the task should start by
+            mode: ``thread`` or ``process`` for CPU-bound sync functions, which
+                must then be picklable
+            group: Optional task group whose limits apply
+            cost: Units taken from the group token budget
+            **kwargs: Additional task arguments
+
+        Returns:
+            Queued task, await ``task.wait()`` for its result
+        """
+        if timeout is None:
+            timeout = self.config.timeout
+        task = await self.create_task(
+            name,
+            func,
+            timeout=timeout,
+            priority=priority,
+            deadline=deadline,
+            mode=mode,
+            group=group,
+            cost=cost,
+            **kwargs,
+        )
+        await self.schedule(task)
         return task
+
+    async def schedule(self, task: Task) -> Task:
+        """Queue an existing task for execution.
+
+        Args:
+            task: Task to queue
+
+        Returns:
+            Queued task
+
+        Raises:
+            TaskNotFoundError: If the task group does not exist
+        """
+        self._ensure_initialized()
+        assert self._queue is not None
+        if task.group is not None:
+            group = self.get_group(task.group)
+            self._track(task)
+            await group.push(task)
+            return task
+        self._track(task)
+        await self._queue.push(task)
+        return task
+
+    async def run(self, name: str, func: Callable[..., Any], **kwargs: Any) -> Any:
+        """Submit a task and wait for its result.
+
+        Args:
+            name: Task name
+            func: Task function, sync or async
+            **kwargs: Additional task arguments
+
+        Returns:
+            Task result
+        """
+        task = await self.submit(name, func, **kwargs)
+        return await task.wait()
+
+    async def run_graph(
+        self, tasks: Iterable[Task], memoize: bool = False
+    ) -> dict[str, Any]:
+        """Run tasks in dependency order with maximal parallelism.
+
+        A task is queued as soon as every task in its ``depends_on`` has
+        completed, and receives their results as keyword arguments of the
+        same name. When a task fails, everything downstream of it is
+        cancelled while independent branches keep running.
+
+        Args:
+            tasks: Tasks forming a directed acyclic graph
+            memoize: Reuse the previous result of a task whose function and
+                inputs, upstream results included, are unchanged
+
+        Returns:
+            Results by task name
+
+        Raises:
+            TaskError: If the graph is invalid
+            TaskExecutionError: If any task failed, after the rest finished
+        """
+        self._ensure_initialized()
+        graph = TaskGraph(tasks)
+        results: dict[str, Any] = {}
+        errors: dict[str, Exception] = {}
+        keys: dict[str, str] = {}
+        waiting: dict[asyncio.Future[Any], Task] = {}
+
+        async def launch(task: Task) -> None:
+            task.bind(**{dep: results[dep] for dep in task.depends_on})
+            key = fingerprint(task) if memoize else None
+            cached = self._memo.get(task.name)
+            if key is not None:
+                keys[task.name] = key
+            if key is not None and cached is not None and cached[0] == key:
+                self._track(task)
+                task.complete(cached[1])
+            else:
+                await self.schedule(task)
+            waiting[asyncio.ensure_future(task.wait())] = task
+
+        try:
+            for task in graph.roots():
+                await launch(task)
+            while waiting:
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task = waiting.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        results[task.name] = future.result()
+                        if task.name in keys:
+                            self._memo[task.name] = (keys[task.name], results[task.name])
+                        for ready in graph.complete(task.name):
+                            await launch(ready)
+                        continue
+                    if not isinstance(error, Exception):
+                        raise error
+                    errors[task.name] = error
+                    for dependent in graph.downstream(task.name):
+                        await dependent.cancel()
+        finally:
+            for future in waiting:
+                future.cancel()
+            for task in waiting.values():
+                await task.cancel()
+
+        if errors:
+            failed = ", ".join(errors)
+            raise TaskExecutionError(
+                f"Task graph failed at: {failed}", cause=next(iter(errors.values()))
+            )
+        return results
+
+    async def join(self) -> None:
+        """Wait until every queued task has finished."""
+        self._ensure_initialized()
+        assert self._queue is not None
+        for group in self._groups.values():
+            await group.join()
+        await self._queue.join()
+
+    def get_task(self, name: str) -> Task:
+        """Get a task by name.
+
+        Args:
+            name: Task name
+
+        Returns:
+            Task
+
+        Raises:
+            TaskNotFoundError: If no task has that name
+        """
+        try:
+            return self._tasks[name]
+        except KeyError:
+            raise TaskNotFoundError(f"Task not found: {name}") from None
+
+    async def cancel_task(self, name: str) -> None:
+        """Cancel a queued or running task.
+
+        Args:
+            name: Task name
+
+        Raises:
+            TaskNotFoundError: If no task has that name
+        """
+        await self.get_task(name).cancel()
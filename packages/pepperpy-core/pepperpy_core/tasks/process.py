@@ -0,0 +1,152 @@
+"""Process pool execution with shared memory result transfer."""
+
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Any
+
+# Results at least this large come back through shared memory
+DEFAULT_SHARED_MEMORY_THRESHOLD = 1 << 20
+
+
+@dataclass(frozen=True)
+class SharedResult:
+    """Handle to a result written to a shared memory segment."""
+
+    name: str
+    size: int
+    kind: str
+    shape: tuple[int, ...] = ()
+    dtype: str = ""
+
+
+def export_result(value: Any, threshold: int) -> Any:
+    """Move a large bytes or array result into shared memory.
+
+    Runs in the worker process. Smaller or other values are returned as is
+    and pickled by the executor.
+
+    Args:
+        value: Function result
+        threshold: Minimum size in bytes to use shared memory
+
+    Returns:
+        SharedResult handle or the value itself
+    """
+    if isinstance(value, bytes | bytearray | memoryview):
+        view = memoryview(value).cast("B")
+        if view.nbytes < threshold:
+            return value
+        shm = shared_memory.SharedMemory(create=True, size=view.nbytes)
+        try:
+            shm.buf[: view.nbytes] = view
+        finally:
+            shm.close()
+        return SharedResult(shm.name, view.nbytes, type(value).__name__)
+
+    # Duck-typed so numpy is never imported unless the result is an array
+    if type(value).__module__ == "numpy" and hasattr(value, "__array_interface__"):
+        if value.nbytes < threshold:
+            return value
+        shm = shared_memory.SharedMemory(create=True, size=max(value.nbytes, 1))
+        try:
+            target = type(value)(value.shape, dtype=value.dtype, buffer=shm.buf)
+            target[...] = value
+            del target
+        finally:
+            shm.close()
+        return SharedResult(shm.name, value.nbytes, "ndarray", tuple(value.shape), value.dtype.str)
+    return value
+
+
+def import_result(value: Any) -> Any:
+    """Read a result back from shared memory and release the segment.
+
+    The value is copied out once, so the returned object owns its memory
+    and the segment can be unlinked right away.
+
+    Args:
+        value: SharedResult handle or plain value
+
+    Returns:
+        Result value
+    """
+    if not isinstance(value, SharedResult):
+        return value
+    shm = shared_memory.SharedMemory(name=value.name)
+    try:
+        if value.kind == "ndarray":
+            import numpy as np
+
+            view = np.ndarray(value.shape, dtype=np.dtype(value.dtype), buffer=shm.buf)
+            result: Any = view.copy()
+            del view
+        elif value.kind == "bytearray":
+            result = bytearray(shm.buf[: value.size])
+        else:
+            result = bytes(shm.buf[: value.size])
+        return result
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def discard_result(future: Future[Any]) -> None:
+    """Release the segment of a result nobody will read.
+
+    Args:
+        future: Finished executor future
+    """
+    if future.cancelled() or future.exception() is not None:
+        return
+    value = future.result()
+    if isinstance(value, SharedResult):
+        shm = shared_memory.SharedMemory(name=value.name)
+        shm.close()
+        shm.unlink()
+
+
+def _call_shared(func: Callable[..., Any], threshold: int, /, **kwargs: Any) -> Any:
+    """Call a function and export its result."""
+    return export_result(func(**kwargs), threshold)
+
+
+class SharedMemoryProcessPool(ProcessPoolExecutor):
+    """Process pool returning large results through shared memory.
+
+    Functions and arguments must be picklable. Results of at least
+    ``threshold`` bytes come back as :class:`SharedResult` handles, to be
+    read with :func:`import_result`.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        threshold: int = DEFAULT_SHARED_MEMORY_THRESHOLD,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize process pool.
+
+        Args:
+            max_workers: Number of worker processes, None for the CPU count
+            threshold: Minimum result size in bytes to use shared memory
+            **kwargs: Additional ProcessPoolExecutor arguments
+        """
+        super().__init__(max_workers=max_workers, **kwargs)
+        self.threshold = threshold
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+        """Submit a call whose result may come back through shared memory."""
+        return super().submit(partial(_call_shared, partial(fn, *args), self.threshold), **kwargs)
+
+
+__all__ = [
+    "DEFAULT_SHARED_MEMORY_THRESHOLD",
+    "SharedMemoryProcessPool",
+    "SharedResult",
+    "discard_result",
+    "export_result",
+    "import_result",
+]
@@ -1,5 +1,10 @@
 """Task queue implementation."""
 
+import asyncio
+import heapq
+import itertools
+import math
+import time
 from collections import deque
 from dataclasses import dataclass
 from typing import Any
@@ -8,43 +13,168 @@ from ..module import BaseModule
 from .base import TaskConfig
 
 
+class _Level:
+    """Tasks queued at one priority, earliest deadline first."""
+
+    __slots__ = ("heap", "arrivals", "popped")
+
+    def __init__(self) -> None:
+        # Entries are (deadline, sequence, task)
+        self.heap: list[tuple[float, int, Any]] = []
+        # (sequence, enqueue time) in push order, popped ones dropped lazily
+        self.arrivals: deque[tuple[int, float]] = deque()
+        self.popped: set[int] = set()
+
+    def oldest(self) -> float:
+        """Get the enqueue time of the longest waiting task."""
+        while self.arrivals[0][0] in self.popped:
+            self.popped.discard(self.arrivals.popleft()[0])
+        return self.arrivals[0][1]
+
+
 @dataclass
 class TaskQueue(BaseModule[TaskConfig]):
-    """Task queue implementation."""
+    """Priority task queue implementation.
 
-    def __init__(self) -> None:
-        """Initialize task queue."""
+    Tasks with a higher ``priority`` are popped first, ties are broken by
+    earliest ``deadline`` and then insertion order. With ``aging_interval``
+    set, a priority level gains one level for every interval its oldest
+    task has waited, continuously, so low priority work is never starved
+    while tasks of the same priority keep their deadline order. Popping
+    costs one comparison per distinct priority queued.
+    """
+
+    def __init__(self, maxsize: int = 0, aging_interval: float | None = 60.0) -> None:
+        """Initialize task queue.
+
+        Args:
+            maxsize: Maximum queued tasks before push() blocks, 0 for unbounded
+            aging_interval: Seconds of waiting per priority level gained,
+                None to disable aging
+        """
         config = TaskConfig(name="task-queue")
         super().__init__(config)
-        self._queue: deque[Any] = deque()
+        self.maxsize = maxsize
+        self.aging_interval = aging_interval
+        self._levels: dict[int, _Level] = {}
+        self._size = 0
+        self._counter = itertools.count()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
 
     async def _setup(self) -> None:
         """Setup task queue."""
-        self._queue.clear()
+        self._levels.clear()
+        self._size = 0
 
     async def _teardown(self) -> None:
         """Teardown task queue."""
-        self._queue.clear()
+        self._levels.clear()
+        self._size = 0
+        self._unfinished = 0
+        self._finished.set()
+        self._not_full.set()
+
+    def full(self) -> bool:
+        """Check if the queue is at capacity."""
+        return 0 < self.maxsize <= self._size
 
-    async def push(self, task: Any) -> None:
-        """Push task to queue.
+    def _next_priority(self) -> int:
+        """Get the priority level to pop from, aged by waiting time."""
+        if self.aging_interval is None or len(self._levels) == 1:
+            return max(self._levels)
+        now = time.monotonic()
+        interval = self.aging_interval
+        return max(
+            self._levels,
+            key=lambda level: (level + (now - self._levels[level].oldest()) / interval, level),
+        )
+
+    def _take(self) -> Any:
+        """Remove the most urgent task."""
+        priority = self._next_priority()
+        level = self._levels[priority]
+        _, seq, task = heapq.heappop(level.heap)
+        if level.heap:
+            level.popped.add(seq)
+        else:
+            del self._levels[priority]
+        self._size -= 1
+        self._not_full.set()
+        return task
+
+    async def push(
+        self, task: Any, priority: int | None = None, deadline: float | None = None
+    ) -> None:
+        """Push task to queue, waiting while the queue is full.
 
         Args:
             task: Task to push
+            priority: Priority, defaults to ``task.priority`` or 0
+            deadline: Absolute ``time.monotonic()`` deadline, defaults to
+                ``task.deadline``
         """
         if not self.is_initialized:
             await self.initialize()
-        self._queue.append(task)
+        while self.full():
+            self._not_full.clear()
+            await self._not_full.wait()
+        if priority is None:
+            priority = getattr(task, "priority", 0)
+        if deadline is None:
+            deadline = getattr(task, "deadline", None)
+        level = self._levels.get(priority)
+        if level is None:
+            level = self._levels[priority] = _Level()
+        seq = next(self._counter)
+        heapq.heappush(level.heap, (math.inf if deadline is None else deadline, seq, task))
+        level.arrivals.append((seq, time.monotonic()))
+        self._size += 1
+        self._unfinished += 1
+        self._finished.clear()
+        self._not_empty.set()
 
-    async def pop(self) -> Any | None:
-        """Pop task from queue.
+    async def pop(self) -> Any:
+        """Pop the most urgent task, waiting until one is available.
 
         Returns:
-            Task if queue not empty, None otherwise
+            Task
         """
         if not self.is_initialized:
             await self.initialize()
-        return self._queue.popleft() if self._queue else None
+        while not self._size:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._take()
+
+    def pop_nowait(self) -> Any | None:
+        """Pop the most urgent task without waiting.
+
+        Returns:
+            Task if queue not empty, None otherwise
+        """
+        if not self._size:
+            return None
+        return self._take()
+
+    def task_done(self) -> None:
+        """Mark a popped task as processed."""
+        if self._unfinished > 0:
+            self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        """Wait until every pushed task has been processed."""
+        await self._finished.wait()
+
+    def __len__(self) -> int:
+        """Get number of queued tasks."""
+        return self._size
 
     async def get_stats(self) -> dict[str, Any]:
         """Get queue statistics.
@@ -58,5 +188,8 @@ class TaskQueue(BaseModule[TaskConfig]):
         return {
             "name": self.config.name,
             "enabled": self.config.enabled,
-            "queue_size": len(self._queue),
+            "queue_size": self._size,
+            "max_size": self.maxsize,
+            "aging_interval": self.aging_interval,
+            "unfinished": self._unfinished,
         }
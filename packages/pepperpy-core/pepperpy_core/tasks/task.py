@@ -1,57 +1,231 @@
 """Task implementation."""
 
-from collections.abc import Callable
+import asyncio
+import inspect
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
 from typing import Any
 from uuid import uuid4
 
+from .exceptions import TaskCancelledError, TaskExecutionError, TaskTimeoutError
+from .process import discard_result, import_result
+from .status import TaskStatus
+
+MODES = ("thread", "process")
+
 
 class Task:
     """Task implementation."""
 
-    def __init__(self, name: str, func: Callable[..., Any], **kwargs: Any) -> None:
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *,
+        timeout: float | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+        mode: str = "thread",
+        group: str | None = None,
+        cost: float = 1.0,
+        depends_on: Sequence[str] = (),
+        **kwargs: Any,
+    ) -> None:
         """Initialize task.
 
         Args:
             name: Task name
-            func: Task function
+            func: Task function, sync or async
+            timeout: Optional execution timeout in seconds
+            priority: Scheduling priority, higher runs first
+            deadline: Optional seconds from now the task should start by,
+                used to order tasks of equal priority
+            mode: Where a sync function runs, ``thread`` for I/O-bound work
+                or ``process`` for CPU-bound work holding the GIL
+            group: Optional task group whose limits apply
+            cost: Units taken from the group token budget, e.g. estimated
+                LLM tokens
+            depends_on: Names of tasks whose results this task receives as
+                keyword arguments of the same name, see TaskManager.run_graph
             **kwargs: Additional task arguments
+
+        Raises:
+            ValueError: If the mode is unknown or not usable with func
         """
+        if mode not in MODES:
+            raise ValueError(f"Unknown task mode: {mode}")
+        if mode == "process" and inspect.iscoroutinefunction(func):
+            raise ValueError("Coroutine functions cannot run in process mode")
         self.id = uuid4()
         self.name = name
+        self.timeout = timeout
+        self.priority = priority
+        self.mode = mode
+        self.group = group
+        self.cost = cost
+        self.depends_on = tuple(depends_on)
+        # Absolute time.monotonic() deadline
+        self.deadline = None if deadline is None else time.monotonic() + deadline
+        self.status = TaskStatus.PENDING
         self._func = func
         self._kwargs = kwargs
         self._cancelled = False
         self._result: Any = None
         self._error: Exception | None = None
+        self._runner: asyncio.Task[Any] | None = None
+        self._done = asyncio.Event()
 
-    async def execute(self) -> Any:
+    async def execute(self, executor: Executor | None = None) -> Any:
         """Execute task.
 
+        Coroutine functions are awaited on the event loop, sync functions
+        run in ``executor`` (the loop default if None) so they never block it.
+        In process mode ``executor`` must be a process pool, results sent
+        back through shared memory are read out transparently.
+
+        Args:
+            executor: Executor for sync functions
+
         Returns:
             Task result
 
         Raises:
+            TaskCancelledError: If the task was cancelled
+            TaskTimeoutError: If the task exceeded its timeout
+            TaskExecutionError: If process mode has no process pool
             Exception: If task execution fails
         """
         if self._cancelled:
-            raise RuntimeError("Task was cancelled")
+            raise TaskCancelledError(f"Task {self.name} was cancelled")
 
+        self.status = TaskStatus.RUNNING
+        self._runner = asyncio.ensure_future(self._invoke(executor))
         try:
-            self._result = self._func(**self._kwargs)
+            if self.timeout is None:
+                self._result = await self._runner
+            else:
+                self._result = await asyncio.wait_for(self._runner, self.timeout)
+            self.status = TaskStatus.COMPLETED
             return self._result
+        except TimeoutError as e:
+            self.status = TaskStatus.FAILED
+            if not self._runner.cancelled():
+                # Raised by the function itself, not by the timeout
+                self._error = e
+                raise
+            self._error = TaskTimeoutError(
+                f"Task {self.name} timed out after {self.timeout}s", cause=e
+            )
+            raise self._error from e
+        except asyncio.CancelledError:
+            self.status = TaskStatus.CANCELLED
+            if not self._cancelled:
+                # Cancelled from outside, e.g. the worker is stopping
+                self._cancelled = True
+                raise
+            raise TaskCancelledError(f"Task {self.name} was cancelled") from None
         except Exception as e:
+            self.status = TaskStatus.FAILED
             self._error = e
             raise
+        finally:
+            self._done.set()
+
+    async def _invoke(self, executor: Executor | None) -> Any:
+        """Run the function natively or in the executor."""
+        if inspect.iscoroutinefunction(self._func):
+            return await self._func(**self._kwargs)
+        if self.mode == "process":
+            return await self._invoke_process(executor)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(executor, partial(self._func, **self._kwargs))
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _invoke_process(self, executor: Executor | None) -> Any:
+        """Run the function in a process pool."""
+        if not isinstance(executor, ProcessPoolExecutor):
+            raise TaskExecutionError(f"Task {self.name} needs a process pool executor")
+        future = executor.submit(partial(self._func, **self._kwargs))
+        try:
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # The process cannot be interrupted, free its result once it lands
+            future.add_done_callback(discard_result)
+            raise
+        return import_result(result)
+
+    def bind(self, **kwargs: Any) -> None:
+        """Add keyword arguments before the task runs.
+
+        Args:
+            **kwargs: Additional task arguments
+        """
+        self._kwargs.update(kwargs)
+
+    def complete(self, result: Any) -> None:
+        """Mark the task completed with a known result, without running it.
+
+        Args:
+            result: Task result
+        """
+        self._result = result
+        self.status = TaskStatus.COMPLETED
+        self._done.set()
+
+    async def wait(self) -> Any:
+        """Wait for the task to finish.
+
+        Returns:
+            Task result
+
+        Raises:
+            TaskCancelledError: If the task was cancelled
+            Exception: If task execution failed
+        """
+        await self._done.wait()
+        if self._error is not None:
+            raise self._error
+        if self.status is TaskStatus.CANCELLED:
+            raise TaskCancelledError(f"Task {self.name} was cancelled")
+        return self._result
 
     async def cancel(self) -> None:
-        """Cancel task."""
+        """Cancel task, interrupting it if running.
+
+        Work already handed to a thread cannot be preempted, its result is
+        discarded instead.
+        """
         self._cancelled = True
+        if self._runner is not None and not self._runner.done():
+            self._runner.cancel()
+        elif self.status is TaskStatus.PENDING:
+            self.status = TaskStatus.CANCELLED
+            self._done.set()
 
     @property
     def is_cancelled(self) -> bool:
         """Check if task is cancelled."""
         return self._cancelled
 
+    @property
+    def is_done(self) -> bool:
+        """Check if task finished, failed or was cancelled."""
+        return self._done.is_set()
+
+    @property
+    def func(self) -> Callable[..., Any]:
+        """Get task function."""
+        return self._func
+
+    @property
+    def kwargs(self) -> dict[str, Any]:
+        """Get task arguments."""
+        return self._kwargs
+
     @property
     def result(self) -> Any:
         """Get task result."""
@@ -1,19 +1,46 @@
 """Task worker implementation."""
 
+import asyncio
+from concurrent.futures import Executor
+from contextlib import suppress
 from typing import Any
 
 from ..module import BaseModule
 from .base import TaskConfig
+from .queue import TaskQueue
+from .task import Task
 
 
 class TaskWorker(BaseModule[TaskConfig]):
-    """Task worker implementation."""
+    """Task worker implementation.
 
-    def __init__(self) -> None:
-        """Initialize task worker."""
+    Runs a loop pulling tasks from a queue and executing them one at a time.
+    Several workers sharing a queue execute tasks concurrently.
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueue | None = None,
+        executor: Executor | None = None,
+        process_executor: Executor | None = None,
+    ) -> None:
+        """Initialize task worker.
+
+        Args:
+            queue: Queue to pull tasks from
+            executor: Executor for sync task functions
+            process_executor: Process pool for process mode tasks
+        """
         config = TaskConfig(name="task-worker")
         super().__init__(config)
+        self._queue = queue if queue is not None else TaskQueue()
+        self._executor = executor
+        self._process_executor = process_executor
         self._active: bool = False
+        self._loop: asyncio.Task[None] | None = None
+        self._current: Task | None = None
+        self._processed = 0
+        self._failed = 0
 
     async def _setup(self) -> None:
         """Setup task worker."""
@@ -21,19 +48,52 @@ class TaskWorker(BaseModule[TaskConfig]):
 
     async def _teardown(self) -> None:
         """Teardown task worker."""
-        self._active = False
+        await self.stop()
 
     async def start(self) -> None:
         """Start worker."""
         if not self.is_initialized:
             await self.initialize()
+        if self._loop is None or self._loop.done():
+            self._loop = asyncio.create_task(self._run())
         self._active = True
 
     async def stop(self) -> None:
-        """Stop worker."""
+        """Stop worker, cancelling the task it is running."""
         if not self.is_initialized:
             await self.initialize()
         self._active = False
+        if self._loop is not None:
+            self._loop.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._loop
+            self._loop = None
+
+    async def _run(self) -> None:
+        """Pull and execute tasks until stopped."""
+        while True:
+            task: Task = await self._queue.pop()
+            try:
+                if task.is_cancelled:
+                    continue
+                self._current = task
+                try:
+                    if task.mode == "process":
+                        await task.execute(self._process_executor)
+                    else:
+                        await task.execute(self._executor)
+                except Exception:
+                    # Kept on the task, surfaced by Task.wait()
+                    self._failed += 1
+                self._processed += 1
+            finally:
+                self._current = None
+                self._queue.task_done()
+
+    @property
+    def current(self) -> Task | None:
+        """Get the task being executed."""
+        return self._current
 
     async def get_stats(self) -> dict[str, Any]:
         """Get worker statistics.
@@ -48,4 +108,7 @@ class TaskWorker(BaseModule[TaskConfig]):
             "name": self.config.name,
             "enabled": self.config.enabled,
             "active": self._active,
+            "busy": self._current is not None,
+            "processed": self._processed,
+            "failed": self._failed,
         }
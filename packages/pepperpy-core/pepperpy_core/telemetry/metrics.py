@@ -1,9 +1,12 @@
 """Telemetry metrics module."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
 from ..exceptions import PepperpyError
+from ..metrics.exceptions import MetricError
+from ..metrics.registry import MetricFamily, MetricsRegistry
 from ..module import BaseModule
 from .config import TelemetryConfig
 
@@ -31,15 +34,18 @@ class MetricsCollector(BaseModule[TelemetryConfig]):
         """Initialize metrics collector."""
         config = TelemetryConfig(name="metrics-collector")
         super().__init__(config)
-        self._metrics: dict[str, list[MetricData]] = {}
+        self._registry = MetricsRegistry()
+        self._count = 0
 
     async def _setup(self) -> None:
         """Setup metrics collector."""
-        self._metrics.clear()
+        self._registry = MetricsRegistry()
+        self._count = 0
 
     async def _teardown(self) -> None:
         """Teardown metrics collector."""
-        self._metrics.clear()
+        self._registry = MetricsRegistry()
+        self._count = 0
 
     async def collect(
         self, name: str, value: float, tags: dict[str, str] | None = None
@@ -50,24 +56,32 @@ class MetricsCollector(BaseModule[TelemetryConfig]):
             name: Metric name
             value: Metric value
             tags: Optional metric tags
+
+        Raises:
+            MetricsError: If the tags differ from those the metric was
+                first collected with
         """
         if not self.is_initialized:
             await self.initialize()
 
-        if name not in self._metrics:
-            self._metrics[name] = []
+        tags = tags or {}
+        try:
+            self._registry.gauge(name, labels=sorted(tags)).labels(**tags).set(value)
+        except MetricError as e:
+            raise MetricsError(f"Metric {name} collected with different tags", cause=e)
+        self._count += 1
 
-        metric = MetricData(
-            name=name,
-            value=value,
-            tags=tags or {},
-        )
+    def families(self) -> Iterator[MetricFamily]:
+        """Get the latest value of each metric and tag set as gauges.
 
-        metrics = self._metrics[name]
-        metrics.append(metric)
+        Register this method with
+        :meth:`~pepperpy_core.metrics.MetricsRegistry.register_collector` to
+        export the collected metrics.
 
-        if len(metrics) > self.config.buffer_size:
-            self._metrics[name] = metrics[-self.config.buffer_size :]
+        Yields:
+            Metric families
+        """
+        yield from self._registry.iter_families()
 
     async def get_stats(self) -> dict[str, Any]:
         """Get metrics collector statistics.
@@ -78,13 +92,11 @@ class MetricsCollector(BaseModule[TelemetryConfig]):
         if not self.is_initialized:
             await self.initialize()
 
-        total_metrics = sum(len(metrics) for metrics in self._metrics.values())
-
         return {
             "name": self.config.name,
             "enabled": self.config.enabled,
-            "total_metrics": total_metrics,
-            "metric_names": list(self._metrics.keys()),
+            "total_metrics": self._count,
+            "metric_names": [family.name for family in self._registry.families()],
             "buffer_size": self.config.buffer_size,
             "flush_interval": self.config.flush_interval,
         }
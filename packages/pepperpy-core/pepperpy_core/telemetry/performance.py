@@ -1,10 +1,12 @@
 """Performance monitoring module."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from time import perf_counter
 from typing import Any
 
 from ..exceptions import PepperpyError
+from ..metrics.registry import MetricFamily, MetricsRegistry
 from ..module import BaseModule
 from .config import TelemetryConfig
 
@@ -27,13 +29,19 @@ class PerformanceMetric:
 
 
 class PerformanceMonitor(BaseModule[TelemetryConfig]):
-    """Performance monitor implementation."""
+    """Performance monitor implementation.
+
+    Recent samples are buffered for inspection, and every sample is also
+    recorded into a histogram per metric name that lives as long as the
+    monitor, so exported counts and sums only ever grow.
+    """
 
     def __init__(self) -> None:
         """Initialize performance monitor."""
         config = TelemetryConfig(name="performance-monitor")
         super().__init__(config)
         self._metrics: list[PerformanceMetric] = []
+        self._histograms = MetricsRegistry()
 
     async def _setup(self) -> None:
         """Setup performance monitor."""
@@ -67,6 +75,19 @@ class PerformanceMonitor(BaseModule[TelemetryConfig]):
             metadata=metadata or {},
         )
         self._metrics.append(metric)
+        self._histograms.histogram(name, labels=("unit",)).labels(unit).record(value)
+
+    def families(self) -> Iterator[MetricFamily]:
+        """Get every recorded sample as histograms labelled by unit.
+
+        Register this method with
+        :meth:`~pepperpy_core.metrics.MetricsRegistry.register_collector` to
+        export the samples.
+
+        Yields:
+            Metric families
+        """
+        yield from self._histograms.iter_families()
 
     async def get_stats(self) -> dict[str, Any]:
         """Get performance monitor statistics.
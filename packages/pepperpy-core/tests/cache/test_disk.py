@@ -0,0 +1,84 @@
+"""Disk cache tests."""
+
+from pathlib import Path
+
+import pytest
+from pepperpy_core.cache.disk import DiskCache, DiskCacheConfig
+from pepperpy_core.cache.manager import CacheManager, CacheManagerConfig
+from pepperpy_core.cache.tiered import TieredCache
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_survives_restart(tmp_path: Path) -> None:
+    """Test values persist across instances."""
+    config = DiskCacheConfig(path=str(tmp_path))
+    cache = DiskCache(config)
+    await cache.initialize()
+    await cache.set("embedding", [0.1, 0.2])
+    await cache.set("removed", "value")
+    await cache.delete("removed")
+    await cache.cleanup()
+
+    reopened = DiskCache(config)
+    await reopened.initialize()
+    try:
+        assert await reopened.get("embedding") == [0.1, 0.2]
+        assert await reopened.get("removed") is None
+    finally:
+        await reopened.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_compaction_and_growth(tmp_path: Path) -> None:
+    """Test index growth and compaction keep live values."""
+    cache = DiskCache(DiskCacheConfig(path=str(tmp_path)))
+    await cache.initialize()
+    try:
+        for i in range(2000):
+            await cache.set(f"key{i}", i)
+        for _ in range(3):
+            for i in range(500):
+                await cache.set(f"key{i}", b"x" * 1000)
+        await cache.compact()
+
+        stats = await cache.get_stats()
+        assert stats["size"] == 2000
+        assert stats["garbage_bytes"] == 0
+        assert stats["index_slots"] > 1024
+        assert await cache.get("key0") == b"x" * 1000
+        assert await cache.get("key1999") == 1999
+        assert len(list(tmp_path.glob("data.*.seg"))) == 1
+    finally:
+        await cache.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_evicts_oldest(tmp_path: Path) -> None:
+    """Test max_size evicts oldest writes first."""
+    cache = DiskCache(DiskCacheConfig(path=str(tmp_path), max_size=2))
+    await cache.initialize()
+    try:
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.set("c", 3)
+        assert await cache.get("a") is None
+        assert await cache.get("c") == 3
+    finally:
+        await cache.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_promotes_l2_hits(tmp_path: Path) -> None:
+    """Test L2 hits are promoted into L1."""
+    l1 = CacheManager(CacheManagerConfig(name="l1"))
+    l2 = DiskCache(DiskCacheConfig(path=str(tmp_path)))
+    cache = TieredCache(l1, l2)
+    await cache.initialize()
+    try:
+        await l2.set("key", "value")
+        assert await cache.get("key") == "value"
+        assert await l1.get("key") == "value"
+        stats = await cache.get_stats()
+        assert stats["l2_hits"] == 1
+    finally:
+        await cache.cleanup()
@@ -0,0 +1,229 @@
+"""Distributed cache tests."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from pepperpy_core.cache.distributed import (
+    DistributedCache,
+    DistributedCacheConfig,
+    create_local_client,
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.mark.asyncio
+async def test_distributed_cache_batched_operations() -> None:
+    """Test single and batched operations."""
+    cache = DistributedCache(
+        DistributedCacheConfig(serializer="json", batch_size=2),
+        client=create_local_client(),
+    )
+    await cache.initialize()
+    try:
+        await cache.set("a", {"value": 1})
+        await cache.set_many({"b": [2], "c": "3", "d": 4.0})
+        assert await cache.get("a") == {"value": 1}
+        assert await cache.get_many(["a", "b", "c", "d", "missing"]) == {
+            "a": {"value": 1},
+            "b": [2],
+            "c": "3",
+            "d": 4.0,
+        }
+
+        await cache.delete("a")
+        assert await cache.get("a") is None
+        await cache.clear()
+        assert await cache.get_many(["b", "c", "d"]) == {}
+    finally:
+        await cache.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_near_cache_is_invalidated_across_instances() -> None:
+    """Test pub/sub invalidation of the near-cache."""
+    server = fakeredis.FakeServer()
+    config = DistributedCacheConfig(near_cache_size=10)
+    first = DistributedCache(config, client=create_local_client(server))
+    second = DistributedCache(config, client=create_local_client(server))
+    await first.initialize()
+    await second.initialize()
+    try:
+        await first.set("key", "old")
+        assert await second.get("key") == "old"
+
+        await first.set("key", "new")
+        for _ in range(50):
+            if (await second.get_stats())["invalidations"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert await second.get("key") == "new"
+    finally:
+        await first.cleanup()
+        await second.cleanup()
+
+
+async def _wait_for(cache: DistributedCache, stat: str, value: int) -> None:
+    """Wait until a cache statistic reaches a value."""
+    for _ in range(100):
+        if (await cache.get_stats())[stat] >= value:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"{stat} never reached {value}")
+
+
+@pytest.mark.asyncio
+async def test_malformed_invalidations_are_skipped() -> None:
+    """Test a malformed message does not stop the invalidation listener."""
+    server = fakeredis.FakeServer()
+    config = DistributedCacheConfig(near_cache_size=10)
+    first = DistributedCache(config, client=create_local_client(server))
+    second = DistributedCache(config, client=create_local_client(server))
+    await first.initialize()
+    await second.initialize()
+    try:
+        await first.set("key", "old")
+        assert await second.get("key") == "old"
+
+        for message in ("not json", "[1, 2]", '{"keys": 3}'):
+            await first.client.publish(config.invalidation_channel, message)
+        await _wait_for(second, "malformed_invalidations", 3)
+
+        await first.set("key", "new")
+        await _wait_for(second, "invalidations", 1)
+        assert await second.get("key") == "new"
+    finally:
+        await first.cleanup()
+        await second.cleanup()
+
+
+class _DroppingClient:
+    """Client whose first pub/sub connection drops on demand."""
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+        self.drop = asyncio.Event()
+        self.pubsubs = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def pubsub(self, **kwargs: Any) -> Any:
+        pubsub = self._client.pubsub(**kwargs)
+        self.pubsubs += 1
+        if self.pubsubs == 1:
+
+            async def listen() -> AsyncIterator[dict[str, Any]]:
+                await self.drop.wait()
+                raise ConnectionError("connection lost")
+                yield {}
+
+            pubsub.listen = listen
+        return pubsub
+
+
+@pytest.mark.asyncio
+async def test_listener_resubscribes_after_connection_loss() -> None:
+    """Test a lost pub/sub connection clears the near-cache and resubscribes."""
+    server = fakeredis.FakeServer()
+    config = DistributedCacheConfig(near_cache_size=10, resubscribe_delay=0.01)
+    client = _DroppingClient(create_local_client(server))
+    first = DistributedCache(config, client=create_local_client(server))
+    second = DistributedCache(config, client=client)
+    await first.initialize()
+    await second.initialize()
+    try:
+        await first.set("key", "old")
+        assert await second.get("key") == "old"
+
+        # Missed by the dead connection, dropped with the near-cache
+        await first.set("key", "new")
+        client.drop.set()
+        await _wait_for(second, "resubscriptions", 1)
+        assert await second.get("key") == "new"
+
+        await first.set("key", "newer")
+        await _wait_for(second, "invalidations", 1)
+        assert await second.get("key") == "newer"
+        assert client.pubsubs == 2
+    finally:
+        await first.cleanup()
+        await second.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_near_cache_follows_server_ttl() -> None:
+    """Test near-cache entries expire with their keys on the server."""
+    server = fakeredis.FakeServer()
+    config = DistributedCacheConfig(near_cache_size=10, near_cache_ttl=60)
+    first = DistributedCache(config, client=create_local_client(server))
+    second = DistributedCache(config, client=create_local_client(server))
+    await first.initialize()
+    await second.initialize()
+    try:
+        await first.set("written", "value", ttl=1)
+        await first.set_many({"batched": "value"}, ttl=1)
+        assert await second.get("written") == "value"
+        assert await second.get_many(["batched"]) == {"batched": "value"}
+
+        await asyncio.sleep(1.1)
+        for cache in (first, second):
+            assert await cache.get("written") is None
+            assert await cache.get_many(["batched"]) == {}
+    finally:
+        await first.cleanup()
+        await second.cleanup()
+
+
+class _SlowClient:
+    """Client whose pipelined reads are delivered on demand."""
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+        self.deliver = asyncio.Event()
+        self.read = asyncio.Event()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def pipeline(self, **kwargs: Any) -> Any:
+        pipe = self._client.pipeline(**kwargs)
+        execute = pipe.execute
+
+        async def delayed() -> Any:
+            result = await execute()
+            self.read.set()
+            await self.deliver.wait()
+            return result
+
+        pipe.execute = delayed
+        return pipe
+
+
+@pytest.mark.asyncio
+async def test_near_cache_skips_values_invalidated_while_read() -> None:
+    """Test a read racing an invalidation does not keep the old value."""
+    server = fakeredis.FakeServer()
+    config = DistributedCacheConfig(near_cache_size=10)
+    client = _SlowClient(create_local_client(server))
+    first = DistributedCache(config, client=create_local_client(server))
+    second = DistributedCache(config, client=client)
+    await first.initialize()
+    await second.initialize()
+    try:
+        await first.set("key", "old")
+        read = asyncio.create_task(second.get("key"))
+        await asyncio.wait_for(client.read.wait(), 1.0)
+
+        await first.set("key", "new")
+        await _wait_for(second, "invalidations", 1)
+        client.deliver.set()
+        assert await read == "old"
+
+        assert await second.get("key") == "new"
+    finally:
+        await first.cleanup()
+        await second.cleanup()
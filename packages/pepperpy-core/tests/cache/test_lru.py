@@ -0,0 +1,46 @@
+"""LRU cache tests."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pepperpy_core.cache.lru import ConcurrentLRUCache
+
+
+def test_concurrent_lru_bulk_operations() -> None:
+    """Test bulk get and put."""
+    cache: ConcurrentLRUCache[str, int] = ConcurrentLRUCache(capacity=100, shards=4)
+    cache.put_many({"a": 1, "b": 2})
+    cache.put_many([("c", 3)])
+
+    assert cache.get_many(["a", "c", "missing"]) == {"a": 1, "c": 3}
+    cache.remove("a")
+    assert "a" not in cache
+    assert len(cache) == 2
+
+
+def test_concurrent_lru_evicts_per_shard() -> None:
+    """Test eviction keeps least recently used keys out."""
+    cache: ConcurrentLRUCache[int, int] = ConcurrentLRUCache(capacity=2, shards=1)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    assert cache.get(1) == 1
+    cache.put(3, 3)
+
+    assert cache.get(2) is None
+    assert cache.get(1) == 1
+    assert cache.get(3) == 3
+
+
+def test_concurrent_lru_from_threads() -> None:
+    """Test capacity holds under concurrent writers."""
+    cache: ConcurrentLRUCache[int, int] = ConcurrentLRUCache(capacity=100, shards=8)
+
+    def worker(offset: int) -> None:
+        for key in range(offset, offset + 1000):
+            cache.put(key, key)
+            cache.get(key - 1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(worker, range(0, 8000, 1000)))
+
+    assert len(cache) <= 100
+    assert all(cache.get(key) == key for key in cache.get_many(range(8000)))
@@ -0,0 +1,87 @@
+"""Cache request coalescing tests."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from pepperpy_core.cache.lru import LRUCache
+from pepperpy_core.cache.manager import CacheManager, CacheManagerConfig
+from pepperpy_core.cache.memory import MemoryCache
+
+
+class _Factory:
+    """Slow factory counting its calls."""
+
+    def __init__(self) -> None:
+        """Initialize factory."""
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        """Compute value."""
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.calls
+
+
+async def _get_or_compute(cache: Any, factory: _Factory, **kwargs: Any) -> Any:
+    return await cache.get_or_compute("key", factory, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_type", ["manager", "memory", "lru"])
+async def test_concurrent_misses_share_one_call(cache_type: str) -> None:
+    """Test concurrent misses run the factory once."""
+    cache: Any = {
+        "manager": lambda: CacheManager(CacheManagerConfig(name="test")),
+        "memory": MemoryCache,
+        "lru": lambda: LRUCache(10),
+    }[cache_type]()
+    factory = _Factory()
+
+    results = await asyncio.gather(*(_get_or_compute(cache, factory, ttl=60) for _ in range(20)))
+
+    assert results == [1] * 20
+    assert factory.calls == 1
+    assert await _get_or_compute(cache, factory) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_type", ["manager", "memory", "lru"])
+async def test_stale_value_served_while_refreshing(cache_type: str) -> None:
+    """Test stale-while-revalidate."""
+    cache: Any = {
+        "manager": lambda: CacheManager(CacheManagerConfig(name="test")),
+        "memory": MemoryCache,
+        "lru": lambda: LRUCache(10),
+    }[cache_type]()
+    factory = _Factory()
+
+    assert await _get_or_compute(cache, factory, ttl=0.01, stale_ttl=60) == 1
+    await asyncio.sleep(0.02)
+
+    stale = await asyncio.gather(
+        *(_get_or_compute(cache, factory, ttl=60, stale_ttl=60) for _ in range(5))
+    )
+    assert stale == [1] * 5
+    await asyncio.sleep(0.02)
+
+    assert await _get_or_compute(cache, factory) == 2
+    assert factory.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_factory_error_reaches_every_waiter() -> None:
+    """Test failures are shared and not cached."""
+    cache = MemoryCache()
+
+    async def failing() -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(cache.get_or_compute("key", failing) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert cache.get("key") is None
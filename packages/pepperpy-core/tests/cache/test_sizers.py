@@ -0,0 +1,108 @@
+"""Byte-weighted cache accounting tests."""
+
+import pytest
+from pepperpy_core.cache.lru import LRUCache
+from pepperpy_core.cache.manager import CacheManager, CacheManagerConfig
+from pepperpy_core.cache.memory import MemoryCache
+from pepperpy_core.cache.sizers import deep_sizeof, get_sizer, len_sizeof, shallow_sizeof
+
+
+class _Buffer:
+    """Array-like value exposing nbytes."""
+
+    nbytes = 4096
+
+
+def test_sizers_measure_values() -> None:
+    """Test deep, len and nbytes sizing."""
+    nested = {"rows": [b"x" * 100, b"y" * 100]}
+    assert deep_sizeof(nested) > shallow_sizeof(nested) + 200
+    assert len_sizeof(b"x" * 100) == 100
+    assert get_sizer("auto")(_Buffer()) == 4096
+    with pytest.raises(ValueError):
+        get_sizer("unknown")
+
+
+class _Holder:
+    """Value keeping references to other objects."""
+
+    def __init__(self, *refs: object) -> None:
+        self.refs = refs
+
+
+def test_deep_sizeof_skips_shared_objects() -> None:
+    """Test modules, classes and functions a value refers to are not counted."""
+    alone = deep_sizeof(_Holder())
+    assert deep_sizeof(_Holder(pytest, _Holder, deep_sizeof, len, alone.bit_length)) < alone + 100
+
+
+def test_lru_cache_max_bytes() -> None:
+    """Test LRU cache evicts by byte budget."""
+    cache: LRUCache[str, bytes] = LRUCache(100, max_bytes=250, sizer=len)
+    cache.put("a", b"x" * 100)
+    cache.put("b", b"x" * 100)
+    cache.get("a")
+    cache.put("c", b"x" * 100)
+    cache.put("huge", b"x" * 1000)
+
+    assert cache.get("b") is None
+    assert cache.get("huge") is None
+    assert cache.nbytes == 200
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_memory_cache_max_bytes() -> None:
+    """Test memory cache evicts least recently used values by byte budget."""
+    cache = MemoryCache(max_bytes=200, sizer=len)
+    cache.set("a", b"x" * 100)
+    cache.set("b", b"x" * 100)
+    cache.set("a", b"x" * 50)
+    cache.set("c", b"x" * 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"x" * 50
+    assert cache.get_stats()["bytes"] == 150
+
+    # Reading "a" makes "c" the least recently used value
+    cache.set("d", b"x" * 100)
+    assert cache.get("c") is None
+    assert cache.get("a") == b"x" * 50
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_max_bytes() -> None:
+    """Test manager byte budget with size policy."""
+    config = CacheManagerConfig(name="sized", eviction_policy="size", max_bytes=300, sizer="len")
+    manager = CacheManager(config)
+    await manager.initialize()
+    try:
+        await manager.set("small", b"x" * 50)
+        await manager.set("large", b"x" * 200)
+        await manager.set("medium", b"x" * 100)
+
+        assert await manager.get("large") is None
+        assert await manager.get("small") == b"x" * 50
+        stats = await manager.get_stats()
+        assert stats["memory_estimate"] == 150
+        assert stats["max_bytes"] == 300
+    finally:
+        await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_sizes_shallowly_without_budget() -> None:
+    """Test values are not walked when no byte budget or size policy needs it."""
+    value = [list(range(100)) for _ in range(10)]
+    manager = CacheManager(CacheManagerConfig(name="unsized"))
+    budgeted = CacheManager(CacheManagerConfig(name="sized", max_bytes=1 << 20))
+    await manager.initialize()
+    await budgeted.initialize()
+    try:
+        await manager.set("value", value)
+        await budgeted.set("value", value)
+
+        assert (await manager.get_stats())["memory_estimate"] == shallow_sizeof(value)
+        assert (await budgeted.get_stats())["memory_estimate"] == deep_sizeof(value)
+    finally:
+        await manager.cleanup()
+        await budgeted.cleanup()
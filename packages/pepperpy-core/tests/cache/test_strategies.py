@@ -0,0 +1,120 @@
+"""Cache strategy tests."""
+
+import asyncio
+
+import pytest
+from pepperpy_core.cache.manager import CacheManager, CacheManagerConfig
+from pepperpy_core.cache.strategies import (
+    FIFOStrategy,
+    LFUStrategy,
+    LRUStrategy,
+    SizeStrategy,
+)
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used() -> None:
+    """Test LRU eviction order."""
+    strategy = LRUStrategy(max_size=2)
+    await strategy.set("a", 1)
+    await strategy.set("b", 2)
+    assert await strategy.get("a") == 1
+
+    await strategy.set("c", 3)
+
+    assert await strategy.get("b") is None
+    assert await strategy.get("a") == 1
+    assert await strategy.get("c") == 3
+    stats = await strategy.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lfu_evicts_least_frequently_used() -> None:
+    """Test LFU eviction order."""
+    strategy = LFUStrategy(max_size=2)
+    await strategy.set("a", 1)
+    await strategy.set("b", 2)
+    await strategy.get("a")
+    await strategy.get("a")
+    await strategy.get("b")
+
+    await strategy.set("c", 3)
+
+    assert "b" not in strategy
+    assert "a" in strategy
+    assert "c" in strategy
+    assert await strategy.delete("a")
+    assert await strategy.evict() == "c"
+    assert len(strategy) == 0
+
+
+@pytest.mark.asyncio
+async def test_ttl_expires_lazily_and_by_sweeper() -> None:
+    """Test TTL expiry on read and in the background sweeper."""
+    strategy = LRUStrategy(max_size=10, ttl=0.01)
+    await strategy.set("lazy", 1)
+    await strategy.set("swept", 2)
+    await strategy.set("kept", 3, ttl=60)
+    await asyncio.sleep(0.02)
+
+    assert await strategy.get("lazy") is None
+
+    strategy.start_sweeper(0.01)
+    await asyncio.sleep(0.03)
+    await strategy.stop_sweeper()
+
+    assert len(strategy) == 1
+    assert await strategy.get("kept") == 3
+    stats = await strategy.get_stats()
+    assert stats["expirations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fifo_and_size_eviction_order() -> None:
+    """Test FIFO and size-weighted eviction order."""
+    fifo = FIFOStrategy(max_size=2)
+    await fifo.set("a", 1)
+    await fifo.set("b", 2)
+    await fifo.get("a")
+    await fifo.set("c", 3)
+    assert "a" not in fifo
+
+    by_size = SizeStrategy(max_size=2, sizer=len)
+    await by_size.set("big", "x" * 100)
+    await by_size.set("small", "x")
+    await by_size.set("new", "xx")
+    assert "big" not in by_size
+    assert (await by_size.get_stats())["bytes"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_is_bounded() -> None:
+    """Test cache manager size bound, TTL and stats."""
+    manager = CacheManager(
+        CacheManagerConfig(name="test", max_size=2, ttl=60, eviction_policy="lfu")
+    )
+    await manager.initialize()
+    try:
+        for i in range(5):
+            await manager.set(f"key{i}", i)
+        await manager.set("short", "value", ttl=0.01)
+        await asyncio.sleep(0.02)
+        assert await manager.get("short") is None
+        assert await manager.get("key4") == 4
+
+        stats = await manager.get_stats()
+        assert stats["size"] == 1
+        assert stats["evictions"] == 4
+        assert stats["hit_ratio"] == 0.5
+        assert stats["memory_estimate"] > 0
+    finally:
+        await manager.cleanup()
+
+
+def test_cache_manager_rejects_unknown_policy() -> None:
+    """Test eviction policy validation."""
+    with pytest.raises(ValueError):
+        CacheManagerConfig(name="test", eviction_policy="random").validate()
@@ -0,0 +1,126 @@
+"""Test cross-process event bus."""
+
+import asyncio
+import socket
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pepperpy_core.event_bus import EventBus, EventBusClient, EventBusConfig
+from pepperpy_core.events import Event, EventError
+from pepperpy_core.module import BaseModule
+
+pytest.importorskip("msgpack")
+
+
+async def wait_for(condition: Callable[[], bool], timeout: float = 1.0) -> None:
+    """Poll until a condition holds."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.005)
+
+
+async def wait_for_stat(module: BaseModule[Any], name: str, value: Any) -> None:
+    """Poll until a module statistic has a value."""
+    async with asyncio.timeout(1.0):
+        while (await module.get_stats())[name] != value:
+            await asyncio.sleep(0.005)
+
+
+@pytest.mark.asyncio
+async def test_events_reach_subscribed_processes(tmp_path: Path) -> None:
+    """Test hub and clients exchange events filtered by subscription."""
+    config = EventBusConfig(name="bus", path=str(tmp_path / "bus.sock"), reconnect_delay=0.01)
+    hub = EventBus(config)
+    first = EventBusClient(config)
+    second = EventBusClient(config)
+    await hub.initialize()
+    await first.initialize()
+    await second.initialize()
+    await first.wait_connected(1.0)
+    await second.wait_connected(1.0)
+
+    seen: dict[str, list[tuple[str, object]]] = {"hub": [], "first": [], "second": []}
+    hub.events.subscribe("#", lambda e: seen["hub"].append((e.name, e.data)))
+    first.subscribe("cache.*", lambda e: seen["first"].append((e.name, e.data)))
+    first.subscribe("cache.#", lambda e: seen["first"].append((e.name, e.data)))
+    second.subscribe("config.reload", lambda e: seen["second"].append((e.name, e.data)))
+    await wait_for_stat(hub, "subscriptions", 3)
+
+    hub.publish(Event("cache.invalidate", {"key": "user:1"}))
+    hub.publish(Event("metrics.flush", None))
+    second.publish(Event("cache.invalidate", ["user:2"]))
+    first.publish(Event("config.reload", b"\x00v2"))
+    await wait_for(lambda: len(seen["first"]) == 4 and len(seen["second"]) == 1)
+    await wait_for(lambda: len(seen["hub"]) == 4)
+
+    # Each remote event crosses the socket once and matches both local patterns
+    assert seen["first"] == [
+        ("cache.invalidate", {"key": "user:1"}),
+        ("cache.invalidate", {"key": "user:1"}),
+        ("cache.invalidate", ["user:2"]),
+        ("cache.invalidate", ["user:2"]),
+    ]
+    assert seen["second"] == [("config.reload", b"\x00v2")]
+    assert ("metrics.flush", None) in seen["hub"]
+    stats = await hub.get_stats()
+    assert stats["peers"] == 2 and stats["dropped"] == 0
+
+    await first.cleanup()
+    await second.cleanup()
+    await hub.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_client_resubscribes_after_reconnect(tmp_path: Path) -> None:
+    """Test a client registers its patterns again with a restarted hub."""
+    config = EventBusConfig(name="bus", path=str(tmp_path / "bus.sock"), reconnect_delay=0.01)
+    hub = EventBus(config)
+    client = EventBusClient(config)
+    received: list[object] = []
+    await hub.initialize()
+    await client.initialize()
+    client.subscribe("config.reload", lambda e: received.append(e.data))
+    await client.wait_connected(1.0)
+
+    await hub.cleanup()
+    await wait_for_stat(client, "connected", False)
+    assert client.publish(Event("config.reload", 1)) is False
+
+    await hub.initialize()
+    await client.wait_connected(1.0)
+    await wait_for_stat(hub, "subscriptions", 1)
+    hub.publish(Event("config.reload", 2))
+    await wait_for(lambda: received == [1, 2])
+
+    await client.cleanup()
+    await hub.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_hub_refuses_a_live_socket(tmp_path: Path) -> None:
+    """Test a hub replaces a stale socket but never a running hub's one."""
+    path = tmp_path / "bus.sock"
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(str(path))
+    stale.close()
+    config = EventBusConfig(name="bus", path=str(path))
+    hub = EventBus(config)
+    await hub.initialize()
+
+    other = EventBus(config)
+    with pytest.raises(EventError, match="listening"):
+        await other.initialize()
+    assert not other.is_initialized
+
+    client = EventBusClient(config)
+    await client.initialize()
+    await client.wait_connected(1.0)
+    await client.cleanup()
+    await hub.cleanup()
+
+    path.write_text("not a socket")
+    with pytest.raises(EventError, match="not a socket"):
+        await other.initialize()
+    assert path.read_text() == "not a socket"
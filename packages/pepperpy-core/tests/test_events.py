@@ -0,0 +1,190 @@
+"""Test event system."""
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from pepperpy_core.events import Event, EventError, EventManager
+
+
+@pytest.fixture
+def events() -> EventManager:
+    """Create event manager fixture."""
+    manager = EventManager()
+    manager.initialize()
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_block_emit(events: EventManager) -> None:
+    """Test queued subscribers run off the emit path."""
+    received: list[int] = []
+
+    async def telemetry(event: Event) -> None:
+        await asyncio.sleep(0.01)
+        received.append(event.data)
+
+    events.subscribe("request.done", telemetry)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for i in range(10):
+        events.emit(Event("request.done", i))
+    assert loop.time() - start < 0.01
+
+    await events.join()
+    assert received == list(range(10))
+    events.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_handler_errors_are_isolated(events: EventManager) -> None:
+    """Test failing handlers do not affect other subscribers."""
+    received: list[str] = []
+
+    def broken(event: Event) -> None:
+        raise ValueError("broken")
+
+    async def failing(event: Event) -> None:
+        raise ValueError("broken")
+
+    events.subscribe("file.read", broken)
+    events.subscribe("file.read", lambda event: received.append("inline"))
+    subscriber = events.subscribe("file.read", failing)
+    events.subscribe("file.read", lambda event: received.append("queued"), queue_size=10)
+
+    with pytest.raises(EventError):
+        events.emit(Event("file.read", None))
+    await events.join()
+
+    assert sorted(received) == ["inline", "queued"]
+    assert subscriber is not None and subscriber.errors == 1
+    events.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_overflow_policies(events: EventManager) -> None:
+    """Test drop_oldest, sample and block overflow policies."""
+    seen: dict[str, list[int]] = {"oldest": [], "sample": [], "block": []}
+    oldest = events.subscribe("tick", lambda e: seen["oldest"].append(e.data), queue_size=2)
+    sample = events.subscribe(
+        "tick",
+        lambda e: seen["sample"].append(e.data),
+        queue_size=2,
+        overflow="sample",
+        sample_rate=0.0,
+    )
+    events.subscribe("tock", lambda e: seen["block"].append(e.data), queue_size=2, overflow="block")
+
+    for i in range(5):
+        events.emit(Event("tick", i))
+    for i in range(5):
+        await events.publish(Event("tock", i))
+    await events.join()
+
+    assert seen["oldest"] == [3, 4]
+    assert seen["sample"] == [0, 1]
+    assert seen["block"] == [0, 1, 2, 3, 4]
+    assert oldest is not None and oldest.dropped == 3
+    assert sample is not None and sample.dropped == 3
+    events.cleanup()
+
+
+def test_wildcard_subscriptions(events: EventManager) -> None:
+    """Test single and multi-level wildcard topics."""
+    received: list[tuple[str, str]] = []
+
+    def recorder(pattern: str) -> Callable[[Event], None]:
+        return lambda event: received.append((pattern, event.name))
+
+    for pattern in ("files.read.*", "llm.#", "#", "files.read.text"):
+        events.subscribe(pattern, recorder(pattern))
+
+    events.emit(Event("files.read.text", None))
+    events.emit(Event("files.read", None))
+    events.emit(Event("llm", None))
+    events.emit(Event("llm.chat.done", None))
+
+    assert sorted(received) == [
+        ("#", "files.read"),
+        ("#", "files.read.text"),
+        ("#", "llm"),
+        ("#", "llm.chat.done"),
+        ("files.read.*", "files.read.text"),
+        ("files.read.text", "files.read.text"),
+        ("llm.#", "llm"),
+        ("llm.#", "llm.chat.done"),
+    ]
+    with pytest.raises(ValueError):
+        events.subscribe("llm.#.done", recorder("bad"))
+
+
+def test_wildcard_cache_invalidation(events: EventManager) -> None:
+    """Test resolved topics follow subscribe and unsubscribe."""
+    received: list[str] = []
+
+    def handler(event: Event) -> None:
+        received.append(event.name)
+
+    events.emit(Event("llm.chat", None))
+    events.subscribe("llm.*", handler)
+    events.emit(Event("llm.chat", None))
+    events.unsubscribe("llm.*", handler)
+    events.emit(Event("llm.chat", None))
+
+    assert received == ["llm.chat"]
+
+
+def test_emit_many(events: EventManager) -> None:
+    """Test batched emission delivers every event before raising."""
+    received: list[int] = []
+
+    def handler(event: Event) -> None:
+        if event.data == 1:
+            raise ValueError("broken")
+        received.append(event.data)
+
+    events.subscribe("batch.*", handler)
+    with pytest.raises(EventError):
+        events.emit_many(Event(f"batch.{i}", i) for i in range(4))
+    assert received == [0, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_coalescing_window(events: EventManager) -> None:
+    """Test bursts deliver their first and last events only."""
+    received: list[tuple[str, int]] = []
+    events.subscribe("file.#", lambda event: received.append((event.name, event.data)))
+    events.coalesce("file.changed.*", 0.02)
+
+    events.emit_many(Event("file.changed.a", i) for i in range(5))
+    events.emit(Event("file.changed.b", 0))
+    events.emit(Event("file.saved", 0))
+    assert received == [("file.changed.a", 0), ("file.changed.b", 0), ("file.saved", 0)]
+
+    await asyncio.sleep(0.05)
+    assert received[3:] == [("file.changed.a", 4)]
+    assert events.get_stats()["coalesced"] == {"file.changed.*": 3}
+
+    events.emit(Event("file.changed.a", 5))
+    assert received[-1] == ("file.changed.a", 5)
+    events.coalesce("file.changed.*", None)
+    events.emit(Event("file.changed.a", 6))
+    assert received[-1] == ("file.changed.a", 6)
+    events.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_coalescing_max_wait(events: EventManager) -> None:
+    """Test a steady stream still delivers trailing events."""
+    received: list[int] = []
+    events.subscribe("progress", lambda event: received.append(event.data))
+    events.coalesce("progress", 0.05, key=lambda event: event.data // 100, max_wait=0.05)
+
+    for i in range(10):
+        events.emit(Event("progress", i))
+        await asyncio.sleep(0.02)
+    await asyncio.sleep(0.1)
+
+    assert received[0] == 0 and received[-1] == 9
+    assert 3 <= len(received) < 10
+    events.cleanup()
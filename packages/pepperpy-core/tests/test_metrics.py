@@ -4,7 +4,7 @@ from collections.abc import AsyncGenerator
 
 import pytest
 from pepperpy_core.telemetry.config import TelemetryConfig
-from pepperpy_core.telemetry.metrics import MetricsCollector
+from pepperpy_core.telemetry.metrics import MetricsCollector, MetricsError
 
 
 @pytest.fixture
@@ -79,3 +79,23 @@ async def test_cleanup(
 
     await collector.cleanup()
     assert not collector.is_initialized
+
+
+@pytest.mark.asyncio
+async def test_latest_value_per_tags(
+    metrics_collector: AsyncGenerator[MetricsCollector, None]
+) -> None:
+    """Test samples are folded into one gauge series per tag combination."""
+    collector = await anext(metrics_collector)
+    for value in (1.0, 2.0, 3.0):
+        await collector.collect(name="load", value=value, tags={"host": "a"})
+    await collector.collect(name="load", value=9.0, tags={"host": "b"})
+
+    series = {
+        item["labels"]["host"]: item["value"]
+        for item in collector._registry.collect()["load"]
+    }
+    assert series == {"a": 3.0, "b": 9.0}
+    assert (await collector.get_stats())["total_metrics"] == 4
+    with pytest.raises(MetricsError):
+        await collector.collect(name="load", value=1.0, tags={"zone": "x"})
@@ -0,0 +1,93 @@
+"""Test metrics decorators functionality."""
+
+import pytest
+from pepperpy_core.metrics import MetricsCollector, MetricsConfig, MetricsRegistry
+from pepperpy_core.metrics.decorators import count, timing
+
+
+def test_sync_timing_without_event_loop() -> None:
+    """Test timing a sync function records without a running loop."""
+    registry = MetricsRegistry()
+
+    @timing(registry=registry, name="tokenize_seconds")
+    def tokenize(text: str) -> list[str]:
+        return text.split()
+
+    assert tokenize("a b c") == ["a", "b", "c"]
+    tokenize("d")
+
+    histogram = registry.get("tokenize_seconds")
+    assert histogram is not None
+    snapshot = histogram.snapshot()
+    assert snapshot.count == 2
+    assert snapshot.total > 0
+
+
+def test_sampling() -> None:
+    """Test sampled decorators time and count one call in N."""
+    registry = MetricsRegistry()
+
+    @count(registry=registry, name="calls", sample=4)
+    @timing(registry=registry, name="duration", sample=4)
+    def work() -> None:
+        pass
+
+    for _ in range(10):
+        work()
+
+    assert registry.collect()["duration"][0]["value"]["count"] == 3
+    assert registry.collect()["calls"][0]["value"] == 12
+    with pytest.raises(ValueError):
+        timing(sample=0)
+
+
+def test_sync_collector_recording() -> None:
+    """Test a given collector receives sync calls without scheduling tasks."""
+    registry = MetricsRegistry()
+    collector = MetricsCollector(MetricsConfig(name="metrics"))
+
+    @count(collector, registry=registry)
+    def work() -> None:
+        pass
+
+    work()
+    work()
+
+    key = f"{__name__}.test_sync_collector_recording.<locals>.work"
+    assert collector._registry.collect()[key][0]["value"] == 2
+    assert registry.get(f"{key}_calls_total") is not None
+
+
+def test_sampled_count_reports_sampled_calls() -> None:
+    """Test a sampled count only reports to the collector on counted calls."""
+    registry = MetricsRegistry()
+    collector = MetricsCollector(MetricsConfig(name="metrics"))
+
+    @count(collector, registry=registry, name="calls", sample=4)
+    def work() -> None:
+        pass
+
+    for _ in range(10):
+        work()
+
+    assert collector._count == 3
+    assert collector._registry.collect()[f"{__name__}.{work.__qualname__}"][0]["value"] == 12
+
+
+@pytest.mark.asyncio
+async def test_async_timing() -> None:
+    """Test timing and counting coroutine functions."""
+    registry = MetricsRegistry()
+    collector = MetricsCollector(MetricsConfig(name="metrics"))
+
+    @count(registry=registry, name="calls")
+    @timing(collector, registry=registry, name="duration")
+    async def work(value: int) -> int:
+        return value * 2
+
+    assert await work(2) == 4
+    assert await work(3) == 6
+
+    assert registry.collect()["calls"][0]["value"] == 2
+    assert registry.collect()["duration"][0]["value"]["count"] == 2
+    assert any(name.endswith("work") for name in collector._registry.collect())
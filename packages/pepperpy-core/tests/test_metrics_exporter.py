@@ -0,0 +1,196 @@
+"""Test OpenMetrics exporter functionality."""
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+from pepperpy_core import monitoring
+from pepperpy_core.metrics import (
+    MetricsCollector,
+    MetricsRegistry,
+    OpenMetricsConfig,
+    OpenMetricsExporter,
+    default_registry,
+    render_openmetrics,
+)
+from pepperpy_core.metrics.registry import MetricFamily
+from pepperpy_core.telemetry import PerformanceMonitor
+
+
+def test_render_openmetrics() -> None:
+    """Test counters, gauges and histograms are rendered with labels."""
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests served", ("route",)).labels("/a").inc(3)
+    registry.gauge("in_flight").set(2)
+    latency = registry.histogram("latency_seconds", labels=("route",)).labels(route='say "hi"')
+    for value in (0.001, 0.002, 0.5):
+        latency.record(value)
+
+    text, truncated = render_openmetrics(registry)
+
+    assert not truncated
+    lines = text.splitlines()
+    assert "# TYPE requests counter" in lines
+    assert "# HELP requests Requests served" in lines
+    assert 'requests_total{route="/a"} 3.0' in lines
+    assert "in_flight 2" in lines
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{route="say \\"hi\\"",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="say \\"hi\\""} 3' in lines
+    assert lines[-1] == "# EOF"
+
+
+def test_render_bounds_series_and_buckets() -> None:
+    """Test a scrape renders a bounded number of series and buckets."""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests", labels=("user",))
+    for user in range(50):
+        requests.labels(str(user)).inc()
+    latency = registry.histogram("latency")
+    for exponent in range(-20, 0):
+        latency.record(2.0**exponent)
+
+    text, truncated = render_openmetrics(registry, max_series=51, max_buckets=4)
+
+    assert not truncated
+    buckets = [line for line in text.splitlines() if line.startswith("latency_bucket")]
+    assert len(buckets) == 5
+    assert buckets[-2].endswith(" 20")
+
+    text, truncated = render_openmetrics(registry, max_series=10)
+
+    assert truncated
+    assert text.count("requests_total{") == 10
+    assert "latency" not in text
+    assert text.endswith("# EOF\n")
+
+
+def test_render_stops_reading_at_the_limit() -> None:
+    """Test collectors past the series limit are not read."""
+    registry = MetricsRegistry()
+    read: list[int] = []
+
+    def many() -> Iterator[MetricFamily]:
+        for index in range(20_000):
+            read.append(index)
+            family = MetricFamily(f"series_{index}", "gauge")
+            family.labels().set(index)
+            yield family
+
+    registry.register_collector(many)
+    text, truncated = render_openmetrics(registry, max_series=10)
+
+    assert truncated
+    assert text.count("# TYPE") == 10
+    assert len(read) == 11
+
+
+def test_collectors_are_rendered() -> None:
+    """Test metrics kept by collectors are exported through the registry."""
+    registry = MetricsRegistry()
+    collector = MetricsCollector()
+    collector.record("queue.depth", 7, {"queue": "jobs"})
+    monitor = PerformanceMonitor()
+    registry.register_collector(collector.families)
+    registry.register_collector(monitor.families)
+
+    asyncio.run(monitor.record_metric("query", 0.25, "seconds"))
+    text, _ = render_openmetrics(registry)
+
+    assert 'queue_depth{queue="jobs"} 7' in text
+    assert 'query_count{unit="seconds"} 1' in text
+
+    registry.unregister_collector(collector.families)
+    assert "queue_depth" not in render_openmetrics(registry)[0]
+
+
+def test_performance_histograms_only_grow() -> None:
+    """Test samples leaving the monitor's buffer stay counted in the export."""
+    registry = MetricsRegistry()
+    monitor = PerformanceMonitor()
+    monitor.config.buffer_size = 2
+    registry.register_collector(monitor.families)
+
+    async def record() -> None:
+        for value in (0.1, 0.2, 0.3, 0.4):
+            await monitor.record_metric("query", value, "seconds")
+
+    asyncio.run(record())
+    text, _ = render_openmetrics(registry)
+
+    assert 'query_count{unit="seconds"} 4' in text
+    assert 'query_bucket{unit="seconds",le="+Inf"} 4' in text
+
+
+def test_monitoring_metrics_are_exported() -> None:
+    """Test the monitoring histograms and counters record into the registry."""
+    monitoring.RENDER_TIME.labels(template_name="index").observe(0.01)
+    monitoring.record_error("ValueError")
+
+    text, _ = render_openmetrics(default_registry)
+
+    assert 'render_time_seconds_count{template_name="index"}' in text
+    assert 'errors_total{error_type="ValueError"}' in text
+
+
+def test_render_skips_duplicate_families() -> None:
+    """Test a name rendered once keeps later families of the same name out."""
+    registry = MetricsRegistry()
+    registry.gauge("queue_depth").set(1)
+    registry.counter("jobs").inc()
+    collector = MetricsCollector()
+    collector.record("queue.depth", 7)
+    collector.record("jobs_total", 3)
+    registry.register_collector(collector.families)
+
+    text, _ = render_openmetrics(registry)
+
+    assert text.count("# TYPE queue_depth") == 1
+    assert "queue_depth 1" in text.splitlines()
+    assert text.count("jobs_total") == 1
+
+    other = MetricsRegistry()
+    other.register_collector(collector.families)
+    other.register_collector(collector.families.__call__)
+    assert [family.name for family in other.families()] == ["queue.depth", "jobs_total"]
+
+
+async def _get(port: int, path: str) -> tuple[str, str]:
+    """Send a GET request, returning the status line and body."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    head, _, body = response.decode().partition("\r\n\r\n")
+    return head.split("\r\n", 1)[0], body
+
+
+@pytest.mark.asyncio
+async def test_exporter_serves_metrics() -> None:
+    """Test the exporter answers scrapes and caches the rendering."""
+    registry = MetricsRegistry()
+    counter = registry.counter("scraped")
+    exporter = OpenMetricsExporter(
+        OpenMetricsConfig(name="exporter", port=0, cache_ttl=60), registry
+    )
+    await exporter.initialize()
+    try:
+        assert exporter.port is not None
+        counter.inc()
+        status, body = await _get(exporter.port, "/metrics?x=1")
+        assert status == "HTTP/1.1 200 OK"
+        assert "scraped_total 1.0" in body
+
+        # Served from the cached rendering
+        counter.inc()
+        _, body = await _get(exporter.port, "/metrics")
+        assert "scraped_total 1.0" in body
+
+        status, _ = await _get(exporter.port, "/other")
+        assert status == "HTTP/1.1 404 Not Found"
+        stats = await exporter.get_stats()
+        assert stats["scrapes"] == 2
+        assert stats["truncated"] is False
+    finally:
+        await exporter.cleanup()
@@ -0,0 +1,151 @@
+"""Test metrics registry functionality."""
+
+import random
+import threading
+
+import pytest
+from pepperpy_core.metrics import MetricsCollector, MetricsConfig, MetricsRegistry
+from pepperpy_core.metrics.exceptions import MetricError, MetricValueError
+
+
+def test_counter_merges_thread_shards() -> None:
+    """Test counter increments from several threads are all counted."""
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", labels=("route",))
+    child = counter.labels(route="/items")
+
+    def work() -> None:
+        for _ in range(10_000):
+            child.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert child.value == 40_000
+    assert counter.labels("/items") is child
+    assert registry.collect()["requests_total"] == [
+        {"labels": {"route": "/items"}, "value": 40_000}
+    ]
+    with pytest.raises(MetricValueError):
+        child.inc(-1)
+
+
+def test_dead_thread_shards_are_retired() -> None:
+    """Test shards of exited threads are merged instead of kept one per thread."""
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs").labels()
+    gauge = registry.gauge("depth").labels()
+    histogram = registry.histogram("latency").labels()
+
+    def work() -> None:
+        counter.inc()
+        gauge.inc(2)
+        histogram.record(0.5)
+
+    for _ in range(3):
+        threads = [threading.Thread(target=work) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert counter.value == 60 and gauge.value == 120
+    snapshot = histogram.snapshot()
+    assert snapshot.count == 60 and snapshot.total == 30
+    assert len(snapshot.buckets) == 1
+    assert len(counter._shards) == len(gauge._shards) == len(histogram._shards) == 1
+
+
+def test_gauge() -> None:
+    """Test gauge set, inc and dec."""
+    gauge = MetricsRegistry().gauge("in_flight")
+
+    gauge.inc()
+    gauge.inc(2)
+    gauge.dec()
+    assert gauge.value == 2
+    gauge.set(10)
+    gauge.dec(3)
+    assert gauge.value == 7
+
+
+def test_histogram_quantiles() -> None:
+    """Test histogram quantiles stay within the bucket precision."""
+    histogram = MetricsRegistry().histogram("latency_seconds", precision=5)
+    rng = random.Random(1)
+    values = [rng.expovariate(10) for _ in range(20_000)]
+    for value in values:
+        histogram.record(value)
+    values.sort()
+
+    for q, estimate in zip((0.5, 0.95, 0.99), histogram.quantiles(0.5, 0.95, 0.99), strict=True):
+        exact = values[int(q * len(values)) - 1]
+        assert abs(estimate - exact) / exact < 2**-5 * 2
+
+    snapshot = histogram.snapshot()
+    assert snapshot.count == 20_000
+    assert snapshot.total == pytest.approx(sum(values))
+
+
+def test_histogram_clamps_out_of_range() -> None:
+    """Test values outside the range land in the edge buckets."""
+    histogram = MetricsRegistry().histogram("size", lowest=1, highest=1024)
+
+    histogram.record(0)
+    histogram.record(1e-6)
+    histogram.record(1e9)
+
+    snapshot = histogram.snapshot()
+    assert snapshot.count == 3
+    assert snapshot.quantile(0) <= 1 + 2**-5
+    assert 1024 <= snapshot.quantile(1) <= 2048
+
+
+def test_registry_rejects_conflicts() -> None:
+    """Test a name keeps its type and labels."""
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs", labels=("queue",))
+
+    assert registry.counter("jobs", labels=("queue",)) is counter
+    with pytest.raises(MetricError):
+        registry.gauge("jobs", labels=("queue",))
+    with pytest.raises(MetricError):
+        registry.counter("jobs")
+    with pytest.raises(MetricValueError):
+        counter.labels(worker="1")
+
+
+@pytest.mark.asyncio
+async def test_collector_evicts_oldest() -> None:
+    """Test the collector buffer drops the least recently updated metrics."""
+    collector = MetricsCollector(MetricsConfig(name="metrics", buffer_size=2))
+
+    await collector.collect("a", 1)
+    await collector.collect("b", 2)
+    await collector.collect("a", 3)
+    await collector.collect("c", 4)
+
+    assert list(collector._families) == ["a", "c"]
+    assert collector._registry.collect()["a"][0]["value"] == 3
+    assert collector._registry.get("b") is None
+
+
+def test_collector_keeps_each_tag_combination() -> None:
+    """Test values of one metric with different tags do not overwrite each other."""
+    collector = MetricsCollector(MetricsConfig(name="metrics"))
+
+    collector.record("queue.depth", 3, {"queue": "jobs"})
+    collector.record("queue.depth", 5, {"queue": "mail"})
+
+    series = {
+        item["labels"]["queue"]: item["value"]
+        for item in collector._registry.collect()["queue.depth"]
+    }
+    assert series == {"jobs": 3, "mail": 5}
+    with pytest.raises(MetricValueError):
+        collector.record("queue.depth", 1, {"host": "a"})
+    with pytest.raises(MetricValueError):
+        collector.record("status", "ok")
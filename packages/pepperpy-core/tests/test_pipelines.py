@@ -0,0 +1,441 @@
+"""Test pipelines."""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pepperpy_core.cache.disk import DiskCache, DiskCacheConfig
+from pepperpy_core.cache.memory import MemoryCache
+from pepperpy_core.pipelines import Pipeline, PipelineManager, PipelineStep
+from pepperpy_core.pipelines.base import PipelineConfig
+from pepperpy_core.pipelines.manager import PipelineConfig as PipelineManagerConfig
+
+
+class SleepStep(PipelineStep[int, int]):
+    """Step adding one after a delay."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.seen: list[int] = []
+
+    async def execute(self, input_data: int) -> int:
+        self.seen.append(input_data)
+        await asyncio.sleep(self.delay)
+        return input_data + 1
+
+
+class SplitStep(PipelineStep[str, str]):
+    """Step splitting text into words."""
+
+    async def stream(self, items: AsyncIterator[str]) -> AsyncIterator[str]:
+        async for text in items:
+            for word in text.split():
+                yield word
+
+
+class FailingStep(PipelineStep[int, int]):
+    """Step failing on a given input."""
+
+    async def execute(self, input_data: int) -> int:
+        if input_data == 3:
+            raise RuntimeError("broken")
+        return input_data
+
+
+class JitterStep(PipelineStep[int, int]):
+    """Step with several workers finishing out of order."""
+
+    concurrency = 4
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+
+    async def execute(self, input_data: int) -> int:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.001 * (input_data % 5))
+        self.running -= 1
+        return input_data
+
+
+class ThreadStep(PipelineStep[int, str]):
+    """Blocking step run in threads."""
+
+    concurrency = 2
+    executor = "thread"
+
+    def process(self, input_data: int) -> str:
+        time.sleep(0.001)
+        return f"{input_data}:{threading.current_thread() is threading.main_thread()}"
+
+
+class VersionedStep(SleepStep):
+    """Cacheable step."""
+
+    version = "1"
+
+
+class AddStep(PipelineStep[int, int]):
+    """Cacheable step configured per instance."""
+
+    version = "1"
+
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+
+    async def execute(self, input_data: int) -> int:
+        return input_data + self.amount
+
+
+class CrashingStep(SleepStep):
+    """Step crashing once on a given input."""
+
+    def __init__(self, crash_on: int | None) -> None:
+        super().__init__()
+        self.crash_on = crash_on
+
+    async def execute(self, input_data: int) -> int:
+        if input_data == self.crash_on:
+            raise RuntimeError("crash")
+        return await super().execute(input_data)
+
+
+def make_pipeline(
+    *steps: PipelineStep[Any, Any],
+    queue_size: int = 16,
+    cache: Any = None,
+    checkpoints: Any = None,
+    **options: Any,
+) -> Pipeline[Any, Any]:
+    """Create a pipeline from steps."""
+    config = PipelineConfig(name="test", queue_size=queue_size, **options)
+    pipeline: Pipeline[Any, Any] = Pipeline(config, cache=cache, checkpoints=checkpoints)
+    for step in steps:
+        pipeline.add_step(step)
+    return pipeline
+
+
+@pytest.mark.asyncio
+async def test_stream_overlaps_steps() -> None:
+    """Test streaming steps run concurrently."""
+    pipeline = make_pipeline(SleepStep(0.01), SleepStep(0.01), SleepStep(0.01))
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    outputs = [item async for item in pipeline.stream(range(10))]
+
+    assert outputs == [i + 3 for i in range(10)]
+    # Lockstep would take 0.3s, overlapped stages about 0.12s
+    assert loop.time() - start < 0.25
+
+
+@pytest.mark.asyncio
+async def test_stream_custom_step() -> None:
+    """Test steps producing several items per input."""
+    pipeline = make_pipeline(SplitStep())
+
+    async def texts() -> AsyncIterator[str]:
+        yield "a b"
+        yield "c"
+
+    assert [word async for word in pipeline.stream(texts())] == ["a", "b", "c"]
+    assert [item async for item in make_pipeline().stream([1, 2])] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_stream_backpressure() -> None:
+    """Test a slow consumer pauses upstream steps."""
+    step = SleepStep()
+    stream = make_pipeline(step, queue_size=2).stream(range(100))
+    assert await anext(stream) == 1
+    await asyncio.sleep(0.01)
+    # One item consumed, two queued and one waiting for space
+    assert len(step.seen) <= 4
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stream_failure() -> None:
+    """Test a failing step stops the stream."""
+    upstream = SleepStep()
+    pipeline = make_pipeline(upstream, FailingStep(), SleepStep(0.01))
+
+    with pytest.raises(RuntimeError, match="broken"):
+        async for _ in pipeline.stream(range(1000)):
+            pass
+    assert len(upstream.seen) < 1000
+
+
+@pytest.mark.asyncio
+async def test_stage_workers() -> None:
+    """Test concurrent stage workers with and without ordering."""
+    step = JitterStep()
+    ordered = make_pipeline(step, ThreadStep())
+    outputs = [item async for item in ordered.stream(range(50))]
+    assert outputs == [f"{i}:False" for i in range(50)]
+    assert step.peak == 4
+
+    unordered = make_pipeline(JitterStep(), ordered=False)
+    outputs = [item async for item in unordered.stream(range(50))]
+    assert outputs != list(range(50)) and sorted(outputs) == list(range(50))
+    assert (await ordered.execute(7)).output == "7:False"
+
+
+@pytest.mark.asyncio
+async def test_manager_budget() -> None:
+    """Test the manager caps step executions across pipelines."""
+    manager = PipelineManager(PipelineManagerConfig(max_concurrent=3, timeout=0.5))
+    await manager.initialize()
+    steps = [JitterStep(), JitterStep()]
+    running = 0
+    peak = 0
+
+    class CountingStep(PipelineStep[int, int]):
+        concurrency = 4
+
+        async def execute(self, input_data: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.002)
+            running -= 1
+            return input_data
+
+    async def run(step: PipelineStep[Any, Any]) -> list[int]:
+        pipeline = make_pipeline(step, CountingStep())
+        pipeline.config.name = f"test-{id(step)}"
+        return [item async for item in manager.stream(pipeline, range(20))]
+
+    results = await asyncio.gather(*(run(step) for step in steps))
+    assert results == [list(range(20))] * 2
+    assert peak <= 3
+    assert (await manager.get_stats())["active_pipelines"] == 0
+
+    class SlowStep(PipelineStep[int, int]):
+        async def execute(self, input_data: int) -> int:
+            await asyncio.sleep(1)
+            return input_data
+
+    with pytest.raises(TimeoutError):
+        await manager.execute(make_pipeline(SlowStep()), 1)
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_manager_restores_pipeline_limits() -> None:
+    """Test a pipeline run on its own after the manager keeps its own limits."""
+    manager = PipelineManager(PipelineManagerConfig(max_concurrent=1, timeout=0.05))
+    await manager.initialize()
+    pipeline = make_pipeline(SleepStep(0.1))
+
+    with pytest.raises(TimeoutError):
+        await manager.execute(pipeline, 1)
+    assert pipeline.budget is None
+    assert pipeline.timeout is None
+    assert (await pipeline.execute(1)).output == 2
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_step_cache_memory() -> None:
+    """Test versioned step outputs are reused by input."""
+    cache = MemoryCache()
+    cached, uncached = VersionedStep(), SleepStep()
+    pipeline = make_pipeline(cached, uncached, cache=cache)
+
+    assert [item async for item in pipeline.stream(range(5))] == [2, 3, 4, 5, 6]
+    assert [item async for item in pipeline.stream(range(3, 8))] == [5, 6, 7, 8, 9]
+    assert cached.seen == [0, 1, 2, 3, 4, 5, 6, 7]
+    assert len(uncached.seen) == 10
+
+    VersionedStep.version = "2"
+    try:
+        result = await pipeline.execute(0)
+    finally:
+        VersionedStep.version = "1"
+    assert result.output == 2 and cached.seen[-1] == 0
+    assert result.metadata["cache"] == {"hits": 2, "misses": 9}
+
+
+@pytest.mark.asyncio
+async def test_step_cache_keys_instances_by_settings() -> None:
+    """Test instances of one step class with different settings do not share outputs."""
+    cache = MemoryCache()
+    pipeline = make_pipeline(AddStep(1), AddStep(10), cache=cache)
+
+    assert (await pipeline.execute(1)).output == 12
+    assert (await pipeline.execute(1)).output == 12
+    assert pipeline.cache is not None
+    assert pipeline.cache.get_stats() == {"hits": 2, "misses": 2}
+
+    other = make_pipeline(AddStep(100), cache=cache)
+    assert (await other.execute(1)).output == 101
+
+
+@pytest.mark.asyncio
+async def test_step_cache_disk(tmp_path: Path) -> None:
+    """Test step outputs persist in a disk cache across runs."""
+    config = DiskCacheConfig(path=str(tmp_path))
+    for run in range(2):
+        cache = DiskCache(config)
+        await cache.initialize()
+        step = VersionedStep()
+        pipeline = make_pipeline(step, cache=cache)
+        assert [item async for item in pipeline.stream(range(4))] == [1, 2, 3, 4]
+        assert step.seen == ([] if run else [0, 1, 2, 3])
+        await cache.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_resume(tmp_path: Path) -> None:
+    """Test an interrupted run resumes where it stopped."""
+    cache = DiskCache(DiskCacheConfig(path=str(tmp_path)))
+    await cache.initialize()
+    first = CrashingStep(crash_on=7)
+    pipeline = make_pipeline(first, checkpoints=cache, checkpoint_every=3)
+    outputs = []
+    with pytest.raises(RuntimeError, match="crash"):
+        async for item in pipeline.stream(range(10)):
+            outputs.append(item)
+    assert outputs == [1, 2, 3, 4, 5, 6, 7]
+
+    second = CrashingStep(crash_on=None)
+    pipeline = make_pipeline(second, checkpoints=cache, checkpoint_every=3)
+    assert [item async for item in pipeline.stream(range(10))] == [8, 9, 10]
+    assert second.seen == [7, 8, 9]
+    assert pipeline.checkpointer is not None and pipeline.checkpointer.resumed
+
+    # A finished run leaves nothing to resume
+    assert len([item async for item in pipeline.stream(range(10))]) == 10
+    await cache.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_start_at() -> None:
+    """Test a run restarts from a step with its recorded inputs."""
+    store = MemoryCache()
+    parse, embed = SleepStep(), SleepStep()
+    parse.name = "parse"
+    embed.name, embed.checkpoint = "embed", True
+    pipeline = make_pipeline(parse, embed, checkpoints=store, checkpoint_every=4)
+
+    stream = pipeline.stream(range(10))
+    assert [await anext(stream) for _ in range(5)] == [2, 3, 4, 5, 6]
+    await stream.aclose()
+    # The last output handed out was not acknowledged by a next request
+    assert [item async for item in pipeline.stream(range(10))] == [6, 7, 8, 9, 10, 11]
+
+    parsed = len(parse.seen)
+    embed.seen.clear()
+    outputs = [item async for item in pipeline.stream((), start_at="embed")]
+    assert outputs == [i + 2 for i in range(10)]
+    assert embed.seen == list(range(1, 11))
+    assert len(parse.seen) == parsed
+    with pytest.raises(ValueError):
+        await anext(pipeline.stream((), start_at="missing"))
+
+
+class SpinStep(PipelineStep[int, int]):
+    """CPU-bound step run in threads."""
+
+    name = "spin"
+    executor = "thread"
+
+    def process(self, input_data: int) -> int:
+        deadline = time.thread_time() + 0.002
+        while time.thread_time() < deadline:
+            pass
+        return input_data
+
+
+@pytest.mark.asyncio
+async def test_profile() -> None:
+    """Test step measurements and bottleneck report."""
+    fast, slow = SleepStep(), SleepStep(0.005)
+    fast.name, slow.name = "fast", "slow"
+    pipeline = make_pipeline(fast, slow, SpinStep())
+
+    assert [item async for item in pipeline.stream(range(20))] == list(range(2, 22))
+    profile = pipeline.last_profile
+    assert profile is not None and profile.bottleneck is slow_profile(profile)
+    spin = profile.steps[2]
+    assert spin.items == 20 and spin.cpu_time >= 0.04
+    assert profile.steps[0].wait_out > 0 and profile.steps[2].wait_in > 0
+    report = pipeline.profile().splitlines()
+    assert len(report) == 4 and report[2].startswith("slow")
+    assert report[2].endswith("<- bottleneck")
+
+    result = await pipeline.execute(0)
+    assert result.metadata["profile"]["bottleneck"] == 1
+    steps = result.metadata["profile"]["steps"]
+    assert [step["name"] for step in steps] == ["fast", "slow", "spin"]
+    assert steps[0]["items"] == 1
+
+
+@pytest.mark.asyncio
+async def test_profile_keeps_steps_sharing_a_name() -> None:
+    """Test steps with the same name each keep their measurements."""
+    first, second = SleepStep(), SleepStep(0.005)
+    pipeline = make_pipeline(first, second)
+
+    result = await pipeline.execute(0)
+
+    profile = result.metadata["profile"]
+    assert [step["name"] for step in profile["steps"]] == ["SleepStep", "SleepStep"]
+    assert [step["items"] for step in profile["steps"]] == [1, 1]
+    assert profile["bottleneck"] == 1
+
+
+def slow_profile(profile: Any) -> Any:
+    """Get the profile of the slow step."""
+    return next(step for step in profile.steps if step.name == "slow")
+
+
+class PairStep(PipelineStep[int, int]):
+    """Streaming step summing items by pairs after a delay."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+
+    async def stream(self, items: AsyncIterator[int]) -> AsyncIterator[int]:
+        pair: list[int] = []
+        async for item in items:
+            pair.append(item)
+            if len(pair) == 2:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+                await asyncio.sleep(self.delay)
+                self.running -= 1
+                yield sum(pair)
+                pair = []
+        if pair:
+            yield sum(pair)
+
+
+@pytest.mark.asyncio
+async def test_manager_budget_covers_streaming_steps() -> None:
+    """Test steps overriding stream hold budget slots and time out."""
+    manager = PipelineManager(PipelineManagerConfig(max_concurrent=2, timeout=0.05))
+    await manager.initialize()
+    step = PairStep(0.01)
+    step.concurrency = 4
+    outputs = [item async for item in manager.stream(make_pipeline(step), range(16))]
+    assert sum(outputs) == sum(range(16))
+    assert step.peak == 2
+
+    # Input slower than the timeout is waited for without timing out
+    pipeline = make_pipeline(SleepStep(0.03), PairStep())
+    assert [item async for item in manager.stream(pipeline, range(4))] == [3, 7]
+
+    pipeline = make_pipeline(PairStep(0.2))
+    pipeline.config.name = "slow"
+    with pytest.raises(TimeoutError):
+        async for _ in manager.stream(pipeline, range(4)):
+            pass
+    await manager.cleanup()
@@ -1,9 +1,34 @@
 """Test tasks functionality."""
 
+import asyncio
+import threading
+import time
+from collections.abc import AsyncGenerator
 from typing import Any
 
 import pytest
-from pepperpy_core.tasks import Task
+import pytest_asyncio
+from pepperpy_core.tasks import (
+    Task,
+    TaskGroupConfig,
+    TaskManager,
+    TaskManagerConfig,
+    TaskQueue,
+    TaskStatus,
+)
+from pepperpy_core.tasks.exceptions import (
+    TaskCancelledError,
+    TaskError,
+    TaskExecutionError,
+    TaskNotFoundError,
+    TaskTimeoutError,
+)
+from pepperpy_core.tasks.process import SharedResult, export_result, import_result
+
+
+def make_payload(size: int) -> bytes:
+    """Build a payload in a worker process."""
+    return bytes(range(256)) * (size // 256)
 
 
 class MockTask(Task):
@@ -30,3 +55,382 @@ async def test_task_run(mock_task: MockTask) -> None:
     assert not mock_task.was_run
     await mock_task.run()
     assert mock_task.was_run
+
+
+@pytest_asyncio.fixture
+async def manager() -> AsyncGenerator[TaskManager, None]:
+    """Create task manager fixture."""
+    manager = TaskManager(TaskManagerConfig(name="test", workers=4, max_queue_size=2))
+    await manager.initialize()
+    yield manager
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_manager_runs_tasks_concurrently(manager: TaskManager) -> None:
+    """Test workers run async and sync tasks in parallel."""
+    main_thread = threading.get_ident()
+
+    async def sleeper() -> str:
+        await asyncio.sleep(0.1)
+        return "async"
+
+    def blocking() -> int:
+        time.sleep(0.1)
+        return threading.get_ident()
+
+    start = time.monotonic()
+    tasks = [await manager.submit(f"async-{i}", sleeper) for i in range(2)]
+    tasks += [await manager.submit(f"sync-{i}", blocking) for i in range(2)]
+    results = [await task.wait() for task in tasks]
+
+    assert time.monotonic() - start < 0.3
+    assert results[:2] == ["async", "async"]
+    assert main_thread not in results[2:]
+    assert (await manager.get_stats())["completed"] == 4
+
+
+@pytest.mark.asyncio
+async def test_manager_backpressure(manager: TaskManager) -> None:
+    """Test submit waits while the queue is full."""
+    release = asyncio.Event()
+
+    async def blocked() -> None:
+        await release.wait()
+
+    for i in range(6):
+        await manager.submit(f"task-{i}", blocked)
+    submit = asyncio.create_task(manager.submit("overflow", blocked))
+    await asyncio.sleep(0.05)
+    assert not submit.done()
+
+    release.set()
+    await submit
+    await manager.join()
+    assert (await manager.get_stats())["completed"] == 7
+
+
+@pytest.mark.asyncio
+async def test_manager_cancel_and_timeout(manager: TaskManager) -> None:
+    """Test cancellation interrupts running work and timeouts fail tasks."""
+    task = await manager.submit("forever", asyncio.sleep, delay=60)
+    await asyncio.sleep(0.01)
+    assert task.status is TaskStatus.RUNNING
+    await manager.cancel_task("forever")
+    with pytest.raises(TaskCancelledError):
+        await task.wait()
+
+    slow = await manager.submit("slow", asyncio.sleep, timeout=0.01, delay=60)
+    with pytest.raises(TaskTimeoutError):
+        await slow.wait()
+    assert slow.status is TaskStatus.FAILED
+    assert await manager.run("fast", lambda: 42) == 42
+
+
+@pytest.mark.asyncio
+async def test_manager_drops_old_finished_tasks() -> None:
+    """Test finished tasks beyond the history are forgotten, pending ones kept."""
+    manager = TaskManager(TaskManagerConfig(name="test", max_history=3))
+    await manager.initialize()
+    try:
+        release = asyncio.Event()
+        pending = await manager.submit("pending", release.wait)
+        for i in range(20):
+            await manager.run(f"done-{i}", lambda: None)
+
+        stats = await manager.get_stats()
+        assert stats["total_tasks"] <= 2 * 3 + 1
+        assert "pending" in stats["task_names"]
+        assert manager.get_task("done-19").is_done
+        with pytest.raises(TaskNotFoundError):
+            manager.get_task("done-0")
+
+        release.set()
+        await pending.wait()
+        with pytest.raises(ValueError):
+            TaskManagerConfig(name="test", max_history=-1).validate()
+    finally:
+        await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_queue_priority_and_deadline_order() -> None:
+    """Test higher priority first, then earliest deadline."""
+    queue = TaskQueue(aging_interval=None)
+    await queue.push(Task("batch", print))
+    await queue.push(Task("chat-late", print, priority=10, deadline=30))
+    await queue.push(Task("chat-soon", print, priority=10, deadline=1))
+    await queue.push(Task("chat", print, priority=10))
+
+    names = [(await queue.pop()).name for _ in range(4)]
+    assert names == ["chat-soon", "chat-late", "chat", "batch"]
+    assert queue.pop_nowait() is None
+
+
+@pytest.mark.asyncio
+async def test_queue_aging_prevents_starvation() -> None:
+    """Test waiting tasks gain priority over time."""
+    queue = TaskQueue(aging_interval=0.05)
+    await queue.push("old-batch", priority=0)
+    await asyncio.sleep(0.12)
+    await queue.push("new-chat", priority=1)
+    await queue.push("urgent", priority=5)
+
+    assert await queue.pop() == "urgent"
+    assert await queue.pop() == "old-batch"
+
+
+@pytest.mark.asyncio
+async def test_queue_aging_keeps_deadline_order() -> None:
+    """Test aging is continuous and never reorders tasks of one priority."""
+    queue = TaskQueue(aging_interval=0.1)
+    await queue.push("late", deadline=30)
+    await asyncio.sleep(0.15)
+    await queue.push("soon", deadline=1)
+    await queue.push("chat", priority=1)
+
+    # Priority 0 has aged by one and a half levels, deadlines still apply
+    assert [await queue.pop() for _ in range(3)] == ["soon", "late", "chat"]
+
+    await queue.push("batch")
+    await queue.push("urgent", priority=1)
+    assert [await queue.pop() for _ in range(2)] == ["urgent", "batch"]
+
+
+@pytest.mark.asyncio
+async def test_queue_pop_waits_for_work() -> None:
+    """Test pop blocks until a task is pushed."""
+    queue = TaskQueue()
+    pop = asyncio.create_task(queue.pop())
+    await asyncio.sleep(0.01)
+    assert not pop.done()
+    await queue.push("work")
+    assert await pop == "work"
+
+
+def test_shared_memory_round_trip() -> None:
+    """Test large results travel through shared memory."""
+    payload = make_payload(4096)
+    handle = export_result(payload, threshold=1024)
+    assert isinstance(handle, SharedResult)
+    assert import_result(handle) == payload
+    assert export_result(b"small", threshold=1024) == b"small"
+
+
+def test_shared_memory_numpy_round_trip() -> None:
+    """Test arrays travel through shared memory."""
+    np = pytest.importorskip("numpy")
+    array = np.arange(4096, dtype=np.float32).reshape(64, 64)
+    handle = export_result(array, threshold=1024)
+    assert isinstance(handle, SharedResult)
+    assert np.array_equal(import_result(handle), array)
+
+
+@pytest.mark.asyncio
+async def test_manager_process_mode() -> None:
+    """Test process mode tasks run in worker processes."""
+    config = TaskManagerConfig(name="cpu", max_processes=2, shared_memory_threshold=1024)
+    manager = TaskManager(config)
+    await manager.initialize()
+    try:
+        large = await manager.submit("large", make_payload, mode="process", size=8192)
+        small = await manager.submit("small", make_payload, mode="process", size=256)
+        assert await large.wait() == make_payload(8192)
+        assert await small.wait() == make_payload(256)
+        with pytest.raises(ValueError):
+            Task("async", asyncio.sleep, mode="process")
+    finally:
+        await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_group_caps_concurrency(manager: TaskManager) -> None:
+    """Test a group never runs more than max_concurrency tasks."""
+    await manager.add_group(TaskGroupConfig(name="llm", max_concurrency=2))
+    running = 0
+    peak = 0
+
+    async def call() -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+
+    for i in range(6):
+        await manager.submit(f"call-{i}", call, group="llm")
+    await manager.join()
+
+    assert peak == 2
+    stats = await manager.get_stats()
+    assert stats["groups"]["llm"]["dispatched"] == 6
+    assert stats["groups"]["llm"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_group_backpressure(manager: TaskManager) -> None:
+    """Test submit waits while a group holds max_queue_size pending tasks."""
+    await manager.add_group(TaskGroupConfig(name="slow", max_concurrency=1))
+    release = asyncio.Event()
+
+    async def blocked() -> None:
+        await release.wait()
+
+    # One task runs, one waits for the slot in the dispatcher, two are queued
+    for i in range(4):
+        await manager.submit(f"task-{i}", blocked, group="slow")
+    submit = asyncio.create_task(manager.submit("overflow", blocked, group="slow"))
+    await asyncio.sleep(0.05)
+    assert not submit.done()
+    assert (await manager.get_stats())["groups"]["slow"]["pending"] == 2
+
+    release.set()
+    await submit
+    await manager.join()
+    assert (await manager.get_stats())["completed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_group_paces_requests_and_tokens(manager: TaskManager) -> None:
+    """Test request rate and token budget pace task starts."""
+    await manager.add_group(TaskGroupConfig(name="rps", requests_per_second=50, burst=1))
+    group = await manager.add_group(TaskGroupConfig(name="tpm", tokens_per_minute=6000))
+    starts: list[float] = []
+
+    async def call() -> None:
+        starts.append(time.monotonic())
+
+    for i in range(5):
+        await manager.submit(f"rps-{i}", call, group="rps")
+    await manager.join()
+    assert starts[-1] - starts[0] >= 0.07
+
+    group.charge(5990)
+    start = time.monotonic()
+    await manager.submit("tpm", call, group="tpm", cost=20)
+    await manager.join()
+    assert time.monotonic() - start >= 0.09
+
+
+def _diamond(calls: list[str], text: str = "a b c") -> list[Task]:
+    """Build the parse, chunk, embed and summarize, store graph."""
+
+    async def parse(text: str) -> list[str]:
+        calls.append("parse")
+        await asyncio.sleep(0.05)
+        return text.split()
+
+    async def embed(parse: list[str]) -> list[int]:
+        calls.append("embed")
+        await asyncio.sleep(0.05)
+        return [len(word) for word in parse]
+
+    async def summarize(parse: list[str]) -> str:
+        calls.append("summarize")
+        await asyncio.sleep(0.05)
+        return parse[0]
+
+    async def store(embed: list[int], summarize: str) -> tuple[list[int], str]:
+        calls.append("store")
+        return embed, summarize
+
+    return [
+        Task("parse", parse, text=text),
+        Task("embed", embed, depends_on=["parse"]),
+        Task("summarize", summarize, depends_on=["parse"]),
+        Task("store", store, depends_on=["embed", "summarize"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_graph_runs_branches_in_parallel(manager: TaskManager) -> None:
+    """Test a diamond graph passes results and fans out."""
+    calls: list[str] = []
+    start = time.monotonic()
+    results = await manager.run_graph(_diamond(calls))
+
+    assert time.monotonic() - start < 0.14
+    assert results["store"] == ([1, 1, 1], "a")
+    assert calls[0] == "parse" and calls[-1] == "store"
+
+
+GRAPH_CALLS: list[str] = []
+
+
+async def _split(text: str) -> list[str]:
+    GRAPH_CALLS.append("split")
+    return text.split()
+
+
+async def _count(split: list[str]) -> int:
+    GRAPH_CALLS.append("count")
+    return len(split)
+
+
+def _adder(amount: int) -> Any:
+    """Build a closure capturing an amount."""
+
+    async def add() -> int:
+        return amount
+
+    return add
+
+
+class _Scale:
+    """Task target bound to an instance."""
+
+    def __init__(self, factor: int) -> None:
+        self.factor = factor
+
+    async def apply(self, value: int) -> int:
+        return value * self.factor
+
+
+@pytest.mark.asyncio
+async def test_graph_memoizes_unchanged_nodes(manager: TaskManager) -> None:
+    """Test unchanged nodes are reused and changed inputs rerun."""
+
+    def graph(text: str) -> list[Task]:
+        return [Task("split", _split, text=text), Task("count", _count, depends_on=["split"])]
+
+    GRAPH_CALLS.clear()
+    await manager.run_graph(graph("a b c"), memoize=True)
+    GRAPH_CALLS.clear()
+    assert (await manager.run_graph(graph("a b c"), memoize=True))["count"] == 3
+    assert GRAPH_CALLS == []
+
+    assert (await manager.run_graph(graph("x y"), memoize=True))["count"] == 2
+    assert GRAPH_CALLS == ["split", "count"]
+
+
+@pytest.mark.asyncio
+async def test_graph_memo_tells_closures_and_instances_apart(manager: TaskManager) -> None:
+    """Test closures of one factory and methods of different instances are not reused."""
+    assert (await manager.run_graph([Task("add", _adder(1))], memoize=True))["add"] == 1
+    assert (await manager.run_graph([Task("add", _adder(10))], memoize=True))["add"] == 10
+
+    for factor in (2, 5):
+        tasks = [Task("scale", _Scale(factor).apply, value=3)]
+        assert (await manager.run_graph(tasks, memoize=True))["scale"] == 3 * factor
+
+
+@pytest.mark.asyncio
+async def test_graph_failure_short_circuits(manager: TaskManager) -> None:
+    """Test failures cancel downstream tasks only."""
+
+    async def fail() -> None:
+        raise ValueError("broken")
+
+    tasks = [
+        Task("bad", fail),
+        Task("after", asyncio.sleep, depends_on=["bad"], delay=0),
+        Task("other", asyncio.sleep, delay=0),
+    ]
+    with pytest.raises(TaskExecutionError):
+        await manager.run_graph(tasks)
+    assert tasks[1].status is TaskStatus.CANCELLED
+    assert tasks[2].status is TaskStatus.COMPLETED
+
+    cyclic = [Task("a", print, depends_on=["b"]), Task("b", print, depends_on=["a"])]
+    with pytest.raises(TaskError):
+        await manager.run_graph(cyclic)
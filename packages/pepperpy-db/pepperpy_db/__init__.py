@@ -3,12 +3,16 @@
 from .base import BaseEngine, BaseEngineConfig, DatabaseError
 from .engine import DatabaseEngine, QueryResult
 from .engines import SQLEngine, SQLEngineConfig
+from .queue import DurableQueue, DurableQueueConfig, Job
 
 __all__ = [
     "BaseEngine",
     "BaseEngineConfig",
     "DatabaseEngine",
     "DatabaseError",
+    "DurableQueue",
+    "DurableQueueConfig",
+    "Job",
     "QueryResult",
     "SQLEngine",
     "SQLEngineConfig",
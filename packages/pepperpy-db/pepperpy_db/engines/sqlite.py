@@ -1,7 +1,9 @@
 """SQLite database engine"""
 
 import sqlite3
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any, Protocol, cast
 
 from ..base import BaseEngine
@@ -24,6 +26,9 @@ class SQLiteCursor(Protocol):
     def execute(self, sql: str, parameters: dict[str, Any] | None = None) -> Any:
         ...
 
+    def executemany(self, sql: str, parameters: Sequence[dict[str, Any]]) -> Any:
+        ...
+
     def fetchall(self) -> list[tuple[Any, ...]]:
         ...
 
@@ -40,26 +45,61 @@ class SQLiteConnection(Protocol):
     def commit(self) -> None:
         ...
 
+    def rollback(self) -> None:
+        ...
+
     def close(self) -> None:
         ...
 
 
-class SQLiteEngine(BaseEngine):
+JOURNAL_MODES = frozenset({"delete", "truncate", "persist", "memory", "wal", "off"})
+SYNCHRONOUS_MODES = frozenset({"off", "normal", "full", "extra", "0", "1", "2", "3"})
+
+
+@dataclass
+class SQLiteConfig(DatabaseConfig):
+    """SQLite database configuration"""
+
+    # Seconds to wait on a locked database
+    timeout: float = 5.0
+    # WAL lets readers run alongside a writer
+    journal_mode: str = "wal"
+    # NORMAL is durable across application crashes in WAL mode
+    synchronous: str = "normal"
+
+    def validate(self) -> None:
+        """Validate configuration."""
+        if not self.database:
+            raise ValueError("database is required")
+        if self.timeout < 0:
+            raise ValueError("timeout must be non-negative")
+        # Both are interpolated into PRAGMA statements
+        if self.journal_mode.lower() not in JOURNAL_MODES:
+            raise ValueError(f"journal_mode must be one of {sorted(JOURNAL_MODES)}")
+        if str(self.synchronous).lower() not in SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous must be one of {sorted(SYNCHRONOUS_MODES)}")
+
+
+class SQLiteEngine(BaseEngine[SQLiteConfig]):
     """SQLite database engine implementation"""
 
-    def __init__(self, config: DatabaseConfig) -> None:
+    def __init__(self, config: SQLiteConfig) -> None:
         super().__init__(config)
         self._conn: SQLiteConnection | None = None
         self._cursor: SQLiteCursor | None = None
+        self._in_transaction = False
 
     async def _setup(self) -> None:
         """Setup database connection"""
         try:
+            self.config.validate()
             conn = sqlite3.connect(
                 database=self.config.database, timeout=self.config.timeout
             )
             self._conn = cast(SQLiteConnection, conn)
             self._cursor = cast(SQLiteCursor, self._conn.cursor())
+            self._cursor.execute(f"PRAGMA journal_mode={self.config.journal_mode}")
+            self._cursor.execute(f"PRAGMA synchronous={self.config.synchronous}")
         except Exception as e:
             raise DatabaseError(f"Failed to connect to SQLite: {e}", cause=e)
 
@@ -69,6 +109,49 @@ class SQLiteEngine(BaseEngine):
             self._cursor.close()
         if self._conn:
             self._conn.close()
+        self._cursor = None
+        self._conn = None
+        self._in_transaction = False
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get engine statistics"""
+        return {
+            "name": self.config.name,
+            "database": self.config.database,
+            "connected": self._conn is not None,
+            "journal_mode": self.config.journal_mode,
+            "in_transaction": self._in_transaction,
+        }
+
+    def _commit(self) -> None:
+        """Commit unless inside an explicit transaction"""
+        if self._conn and not self._in_transaction:
+            self._conn.commit()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Run the enclosed queries in a single transaction
+
+        Queries executed inside the block are committed together on exit
+        and rolled back if the block raises.
+        """
+        self._ensure_initialized()
+        if not self._conn:
+            raise DatabaseError("Database not initialized")
+        if self._in_transaction:
+            raise DatabaseError("Transaction already in progress")
+        self._in_transaction = True
+        try:
+            yield
+        except BaseException:
+            self._in_transaction = False
+            self._conn.rollback()
+            raise
+        self._in_transaction = False
+        try:
+            self._conn.commit()
+        except Exception as e:
+            raise DatabaseError(f"SQLite commit failed: {e}", cause=e)
 
     async def execute(
         self, query: str, params: dict[str, Any] | None = None
@@ -87,7 +170,7 @@ class SQLiteEngine(BaseEngine):
                 for row in self._cursor.fetchall()
             ]
 
-            self._conn.commit()
+            self._commit()
 
             return QueryResult(
                 rows=rows,
@@ -128,7 +211,28 @@ class SQLiteEngine(BaseEngine):
                     )
                 )
 
-            self._conn.commit()
+            self._commit()
             return results
         except Exception as e:
             raise DatabaseError(f"SQLite batch query failed: {e}", cause=e)
+
+    async def execute_batch(
+        self, query: str, params_list: Sequence[dict[str, Any]]
+    ) -> int:
+        """Execute a statement for every parameter set in one round trip
+
+        Faster than execute_many for writes, as no rows are fetched.
+
+        Returns:
+            Number of affected rows
+        """
+        self._ensure_initialized()
+        try:
+            if not self._cursor or not self._conn:
+                raise DatabaseError("Database not initialized")
+
+            self._cursor.executemany(query, params_list)
+            self._commit()
+            return self._cursor.rowcount
+        except Exception as e:
+            raise DatabaseError(f"SQLite batch execution failed: {e}", cause=e)
@@ -0,0 +1,405 @@
+"""Durable task queue on SQLite."""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from pepperpy_core.base import BaseConfigData
+from pepperpy_core.cache.serializers import Serializer, get_serializer
+from pepperpy_core.module import BaseModule
+
+from .engines.sqlite import SQLiteConfig, SQLiteEngine
+from .exceptions import DatabaseError
+
+
+@dataclass
+class DurableQueueConfig(BaseConfigData):
+    """Durable queue configuration."""
+
+    name: str = "durable-queue"
+    # SQLite database file
+    database: str = "queue.db"
+    # Logical queue stored in the table
+    queue: str = "default"
+    table: str = "jobs"
+    # Seconds a dequeued job stays invisible before it is redelivered
+    visibility_timeout: float = 30.0
+    # Deliveries before a job is moved to the dead-letter table
+    max_attempts: int = 5
+    # Jobs claimed per dequeue
+    batch_size: int = 100
+    # Seconds between polls while pop() waits for work
+    poll_interval: float = 0.05
+    serializer: str = "json"
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def validate(self) -> None:
+        """Validate configuration."""
+        if not self.database:
+            raise ValueError("database is required")
+        if not self.table.isidentifier():
+            raise ValueError("table must be a valid identifier")
+        if self.visibility_timeout <= 0:
+            raise ValueError("visibility_timeout must be greater than 0")
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be greater than 0")
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+        if self.poll_interval <= 0:
+            raise ValueError("poll_interval must be greater than 0")
+
+
+@dataclass
+class Job:
+    """Job leased from a durable queue."""
+
+    id: int
+    payload: Any
+    priority: int
+    # Deliveries so far, including this one
+    attempts: int
+
+
+class DurableQueue(BaseModule[DurableQueueConfig]):
+    """Durable task queue with at-least-once delivery.
+
+    Jobs survive process crashes. A dequeued job is leased for
+    ``visibility_timeout`` seconds and delivered again unless it is acked
+    first. After ``max_attempts`` deliveries it is moved to a dead-letter
+    table instead. Enqueue, dequeue and ack work on batches, each batch in
+    a single transaction.
+    """
+
+    def __init__(
+        self, config: DurableQueueConfig | None = None, engine: SQLiteEngine | None = None
+    ) -> None:
+        """Initialize durable queue.
+
+        Args:
+            config: Queue configuration
+            engine: SQLite engine to use, one is created from the config if None
+        """
+        super().__init__(config or DurableQueueConfig())
+        self._engine = engine
+        self._owns_engine = engine is None
+        self._serializer: Serializer = get_serializer(self.config.serializer)
+        self._enqueued = 0
+        self._delivered = 0
+        self._acked = 0
+        self._dead = 0
+
+    async def _setup(self) -> None:
+        """Setup durable queue."""
+        self.config.validate()
+        if self._engine is None:
+            self._engine = SQLiteEngine(
+                SQLiteConfig(name=self.config.name, database=self.config.database)
+            )
+        await self._engine.initialize()
+        table = self.config.table
+        await self._engine.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "queue TEXT NOT NULL, "
+            "payload BLOB NOT NULL, "
+            "priority INTEGER NOT NULL DEFAULT 0, "
+            "attempts INTEGER NOT NULL DEFAULT 0, "
+            "visible_at REAL NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+        # Claims scan in delivery order and filter on visible_at from the
+        # index, so leased and delayed jobs are skipped without reading rows
+        await self._engine.execute(f"DROP INDEX IF EXISTS {table}_order")
+        await self._engine.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_claim "
+            f"ON {table} (queue, priority DESC, id, visible_at)"
+        )
+        await self._engine.execute(
+            f"CREATE TABLE IF NOT EXISTS {table}_dead ("
+            "id INTEGER PRIMARY KEY, "
+            "queue TEXT NOT NULL, "
+            "payload BLOB NOT NULL, "
+            "priority INTEGER NOT NULL, "
+            "attempts INTEGER NOT NULL, "
+            "error TEXT, "
+            "failed_at REAL NOT NULL)"
+        )
+
+    async def _teardown(self) -> None:
+        """Teardown durable queue."""
+        if self._engine is not None and self._owns_engine:
+            await self._engine.cleanup()
+            self._engine = None
+
+    @property
+    def engine(self) -> SQLiteEngine:
+        """Get the SQLite engine."""
+        if self._engine is None:
+            raise DatabaseError("Queue not initialized")
+        return self._engine
+
+    async def enqueue(self, payload: Any, priority: int = 0, delay: float = 0.0) -> None:
+        """Add a job.
+
+        Args:
+            payload: Serializable job payload
+            priority: Higher priority jobs are delivered first
+            delay: Seconds before the job becomes visible
+        """
+        await self.enqueue_many([payload], priority, delay)
+
+    async def enqueue_many(
+        self, payloads: Sequence[Any], priority: int = 0, delay: float = 0.0
+    ) -> int:
+        """Add jobs in a single transaction.
+
+        Args:
+            payloads: Serializable job payloads
+            priority: Higher priority jobs are delivered first
+            delay: Seconds before the jobs become visible
+
+        Returns:
+            Number of jobs added
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        now = time.time()
+        rows = [
+            {
+                "queue": self.config.queue,
+                "payload": self._serializer.dumps(payload),
+                "priority": priority,
+                "visible_at": now + delay,
+                "created_at": now,
+            }
+            for payload in payloads
+        ]
+        await self.engine.execute_batch(
+            f"INSERT INTO {self.config.table} "
+            "(queue, payload, priority, visible_at, created_at) "
+            "VALUES (:queue, :payload, :priority, :visible_at, :created_at)",
+            rows,
+        )
+        self._enqueued += len(rows)
+        return len(rows)
+
+    async def dequeue(self, limit: int | None = None) -> list[Job]:
+        """Lease up to ``limit`` visible jobs.
+
+        Jobs whose lease expired after ``max_attempts`` deliveries are
+        dead-lettered first, so up to ``limit`` live jobs are returned.
+
+        Args:
+            limit: Maximum jobs to lease, defaults to the configured batch size
+
+        Returns:
+            Leased jobs, highest priority first
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        table = self.config.table
+        now = time.time()
+        async with self.engine.transaction():
+            # Bury expired leases that used up their attempts first, so the
+            # claim below only counts jobs that can still be delivered
+            await self._bury_exhausted(now)
+            result = await self.engine.execute(
+                f"UPDATE {table} SET attempts = attempts + 1, visible_at = :lease "
+                f"WHERE id IN (SELECT id FROM {table} "
+                "WHERE queue = :queue AND visible_at <= :now "
+                "ORDER BY priority DESC, id LIMIT :limit) "
+                "RETURNING id, payload, priority, attempts",
+                {
+                    "queue": self.config.queue,
+                    "now": now,
+                    "lease": now + self.config.visibility_timeout,
+                    "limit": limit if limit is not None else self.config.batch_size,
+                },
+            )
+
+        rows = sorted(result.rows, key=lambda r: (-r["priority"], r["id"]))
+        jobs = [
+            Job(r["id"], self._serializer.loads(r["payload"]), r["priority"], r["attempts"])
+            for r in rows
+        ]
+        self._delivered += len(jobs)
+        return jobs
+
+    async def pop(self) -> Job:
+        """Lease a single job, waiting until one is visible.
+
+        Returns:
+            Leased job
+        """
+        while True:
+            jobs = await self.dequeue(1)
+            if jobs:
+                return jobs[0]
+            await asyncio.sleep(self.config.poll_interval)
+
+    async def ack(self, jobs: Job | Sequence[Job]) -> int:
+        """Remove processed jobs.
+
+        A job redelivered after its lease expired is only removed by the
+        ack of its latest delivery.
+
+        Args:
+            jobs: Processed jobs
+
+        Returns:
+            Number of jobs removed
+        """
+        jobs = [jobs] if isinstance(jobs, Job) else list(jobs)
+        count = await self.engine.execute_batch(
+            f"DELETE FROM {self.config.table} WHERE id = :id AND attempts = :attempts",
+            [{"id": job.id, "attempts": job.attempts} for job in jobs],
+        )
+        self._acked += count
+        return count
+
+    async def nack(
+        self, jobs: Job | Sequence[Job], delay: float = 0.0, error: str | None = None
+    ) -> None:
+        """Release failed jobs for redelivery.
+
+        Jobs that used up their attempts are dead-lettered right away.
+
+        Args:
+            jobs: Failed jobs
+            delay: Seconds before the jobs are delivered again
+            error: Failure description stored with dead-lettered jobs
+        """
+        jobs = [jobs] if isinstance(jobs, Job) else list(jobs)
+        now = time.time()
+        retry = [job for job in jobs if job.attempts < self.config.max_attempts]
+        exhausted = [job for job in jobs if job.attempts >= self.config.max_attempts]
+        async with self.engine.transaction():
+            if retry:
+                await self.engine.execute_batch(
+                    f"UPDATE {self.config.table} SET visible_at = :visible_at "
+                    "WHERE id = :id AND attempts = :attempts",
+                    [
+                        {"id": job.id, "attempts": job.attempts, "visible_at": now + delay}
+                        for job in retry
+                    ],
+                )
+            if exhausted:
+                rows = [{"id": job.id, "attempts": job.attempts} for job in exhausted]
+                await self._bury(rows, error or "max attempts exceeded", now)
+
+    async def extend(self, jobs: Job | Sequence[Job], timeout: float | None = None) -> None:
+        """Extend the lease of jobs still being processed.
+
+        Args:
+            jobs: Leased jobs
+            timeout: New lease in seconds from now, defaults to the
+                visibility timeout
+        """
+        jobs = [jobs] if isinstance(jobs, Job) else list(jobs)
+        lease = time.time() + (timeout or self.config.visibility_timeout)
+        await self.engine.execute_batch(
+            f"UPDATE {self.config.table} SET visible_at = :visible_at "
+            "WHERE id = :id AND attempts = :attempts",
+            [{"id": job.id, "attempts": job.attempts, "visible_at": lease} for job in jobs],
+        )
+
+    async def _bury(self, rows: Sequence[dict[str, Any]], error: str, now: float) -> None:
+        """Move jobs to the dead-letter table, inside a transaction."""
+        table = self.config.table
+        params = [
+            {"id": r["id"], "attempts": r["attempts"], "error": error, "now": now} for r in rows
+        ]
+        await self.engine.execute_batch(
+            f"INSERT OR REPLACE INTO {table}_dead "
+            "(id, queue, payload, priority, attempts, error, failed_at) "
+            f"SELECT id, queue, payload, priority, attempts, :error, :now FROM {table} "
+            "WHERE id = :id AND attempts = :attempts",
+            params,
+        )
+        self._dead += await self.engine.execute_batch(
+            f"DELETE FROM {table} WHERE id = :id AND attempts = :attempts", params
+        )
+
+    async def _bury_exhausted(self, now: float) -> None:
+        """Dead-letter visible jobs already delivered max_attempts times."""
+        table = self.config.table
+        params = {
+            "queue": self.config.queue,
+            "now": now,
+            "max_attempts": self.config.max_attempts,
+            "error": "visibility timeout exceeded",
+        }
+        where = "WHERE queue = :queue AND visible_at <= :now AND attempts >= :max_attempts"
+        await self.engine.execute(
+            f"INSERT OR REPLACE INTO {table}_dead "
+            "(id, queue, payload, priority, attempts, error, failed_at) "
+            f"SELECT id, queue, payload, priority, attempts, :error, :now FROM {table} {where}",
+            params,
+        )
+        result = await self.engine.execute(f"DELETE FROM {table} {where}", params)
+        self._dead += result.affected_rows
+
+    async def dead_letters(self, limit: int = 100) -> list[dict[str, Any]]:
+        """Get dead-lettered jobs.
+
+        Args:
+            limit: Maximum jobs to return
+
+        Returns:
+            Dead-lettered jobs with their last error
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        result = await self.engine.execute(
+            f"SELECT id, payload, priority, attempts, error, failed_at "
+            f"FROM {self.config.table}_dead WHERE queue = :queue ORDER BY failed_at LIMIT :limit",
+            {"queue": self.config.queue, "limit": limit},
+        )
+        return [{**row, "payload": self._serializer.loads(row["payload"])} for row in result.rows]
+
+    async def requeue_dead(self, ids: Sequence[int]) -> None:
+        """Move dead-lettered jobs back to the queue with fresh attempts.
+
+        Args:
+            ids: Dead-lettered job ids
+        """
+        table = self.config.table
+        params = [{"id": job_id, "now": time.time()} for job_id in ids]
+        async with self.engine.transaction():
+            await self.engine.execute_batch(
+                f"INSERT INTO {table} "
+                "(id, queue, payload, priority, attempts, visible_at, created_at) "
+                f"SELECT id, queue, payload, priority, 0, :now, :now FROM {table}_dead "
+                "WHERE id = :id",
+                params,
+            )
+            await self.engine.execute_batch(f"DELETE FROM {table}_dead WHERE id = :id", params)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get queue statistics.
+
+        Returns:
+            Queue statistics
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        table = self.config.table
+        result = await self.engine.execute(
+            "SELECT "
+            f"(SELECT COUNT(*) FROM {table} WHERE queue = :queue) AS size, "
+            f"(SELECT COUNT(*) FROM {table} WHERE queue = :queue "
+            "AND attempts > 0 AND visible_at > :now) AS leased, "
+            f"(SELECT COUNT(*) FROM {table}_dead WHERE queue = :queue) AS dead",
+            {"queue": self.config.queue, "now": time.time()},
+        )
+        return {
+            "name": self.config.name,
+            "queue": self.config.queue,
+            **result.rows[0],
+            "enqueued": self._enqueued,
+            "delivered": self._delivered,
+            "acked": self._acked,
+            "dead_lettered": self._dead,
+        }
@@ -0,0 +1,162 @@
+"""Test durable queue functionality."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from pepperpy_db.engines.sqlite import SQLiteConfig, SQLiteEngine
+from pepperpy_db.exceptions import DatabaseError
+from pepperpy_db.queue import DurableQueue, DurableQueueConfig
+
+
+def make_queue(path: Path, **options: object) -> DurableQueue:
+    """Create a queue on a database file."""
+    options.setdefault("visibility_timeout", 0.05)
+    return DurableQueue(DurableQueueConfig(database=str(path / "queue.db"), **options))
+
+
+@pytest_asyncio.fixture
+async def queue(tmp_path: Path) -> AsyncIterator[DurableQueue]:
+    """Create an initialized queue."""
+    queue = make_queue(tmp_path, max_attempts=3)
+    await queue.initialize()
+    try:
+        yield queue
+    finally:
+        await queue.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_lease_expiry_redelivers(queue: DurableQueue) -> None:
+    """Test an unacked job is delivered again once its lease expires."""
+    await queue.enqueue_many(["low", "other"])
+    await queue.enqueue("high", priority=5)
+
+    jobs = await queue.dequeue()
+    assert [job.payload for job in jobs] == ["high", "low", "other"]
+    assert await queue.dequeue() == []
+
+    await asyncio.sleep(0.06)
+    again = await queue.dequeue(1)
+    assert [(job.id, job.payload, job.attempts) for job in again] == [(jobs[0].id, "high", 2)]
+
+    # The first delivery's ack no longer matches the job
+    assert await queue.ack(jobs[0]) == 0
+    assert await queue.ack(again) == 1
+
+
+@pytest.mark.asyncio
+async def test_nack_and_extend(queue: DurableQueue) -> None:
+    """Test nack releases a job and extend keeps it leased."""
+    await queue.enqueue_many(["a", "b"])
+    first, second = await queue.dequeue()
+
+    await queue.nack(first)
+    (redelivered,) = await queue.dequeue()
+    assert redelivered.payload == "a" and redelivered.attempts == 2
+
+    # Stale deliveries no longer match
+    await queue.extend(first, 10)
+    await queue.nack(first)
+    await queue.extend([redelivered, second], 10)
+    await asyncio.sleep(0.06)
+    assert await queue.dequeue() == []
+
+    assert await queue.ack([redelivered, second]) == 2
+    stats = await queue.get_stats()
+    assert stats["size"] == 0 and stats["acked"] == 2
+
+
+@pytest.mark.asyncio
+async def test_dead_letters_and_requeue(queue: DurableQueue) -> None:
+    """Test jobs are dead-lettered after max_attempts and can be requeued."""
+    await queue.enqueue("failing")
+    for _ in range(3):
+        (job,) = await queue.dequeue()
+        await queue.nack(job, error="boom")
+
+    assert await queue.dequeue() == []
+    (dead,) = await queue.dead_letters()
+    assert dead["payload"] == "failing"
+    assert dead["attempts"] == 3 and dead["error"] == "boom"
+
+    await queue.requeue_dead([dead["id"]])
+    assert await queue.dead_letters() == []
+    (job,) = await queue.dequeue()
+    assert job.payload == "failing" and job.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_jobs_do_not_hide_live_ones(tmp_path: Path) -> None:
+    """Test dequeue skips past exhausted jobs to the live ones behind them."""
+    queue = make_queue(tmp_path, max_attempts=1)
+    await queue.initialize()
+    try:
+        await queue.enqueue("abandoned", priority=1)
+        await queue.enqueue("live")
+        (abandoned,) = await queue.dequeue(1)
+        assert abandoned.payload == "abandoned"
+
+        await asyncio.sleep(0.06)
+        (job,) = await queue.dequeue(1)
+        assert job.payload == "live"
+        (dead,) = await queue.dead_letters()
+        assert dead["payload"] == "abandoned"
+        assert dead["error"] == "visibility timeout exceeded"
+        assert (await queue.get_stats())["dead_lettered"] == 1
+    finally:
+        await queue.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_claim_reads_visibility_from_index(queue: DurableQueue) -> None:
+    """Test claims filter invisible jobs on the index and honour a zero limit."""
+    await queue.enqueue("later", priority=1, delay=60)
+    await queue.enqueue("now")
+    assert await queue.dequeue(0) == []
+
+    table = queue.config.table
+    plan = await queue.engine.execute(
+        f"EXPLAIN QUERY PLAN SELECT id FROM {table} "
+        "WHERE queue = :queue AND visible_at <= :now ORDER BY priority DESC, id LIMIT 1",
+        {"queue": queue.config.queue, "now": 0.0},
+    )
+    assert any(f"COVERING INDEX {table}_claim" in row["detail"] for row in plan.rows)
+    assert [job.payload for job in await queue.dequeue()] == ["now"]
+
+
+@pytest.mark.asyncio
+async def test_transaction_rollback(tmp_path: Path) -> None:
+    """Test a failing transaction leaves no writes behind."""
+    engine = SQLiteEngine(SQLiteConfig(name="test", database=str(tmp_path / "db.sqlite")))
+    await engine.initialize()
+    try:
+        await engine.execute("CREATE TABLE items (value INTEGER)")
+        with pytest.raises(RuntimeError):
+            async with engine.transaction():
+                await engine.execute_batch(
+                    "INSERT INTO items VALUES (:value)", [{"value": 1}, {"value": 2}]
+                )
+                raise RuntimeError("abort")
+
+        async with engine.transaction():
+            with pytest.raises(DatabaseError):
+                async with engine.transaction():
+                    pass
+            await engine.execute("INSERT INTO items VALUES (3)")
+
+        result = await engine.execute("SELECT value FROM items")
+        assert result.rows == [{"value": 3}]
+    finally:
+        await engine.cleanup()
+
+
+def test_sqlite_config_rejects_unknown_pragmas() -> None:
+    """Test journal and synchronous modes are checked before use in PRAGMAs."""
+    SQLiteConfig(database="db.sqlite", journal_mode="WAL", synchronous="FULL").validate()
+    with pytest.raises(ValueError, match="journal_mode"):
+        SQLiteConfig(database="db.sqlite", journal_mode="wal; DROP TABLE jobs").validate()
+    with pytest.raises(ValueError, match="synchronous"):
+        SQLiteConfig(database="db.sqlite", synchronous="fast").validate()